@@ -0,0 +1,99 @@
+"""
+Benchmark building the polygons of a ColorMesh.
+
+Times ColorMesh.calculate_polygons on a randomly perturbed grid of each size, and
+prints a digest of the polygons built, so that the output of two checkouts can be
+checked to be identical.
+
+Pass --repo to benchmark another checkout, for example to compare two commits:
+
+    git worktree add ../before <commit>
+    python benchmarks/colormesh_polygons.py --repo ../before
+    python benchmarks/colormesh_polygons.py
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+
+
+def _digest(polygons):
+    digest = hashlib.sha256()
+    for index, poly in polygons:
+        digest.update(str(index).encode())
+        for point in poly:
+            digest.update(f"{point.x()!r},{point.y()!r};".encode())
+    return digest.hexdigest()[:12]
+
+
+def bench(ColorMesh, size, runs):
+    """
+    Return the best time taken to build the polygons of a size x size mesh, in
+    seconds, and a digest of the polygons.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    from pyqtgraph import ViewBox
+
+    rng = np.random.default_rng(0)
+    x_axis, y_axis = np.meshgrid(
+        np.linspace(0, 1, size + 1), np.linspace(0, 1, size + 1), indexing="ij"
+    )
+    jitter = 0.2 / size
+    x_axis = x_axis + rng.uniform(-jitter, jitter, x_axis.shape)
+    y_axis = y_axis + rng.uniform(-jitter, jitter, y_axis.shape)
+    view = ViewBox()
+    mesh = ColorMesh()
+    view.addItem(mesh)
+    mesh.setNumpyData(rng.random((size, size)), x_axis, y_axis)
+
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        mesh.calculate_polygons()
+        best = min(best, time.perf_counter() - start)
+    return best, _digest(mesh.polygons)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark building the polygons of a ColorMesh."
+    )
+    parser.add_argument(
+        "--repo",
+        default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        help="Checkout of qcodes_measurements to benchmark (default: this one)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[50, 200, 500],
+        help="Numbers of cells along each side of the mesh",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Runs, of which the best is kept"
+    )
+    args = parser.parse_args()
+    repo = os.path.abspath(args.repo)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, repo)
+    # pylint: disable=import-outside-toplevel
+    from Qt import QtWidgets
+
+    app = QtWidgets.QApplication([])  # pylint: disable=unused-variable
+    from qcodes_measurements.plot.remote.ColorMesh import ColorMesh
+
+    assert sys.modules[ColorMesh.__module__].__file__.startswith(repo)
+
+    print(f"{repo}: best of {args.runs} runs")
+    for size in args.sizes:
+        best, digest = bench(ColorMesh, size, args.runs)
+        print(f"  {size:4d}x{size:<4d}  {best * 1e3:8.1f} ms   polygons {digest}")
+
+
+if __name__ == "__main__":
+    main()
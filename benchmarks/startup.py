@@ -0,0 +1,99 @@
+"""
+Benchmark plot process startup.
+
+Each run is a fresh python process, which times start_remote(), from spawning the plot
+process until rpyplot has been imported in it. Importing the colors module is also
+timed on its own, as in the plot process, along with whether it imports matplotlib.
+
+Pass --repo to benchmark another checkout, for example to compare two commits:
+
+    git worktree add ../before <commit>
+    python benchmarks/startup.py --repo ../before
+    python benchmarks/startup.py
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def _start(repo):
+    from Qt import QtWidgets  # pylint: disable=import-outside-toplevel
+
+    app = QtWidgets.QApplication([])  # pylint: disable=unused-variable
+    # pylint: disable-next=import-outside-toplevel
+    from qcodes_measurements.plot.local import RemoteProcessWrapper
+
+    assert RemoteProcessWrapper.__file__.startswith(repo)
+    # Only time the plot process that is used
+    if hasattr(RemoteProcessWrapper.this, "keep_standby"):
+        RemoteProcessWrapper.this.keep_standby = False
+    start = time.perf_counter()
+    RemoteProcessWrapper.start_remote()
+    elapsed = time.perf_counter() - start
+    RemoteProcessWrapper.this.proc.join()
+    return {"start_remote": elapsed}
+
+
+def _colors(repo):
+    os.environ["QCM_REMOTE"] = "benchmark"
+    import pyqtgraph  # pylint: disable=import-outside-toplevel,unused-import
+
+    start = time.perf_counter()
+    # pylint: disable-next=import-outside-toplevel
+    from qcodes_measurements.plot.remote import colors
+
+    elapsed = time.perf_counter() - start
+    assert colors.__file__.startswith(repo)
+    return {"colors": elapsed, "matplotlib": "matplotlib" in sys.modules}
+
+
+CHILDREN = {"start": _start, "colors": _colors}
+
+
+def _run(repo, child):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    out = subprocess.run(
+        [sys.executable, __file__, "--repo", repo, "--child", child],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark plot process startup.")
+    parser.add_argument(
+        "--repo",
+        default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        help="Checkout of qcodes_measurements to benchmark (default: this one)",
+    )
+    parser.add_argument("--runs", type=int, default=7, help="Number of runs")
+    parser.add_argument("--child", choices=CHILDREN, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    repo = os.path.abspath(args.repo)
+
+    if args.child is not None:
+        sys.path.insert(0, repo)
+        print(json.dumps(CHILDREN[args.child](repo)))
+        return
+
+    start = [_run(repo, "start")["start_remote"] for _ in range(args.runs)]
+    colors = [_run(repo, "colors") for _ in range(args.runs)]
+    print(f"{repo}: median of {args.runs} runs")
+    print(f"  start_remote()         {statistics.median(start):.2f} s")
+    print(
+        "  import remote.colors   "
+        f"{statistics.median(c['colors'] for c in colors) * 1e3:.0f} ms"
+    )
+    print(f"  matplotlib imported    {'yes' if colors[0]['matplotlib'] else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
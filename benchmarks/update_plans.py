@@ -0,0 +1,196 @@
+"""
+Benchmark the per-call overhead of doNd.update_plots.
+
+Half the plotted parameters are 1D traces, the other half 2D images, described by real
+qcodes InterDependencies_ and shapes. The plot items are stubs that don't talk to a
+plot process, so only the local work is timed. Each call advances every parameter by
+one point, so that every parameter is updated on every call.
+
+Pass --repo to benchmark another checkout, for example to compare two commits:
+
+    git worktree add ../before <commit>
+    python benchmarks/update_plans.py --repo ../before
+    python benchmarks/update_plans.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Points in each 1D trace, and rows and columns of each 2D image
+TRACE_POINTS = 50
+IMAGE_SHAPE = (20, 20)
+
+
+def _setup(doNd, n_params):
+    """
+    Return the live plot state for a dataset with n_params parameters, along with the
+    names of the parameters.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    from qcodes.dataset.descriptions.dependencies import InterDependencies_
+    from qcodes.parameters import ParamSpecBase
+
+    from qcodes_measurements.plot import ExtendedImageItem, ExtendedPlotDataItem
+
+    class Trace(ExtendedPlotDataItem):
+        def __new__(cls):
+            return object.__new__(cls)
+
+        def __init__(self):  # pylint: disable=super-init-not-called
+            self.__dict__["_setpoint_x"] = None
+
+        def extendData(self, x, y):
+            pass
+
+    class Image(ExtendedImageItem):
+        setpoint_x = setpoint_y = None
+        no_xscale = no_yscale = True
+
+        def __new__(cls):
+            return object.__new__(cls)
+
+        def __init__(self):  # pylint: disable=super-init-not-called
+            pass
+
+        def updateRows(self, *args, **kwargs):
+            pass
+
+        def rescale(self):
+            pass
+
+    x, y = ParamSpecBase("x", "numeric"), ParamSpecBase("y", "numeric")
+    n_rows, n_cols = IMAGE_SHAPE
+    dependencies, shapes, data = {}, {}, {}
+    for i in range(n_params):
+        param = ParamSpecBase(f"p{i}", "numeric")
+        if i % 2:
+            dependencies[param] = (x,)
+            shapes[param.name] = (TRACE_POINTS,)
+            data[param.name] = {
+                param.name: np.random.rand(TRACE_POINTS),
+                "x": np.arange(float(TRACE_POINTS)),
+            }
+        else:
+            dependencies[param] = (x, y)
+            shapes[param.name] = IMAGE_SHAPE
+            data[param.name] = {
+                param.name: np.random.rand(n_rows, n_cols),
+                "x": np.repeat(np.arange(float(n_rows)), n_cols).reshape(IMAGE_SHAPE),
+                "y": np.tile(np.arange(float(n_cols)), n_rows).reshape(IMAGE_SHAPE),
+            }
+    interdeps = InterDependencies_(dependencies=dependencies)
+
+    class Description:
+        pass
+
+    description = Description()
+    description.interdeps = interdeps
+    description.shapes = shapes
+
+    class Cache:
+        _write_status = {}
+
+        def data(self):
+            return data
+
+    class Dataset:
+        guid = "benchmark"
+        run_id = 1
+        cache = Cache()
+
+    Dataset.description = description
+
+    current = doNd.LivePlotWindow(plot_window=None)
+    current.dataset = Dataset()
+    if hasattr(current, "guid"):
+        current.guid = Dataset.guid
+    # Every call draws a frame
+    current.scheduler.frame_sent = lambda: None
+    for param in interdeps.dependencies:
+        name = param.name
+        if len(shapes[name]) == 1:
+            item = Trace()
+            if hasattr(doNd, "_trace_plan"):
+                current.update_plans[name] = doNd._trace_plan(item, name, "x")
+        else:
+            item = Image()
+            if hasattr(doNd, "_image_plan"):
+                current.update_plans[name] = doNd._image_plan(
+                    item, name, "x", "y", shapes[name]
+                )
+        current.plot_items[name] = item
+    return current, list(shapes)
+
+
+def _update(doNd, current):
+    """
+    Return a function that forces an update of the live plot, in whichever way the
+    checkout being benchmarked does it.
+    """
+    if hasattr(doNd, "_update_plots"):
+        return lambda: doNd._update_plots(current, True)
+    doNd.this.current = current
+    return lambda: doNd.update_plots([], 0, {}, force=True)
+
+
+def bench(doNd, n_params, calls):
+    """
+    Return the mean time taken by update_plots, in seconds.
+    """
+    current, names = _setup(doNd, n_params)
+    update = _update(doNd, current)
+    status = current.dataset.cache._write_status
+    elapsed = 0.0
+    for i in range(1, calls + 1):
+        for name in names:
+            status[name] = i
+        start = time.perf_counter()
+        update()
+        elapsed += time.perf_counter() - start
+    return elapsed / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the per-call overhead of doNd.update_plots."
+    )
+    parser.add_argument(
+        "--repo",
+        default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        help="Checkout of qcodes_measurements to benchmark (default: this one)",
+    )
+    parser.add_argument(
+        "--params",
+        type=int,
+        nargs="+",
+        default=[12, 24, 48],
+        help="Numbers of plotted parameters",
+    )
+    parser.add_argument("--calls", type=int, default=20, help="Calls per run")
+    parser.add_argument(
+        "--runs", type=int, default=5, help="Runs, of which the best is kept"
+    )
+    args = parser.parse_args()
+    repo = os.path.abspath(args.repo)
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, repo)
+    # pylint: disable=import-outside-toplevel
+    from Qt import QtWidgets
+
+    app = QtWidgets.QApplication([])  # pylint: disable=unused-variable
+    from qcodes_measurements.tools import doNd
+
+    assert doNd.__file__.startswith(repo)
+
+    print(f"{repo}: best of {args.runs} runs of {args.calls} calls")
+    for n_params in args.params:
+        best = min(bench(doNd, n_params, args.calls) for _ in range(args.runs))
+        print(f"  {n_params:3d} parameters   {best * 1e6:7.0f} us")
+
+
+if __name__ == "__main__":
+    main()
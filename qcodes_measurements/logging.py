@@ -1,14 +1,93 @@
+import atexit
+import collections
 import io
 import os
+import queue
 import sys
 import logging
-from typing import Optional
+import logging.handlers
+import multiprocessing
+from typing import Callable, Optional
 
-__all__ = ["LoggingStream", "get_logger", "set_log_level"]
+__all__ = [
+    "LoggingStream",
+    "get_logger",
+    "set_log_level",
+    "get_recent_logs",
+    "get_log_queue",
+    "log_to_queue",
+]
+
+# Log file, rotated once it reaches LOG_MAX_BYTES, keeping LOG_BACKUPS old files
+LOG_FILE = "rpyplot.log"
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUPS = 3
+
+# Number of recent records kept in memory, returned by get_recent_logs
+RECENT_RECORDS = 1000
 
 # Get access to module level variables
 logger: Optional[logging.Logger] = None
 
+# Handlers that write records, used by the listener threads of this process
+_handlers: list[logging.Handler] = []
+_recent: collections.deque = collections.deque(maxlen=RECENT_RECORDS)
+# Queue that records are sent to, if they are written by another process
+_log_queue = None
+# Queue receiving records from processes started by this one
+_child_queue = None
+# Levels set by set_log_level, and functions called when a level is set
+_levels: dict[Optional[str], str] = {}
+_level_callbacks: list[Callable[[str, Optional[str]], None]] = []
+
+class _RecentHandler(logging.Handler):
+    """
+    Keep formatted records in memory.
+    """
+
+    def emit(self, record):
+        _recent.append(self.format(record))
+
+def _listen(log_queue):
+    """
+    Write records put on the queue from a background thread.
+    """
+    if not _handlers:
+        log_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = logging.handlers.RotatingFileHandler(
+            LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, delay=True
+        )
+        _handlers.extend((file_handler, _RecentHandler()))
+        for handler in _handlers:
+            handler.setLevel(logging.DEBUG)
+            handler.setFormatter(log_format)
+    listener = logging.handlers.QueueListener(log_queue, *_handlers)
+    listener.start()
+    atexit.register(listener.stop)
+
+def log_to_queue(log_queue):
+    """
+    Send records to the given queue, to be written by the process that created it (see
+    get_log_queue).
+    """
+    globals()["_log_queue"] = log_queue
+    if logger is not None:
+        for handler in list(logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                logger.removeHandler(handler)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+def get_log_queue():
+    """
+    Return a queue that processes started by this one send their records to, so that
+    all records are written by this process.
+    """
+    global _child_queue  # pylint: disable=global-statement
+    if _child_queue is None:
+        _child_queue = multiprocessing.Queue()
+        _listen(_child_queue)
+    return _child_queue
+
 def get_logger(name=None, debug=False) -> logging.Logger:
     # Disable logging to stderr and capture warnings
     logging.lastResort = None
@@ -23,12 +102,14 @@ def get_logger(name=None, debug=False) -> logging.Logger:
             local_logger.setLevel(logging.DEBUG)
         else:
             local_logger.setLevel(logging.INFO)
-        # Create a handler for the logger
-        log_handler = logging.FileHandler("rpyplot.log")
-        log_handler.setLevel(logging.DEBUG)
-        log_format = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        log_handler.setFormatter(log_format)
-        local_logger.addHandler(log_handler)
+        # Records are written from a background thread, or by the process that
+        # started this one, so logging doesn't block
+        if _log_queue is None:
+            log_queue = queue.SimpleQueue()
+            _listen(log_queue)
+        else:
+            log_queue = _log_queue
+        local_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     else:
         local_logger = logger
 
@@ -42,14 +123,41 @@ def get_logger(name=None, debug=False) -> logging.Logger:
         return local_logger
     return local_logger.getChild(name)
 
+def get_recent_logs(n=None) -> list[str]:
+    """
+    Return the most recent n formatted log records written by this process, including
+    those sent by the plot process, oldest first.
+    """
+    records = list(_recent)
+    if n is not None:
+        records = records[-n:] if n > 0 else []
+    return records
+
+def add_level_callback(callback):
+    """
+    Call callback(level, name) whenever set_log_level is called, for example to
+    forward the level to another process.
+    """
+    _level_callbacks.append(callback)
+
+def log_levels() -> dict[Optional[str], str]:
+    """
+    Return the levels set by set_log_level, by logger name.
+    """
+    return dict(_levels)
+
 def set_log_level(level="INFO", name=None):
     """
-    Set the log level for a given module (name) to the level.
+    Set the log level for a given module (name) to the level. The level is also set in
+    the plot process.
     """
     # Get the logger
     local_logger = get_logger(name)
     local_logger.setLevel(level)
     get_logger().debug(f"Set log level of %r to %r", logger, level)
+    _levels[name] = level
+    for callback in _level_callbacks:
+        callback(level, name)
 
 class LoggingStream(io.IOBase):
     """
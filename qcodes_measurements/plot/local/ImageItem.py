@@ -3,6 +3,7 @@ from typing import cast
 import numpy as np
 from qcodes.parameters import ArrayParameter, Parameter
 
+from ..shared_array import SHARED_MEMORY_THRESHOLD, SharedArray, SharedBuffers
 from .ColorMap import ColorMap
 from .ExtendedDataItem import ExtendedDataItem
 from .RemoteProcessWrapper import RPGWrappedBase, ensure_ndarray, get_remote
@@ -96,30 +97,118 @@ class ExtendedImageItem(ImageItem):
 
     _base = "ExtendedImageItem"
 
+    # Local Variables
+    _shared: None | SharedBuffers = None
+    # Local copy of the setpoints, so that they don't need to be fetched from the remote
+    _setpoint_x: None | np.ndarray = None
+    _setpoint_y: None | np.ndarray = None
+
     def __init__(self, setpoint_x, setpoint_y, *args, colormap=None, **kwargs):
         super().__init__(setpoint_x, setpoint_y, *args, colormap=colormap, **kwargs)
         self.setpoint_x = setpoint_x
         self.setpoint_y = setpoint_y
+        self._shared = SharedBuffers()
+        self._set_update_options()
+
+    def __wrap__(self, *args, **kwargs):
+        super().__wrap__(*args, **kwargs)
+        self._shared = SharedBuffers()
+        self._setpoint_x = None
+        self._setpoint_y = None
+        self._set_update_options()
+
+    def _set_update_options(self):
+        self._remote_function_options["updateRows"] = {"callSync": "off"}
+
+    def _shared_array(self, data, nbytes) -> SharedArray | None:
+        """
+        Return a shared memory array that can hold data, and that the remote isn't
+        reading, or None if the nbytes that need to be sent are small enough to send
+        directly.
+        """
+        if nbytes < SHARED_MEMORY_THRESHOLD or data.dtype.hasobject:
+            return None
+        return self._shared.acquire(data.shape, data.dtype)
+
+    def _send_shared(self, name, shared, *args, **kwargs):
+        """
+        Call a remote method that reads from a shared array, marking the array as busy
+        until the remote has handled the call.
+        """
+        method = self._base_inst._deferredAttr(name)
+        request = method(*shared.descriptor(), *args, _callSync="async", **kwargs)
+        self._shared.sent(shared, request)
 
     def _force_rescale(self, setpoint_x, setpoint_y):
         """
         This is handled on the server side...
         """
 
+    def update(self, data, *args, **kwargs):
+        data = ensure_ndarray(data)
+        shared = self._shared_array(data, data.nbytes)
+        if shared is None:
+            super().update(data, *args, **kwargs)
+            return
+        shared.array[...] = data
+        self._send_shared("setImageShared", shared, autoDownsample=True)
+
+    def updateRows(self, data, start, stop, write_count, update_range=True):
+        """
+        Update rows `start` to `stop` of the image from the full image `data`,
+        sending only those rows to the remote plot window. `write_count` is the
+        number of points in the image that have been measured so far.
+
+        Large updates are written into shared memory, so that only the location of
+        the new rows is sent through the pipe. Updates alternate between blocks, so
+        that the next update can be written while the remote reads the last.
+        """
+        data = ensure_ndarray(data)
+        shared = self._shared_array(data, data[start:stop].nbytes)
+        if shared is None:
+            self.__getattr__("updateRows", _location="remote")(
+                data[start:stop], start, write_count, update_range
+            )
+            return
+        shared.array[start:stop] = data[start:stop]
+        self._send_shared(
+            "updateRowsShared", shared, start, stop, write_count, update_range
+        )
+
+    def setFillMode(self, mode, level=None):
+        """
+        Set how points that haven't been measured yet are drawn by updateRows. The mode
+        may be "mean" (the default) to fill with the mean of the measured points,
+        "level" to fill with a fixed level, or "transparent".
+        """
+        self._deferredAttr("setFillMode")(mode, level)
+
     @property
     def setpoint_x(self):
-        return self.__getattr__("setpoint_x", _returnType="value", _location="remote")
+        if self._setpoint_x is None:
+            self._setpoint_x = self.__getattr__(
+                "setpoint_x", _returnType="value", _location="remote"
+            )
+        return self._setpoint_x
 
     @setpoint_x.setter
     def setpoint_x(self, val):
+        val = ensure_ndarray(val)
+        self._setpoint_x = val
         self._base_inst.setpoint_x = val
 
     @property
     def setpoint_y(self):
-        return self.__getattr__("setpoint_y", _returnType="value", _location="remote")
+        if self._setpoint_y is None:
+            self._setpoint_y = self.__getattr__(
+                "setpoint_y", _returnType="value", _location="remote"
+            )
+        return self._setpoint_y
 
     @setpoint_y.setter
     def setpoint_y(self, val):
+        val = ensure_ndarray(val)
+        self._setpoint_y = val
         self._base_inst.setpoint_y = val
 
 
@@ -6,6 +6,14 @@ class VoronoiPlot(RPGWrappedBase):
     """
     _base = "VoronoiPlot"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._remote_function_options["addPoints"] = {"callSync": "off"}
+
+    def __wrap__(self, *args, **kwargs):
+        super().__wrap__(*args, **kwargs)
+        self._remote_function_options["addPoints"] = {"callSync": "off"}
+
 class ColorMesh(RPGWrappedBase):
     """
     Voronoi Plot
@@ -1,23 +1,31 @@
+import numpy as np
+
 from .RemoteProcessWrapper import RPGWrappedBase, ensure_ndarray
 from .ExtendedDataItem import ExtendedDataItem
 
 class PlotDataItem(ExtendedDataItem, RPGWrappedBase):
     _base = "PlotDataItem"
 
+    # Local Variables
+    # Local copy of the setpoints, so that they don't need to be fetched from the remote
+    _setpoint_x: None | np.ndarray = None
+
     def __init__(self, setpoint_x, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        #self.xData = ensure_ndarray(setpoint_x)
+        self._setpoint_x = ensure_ndarray(setpoint_x)
         self._remote_function_options['setData'] = {'callSync': 'off'}
 
     def __wrap__(self, *args, **kwargs):
         setpoint_x = kwargs.pop("setpoint_x", None)
 
         super().__wrap__(*args, **kwargs)
+        self._setpoint_x = None
         self._remote_function_options['setData'] = {'callSync': 'off'}
 
         if setpoint_x is not None:
-            # If we know what our setpoints are, use them
-            self.xData = setpoint_x
+            # If we know what our setpoints are, use them. They are sent along with the
+            # data, as xData can't be set on its own.
+            self._setpoint_x = ensure_ndarray(setpoint_x)
 
     def update(self, data, *args, **kwargs):
         """
@@ -27,15 +35,29 @@ class PlotDataItem(ExtendedDataItem, RPGWrappedBase):
         """
         self.setData(x=self.setpoint_x, y=ensure_ndarray(data), *args, **kwargs)
 
+    def setData(self, *args, **kwargs):
+        """
+        Set the data in the plot, keeping the local copy of the setpoints up to date.
+        """
+        x = kwargs.get("x", args[0] if len(args) == 2 else None)
+        # Otherwise the setpoints can't be told apart from the data, so fetch them when
+        # they are next needed
+        self._setpoint_x = None if x is None else ensure_ndarray(x)
+        self.__getattr__("setData", _location="remote")(*args, **kwargs)
+
     @property
     def setpoint_x(self):
-        return self.xData
+        if self._setpoint_x is None:
+            self._setpoint_x = self.xData
+        return self._setpoint_x
     @property
     def xData(self):
         return self._base_inst.__getattr__("xData", _returnType="value", _location="remote")
     @xData.setter
     def xData(self, val):
-        self._base_inst.xData = ensure_ndarray(val)
+        val = ensure_ndarray(val)
+        self._setpoint_x = val
+        self._base_inst.xData = val
 
     @property
     def yData(self):
@@ -55,6 +77,7 @@ class ExtendedPlotDataItem(PlotDataItem):
         self.setpoint_x = ensure_ndarray(setpoint_x)
         self._remote_function_options['update'] = {'callSync': 'off'}
         self._remote_function_options['setData'] = {'callSync': 'off'}
+        self._remote_function_options['extendData'] = {'callSync': 'off'}
 
     def __wrap__(self, *args, **kwargs):
         setpoint_x = kwargs.pop("setpoint_x", None)
@@ -62,6 +85,7 @@ class ExtendedPlotDataItem(PlotDataItem):
         super().__wrap__(*args, **kwargs)
         self._remote_function_options['update'] = {'callSync': 'off'}
         self._remote_function_options['setData'] = {'callSync': 'off'}
+        self._remote_function_options['extendData'] = {'callSync': 'off'}
 
         if setpoint_x is not None:
             # If we know what our setpoints are, use them
@@ -69,10 +93,16 @@ class ExtendedPlotDataItem(PlotDataItem):
 
     @property
     def setpoint_x(self):
-        return self._base_inst.setpoint_x
+        if self._setpoint_x is None:
+            self._setpoint_x = self._base_inst.__getattr__(
+                "setpoint_x", _returnType="value"
+            )
+        return self._setpoint_x
     @setpoint_x.setter
     def setpoint_x(self, val):
-        self._base_inst.setpoint_x = ensure_ndarray(val)
+        val = ensure_ndarray(val)
+        self._setpoint_x = val
+        self._base_inst.setpoint_x = val
 
     @property
     def xData(self):
@@ -80,6 +110,7 @@ class ExtendedPlotDataItem(PlotDataItem):
     @xData.setter
     def xData(self, val):
         val = ensure_ndarray(val)
+        self._setpoint_x = val
         self._base_inst.xData = val
         self._base_inst.setpoint_x = val
 
@@ -92,6 +123,18 @@ class ExtendedPlotDataItem(PlotDataItem):
 
     def setData(self, x, y, *args, **kwargs):
         """
-        Set the x, y in the plot, without filtering for NaN values.
+        Set the x, y in the plot, without filtering for NaN values. x becomes the
+        setpoints used by update.
         """
+        x = ensure_ndarray(x)
+        self._setpoint_x = x
         self.__getattr__("setData", _location="remote")(x, y, *args, **kwargs)
+
+    def extendData(self, x, y, *args, **kwargs):
+        """
+        Append points to the end of the trace, sending only the new points to
+        the remote plot window.
+        """
+        self.__getattr__("extendData", _location="remote")(
+            ensure_ndarray(x), ensure_ndarray(y), *args, **kwargs
+        )
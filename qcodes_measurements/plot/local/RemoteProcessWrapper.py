@@ -1,12 +1,21 @@
+import os
 import re
 import sys
-from typing import Any
+import threading
+import time
+from typing import Any, Optional
 
 import numpy as np
 from Qt import QtGui, QtWidgets
 
-from ...logging import get_logger
-from ..multiprocess import ClosedError, ObjectProxy, QtProcess
+from ...logging import add_level_callback, get_logger, log_levels
+from ..multiprocess import (
+    BatchProxy,
+    ClosedError,
+    DeferredObjectProxy,
+    ObjectProxy,
+    QtProcess,
+)
 
 
 # Get access to module level variables
@@ -15,13 +24,38 @@ class _Globals:
     proc: QtProcess
     rpg: Any
     rbuiltins: Any
+    # Whether to connect to a shared plot server rather than starting a plot process
+    use_server: bool = os.environ.get("QCM_PLOT_SERVER", "0") not in ("", "0")
+    # Whether to keep a spare plot process once the remote has been restarted, which is
+    # swapped in on the next restart
+    keep_standby: bool = True
+    # The spare plot process, and the pending request importing rpyplot in it
+    standby: Optional[tuple[QtProcess, Any]] = None
 
 
 this = _Globals()
 rpg = None
 logger = get_logger("RPGWrapper")
 
-__all__ = ["ensure_ndarray", "auto_wrap", "RPGWrappedBase", "get_remote"]
+RPYPLOT = "qcodes_measurements.plot.rpyplot"
+
+# Extract the name of a remote type from the repr of a remote object
+_type_re = re.compile(
+    r"^<[a-zA-Z_.]+\.([a-zA-Z_]+)(?:\(.*\))? (?:object )?at 0x[0-9A-Fa-f]+>$"
+)
+
+__all__ = [
+    "ensure_ndarray",
+    "auto_wrap",
+    "RPGWrappedBase",
+    "get_remote",
+    "batch",
+    "use_plot_server",
+    "get_remote_stats",
+    "flush_remote",
+    "remote_busy",
+    "reset_remote_stats",
+]
 
 
 def ensure_ndarray(array):
@@ -58,6 +92,23 @@ def _set_defaults(remote):
     remote.setConfigOption("leftButtonPan", False)
     remote.setConfigOption("antialias", True)
     remote._setProxyOptions(deferGetattr=False)
+    for name, level in log_levels().items():
+        remote.set_log_level(level, name)
+
+
+def _forward_log_level(level, name):
+    """
+    Set log levels in the plot process when they are set in this one.
+    """
+    if getattr(this, "rpg", None) is None:
+        return
+    try:
+        this.rpg.set_log_level(level, name)
+    except ClosedError:
+        pass
+
+
+add_level_callback(_forward_log_level)
 
 
 def start_remote():
@@ -67,36 +118,182 @@ def start_remote():
     else:
         this.app = QtWidgets.QApplication.instance()
 
-    this.proc = QtProcess(debug=False)
-    this.rpg = this.proc._import("qcodes_measurements.plot.rpyplot", timeout=20)
+    start = time.perf_counter()
+    if this.use_server:
+        from .. import server
+
+        if this.standby is not None:
+            _retire(this.standby[0])
+            this.standby = None
+        this.proc = server.connect()
+        this.rpg = this.proc._import(RPYPLOT, timeout=20)
+    else:
+        started = _take_standby()
+        if started is None:
+            proc, request = _spawn_process()
+            started = proc, proc.waitForResult(request, timeout=20)
+        this.proc, this.rpg = started
     this.rbuiltins = this.proc._import("builtins")
     _set_defaults(this.rpg)
+    logger.info("Started remote in %.3f s.", time.perf_counter() - start)
+
+
+def _spawn_process():
+    """
+    Start a plot process, and start importing rpyplot in it without waiting for the
+    import to finish. Returns the process and the pending request.
+    """
+    proc = QtProcess(debug=False)
+    request = proc.send(request="import", opts={"module": RPYPLOT}, callSync="async")
+    return proc, request
+
+
+def _take_standby():
+    """
+    Take the standby process, returning the process and its rpyplot module, or None
+    if there isn't a working standby.
+    """
+    if this.standby is None:
+        return None
+    proc, request = this.standby
+    this.standby = None
+    try:
+        if not proc.is_alive():
+            raise ClosedError()
+        return proc, proc.waitForResult(request, timeout=20)
+    except Exception:  # pylint: disable=broad-except
+        logger.warning(
+            "Standby plot process failed. Starting a new one.", exc_info=True
+        )
+        _retire(proc)
+        return None
+
+
+def _retire(proc):
+    """
+    Stop using a plot process, and close it in the background.
+    """
+    if QtProcess.handlers.get(proc.remotePid) is proc:
+        del QtProcess.handlers[proc.remotePid]
+    proc.stopRequestProcessing()
+    if not proc.is_alive():
+        # Proxies to objects in a dead process can't be released
+        proc.exited = True
+    reaper = threading.Thread(target=_reap, args=(proc,), name="ReapPlotProcess")
+    reaper.daemon = True
+    reaper.start()
+
+
+def _reap(proc):
+    try:
+        proc.join()
+    except ClosedError:
+        pass
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Plot process did not exit. Terminating it.")
+        proc.proc.terminate()
 
 
 def restart_remote():
-    if len(QtProcess.handlers) == 0:
-        start_remote()
-    else:
-        for pid in QtProcess.handlers:
-            try:
-                proc = QtProcess.handlers[pid]
-                if isinstance(proc, QtProcess):
-                    if not proc.exited:
-                        QtProcess.handlers[pid].join()
-            except ClosedError:
-                continue
-        QtProcess.handlers.clear()
-        start_remote()
+    """
+    Replace the plot process. The standby process is swapped in if there is one, and
+    the old processes are closed in the background. A new standby is then started, so
+    that only the first restart waits for a plot process to start.
+    """
+    standby = this.standby[0] if this.standby is not None else None
+    for proc in list(QtProcess.handlers.values()):
+        if isinstance(proc, QtProcess) and proc is not standby:
+            _retire(proc)
+    start_remote()
+    if this.keep_standby and not this.use_server:
+        this.standby = _spawn_process()
 
 
 def get_remote():
     return this.rpg
 
 
+def use_plot_server(enabled=True):
+    """
+    Plot in a plot server shared with other python processes, rather than a plot
+    process owned by this one. The server is started if it isn't already running, and
+    keeps running when this process exits. Defaults to the value of the QCM_PLOT_SERVER
+    environment variable. Takes effect the next time the remote is (re)started.
+    """
+    this.use_server = bool(enabled)
+
+
+def get_remote_stats():
+    """
+    Return statistics about the requests sent to the plot process since it was
+    started or the statistics were reset, or None if the remote hasn't been started.
+    See RemoteStats for what is recorded.
+
+    Example::
+
+        for name, method in get_remote_stats()["methods"].items():
+            print(name, method["calls"], method["wait_time"])
+    """
+    if getattr(this, "rpg", None) is None:
+        return None
+    return this.proc.stats.snapshot()
+
+
+def reset_remote_stats():
+    """
+    Clear the statistics about requests sent to the plot process.
+    """
+    if getattr(this, "rpg", None) is not None:
+        this.proc.stats.reset()
+
+
+def batch():
+    """
+    Return a context manager that queues calls to the plot process made from this
+    thread, and sends them as a single message when the block exits. Calls inside the
+    block return placeholders, which are filled in once the batch is sent.
+
+    Example::
+
+        with batch():
+            win = PlotWindow()
+            plot = win.addPlot(title="Trace")
+            plot.plot(setpoint_x=x, data=y)
+    """
+    if getattr(this, "rpg", None) is None:
+        start_remote()
+    return this.proc.batch()
+
+
+def flush_remote():
+    """
+    Send calls to the plot process that are held back while it catches up (see
+    RemoteEventHandler.maxInFlight), such as the last update of a plot. Held calls are
+    otherwise sent within RemoteEventHandler.maxHoldTime.
+    """
+    if getattr(this, "rpg", None) is not None:
+        this.proc.flushOutbox()
+
+
+def remote_busy():
+    """
+    Return whether updates sent to the plot process, or held back until it catches up,
+    haven't yet been handled by it (see RemoteEventHandler.hasPendingCalls). This
+    doesn't force out held updates.
+    """
+    if getattr(this, "rpg", None) is None:
+        return False
+    return this.proc.hasPendingCalls()
+
+
 def remote_callable(remote_obj):
     # If the object is local, shortcut to the local callable
     if not isinstance(remote_obj, ObjectProxy):
         return callable(remote_obj)
+    if isinstance(remote_obj, BatchProxy):
+        remote_obj = remote_obj.resolve()
+        if not isinstance(remote_obj, ObjectProxy):
+            return callable(remote_obj)
 
     # Call callable on the remote
     return this.rbuiltins.callable(remote_obj)
@@ -114,6 +311,16 @@ class RPGWrappedBase(ObjectProxy):
     _remote_functions: dict = {}
     _remote_function_options: dict[str, Any] = {}
 
+    # Name of the type of the remote object, which may be a subclass of _base
+    _remote_type: str = ""
+
+    # Metadata about remote attributes defined on the type of the remote object, keyed
+    # by the name of the type and attribute, and shared between instances. Whether each
+    # attribute is callable, and the type of the values returned by each method (a
+    # wrapper class, NoneType, or object if the value isn't wrapped).
+    _remote_attr_callable: dict[tuple[str, str], bool] = {}
+    _remote_return_types: dict[tuple[str, str], type] = {}
+
     def __init__(self, *args, **kwargs):  # pylint: disable=super-init-not-called
         self._remote_functions = {}
         self._remote_function_options = {}
@@ -121,13 +328,15 @@ class RPGWrappedBase(ObjectProxy):
         # Check that the remote process has been started, and is still alive
         if getattr(this, "rpg", None) is None:
             start_remote()
-        if this.rpg._handler.proc.is_alive() is False:
+        if this.proc.is_alive() is False:
             restart_remote()
 
         if "_base" in self.__class__.__dict__:
-            base = getattr(this.rpg, self.__class__._base)
+            # The type is looked up when it is called, saving a round trip
+            base = this.rpg._deferredAttr(self.__class__._base)
             base = base(*args, **kwargs)
             self._base_inst = base
+            self._remote_type = self.__class__._base
         else:
             raise TypeError(
                 "Base instance not defined. Don't know how to create remote object."
@@ -140,6 +349,40 @@ class RPGWrappedBase(ObjectProxy):
             RPGWrappedBase._subclass_types[typestr] = cls
         return super().__init_subclass__()
 
+    def __reduce__(self):
+        # Pickle as the wrapped proxy, which may be a placeholder in a batch
+        return self._base_inst.__reduce__()
+
+    def _deferredAttr(self, attr):
+        return self._base_inst._deferredAttr(attr)
+
+    batch = staticmethod(batch)
+
+    async def call_async(self, name, *args, **kwargs):
+        """
+        Call a method of the remote object, awaiting the result without blocking the
+        event loop. The result is wrapped in the same way as a regular call.
+
+        Example::
+
+            data = await plot_item.call_async("getData")
+        """
+        method = self._base_inst._deferredAttr(name)
+        request = method(*args, _callSync="async", **kwargs)
+        res = await self._base_inst._handler.awaitResult(request)
+        wrapped = RPGWrappedBase.autowrap(res)
+        self._record_result(name, res, wrapped)
+        return wrapped
+
+    async def getattr_async(self, name):
+        """
+        Get an attribute of the remote object, awaiting the value without blocking the
+        event loop.
+        """
+        handler = self._base_inst._handler
+        request = handler.getObjAttr(self._base_inst, name, callSync="async")
+        return RPGWrappedBase.autowrap(await handler.awaitResult(request))
+
     def __wrap__(self, *args, **kwargs):
         if args or kwargs:
             raise TypeError(
@@ -155,10 +398,17 @@ class RPGWrappedBase(ObjectProxy):
             raise TypeError("We can only wrap ObjectProxies")
 
         # Create an empty instance of RPGWrappedBase,
-        # and copy over instance variables
+        # and copy over instance variables. Placeholders in a batch don't have them
+        # yet, so they are looked up on the instance instead.
         base_inst = cls.__new__(cls)
-        base_inst.__dict__ = {**base_inst.__dict__, **instance.__dict__}
+        if not isinstance(instance, BatchProxy):
+            base_inst.__dict__ = {**base_inst.__dict__, **instance.__dict__}
         base_inst._base_inst = instance
+        base_inst._remote_type = cls._base
+        if not isinstance(instance, (BatchProxy, DeferredObjectProxy)):
+            typestr = _type_re.match(str(instance._typeStr))
+            if typestr:
+                base_inst._remote_type = typestr.groups()[0]
 
         # If we do want to initialize some instance variables, we can do it in
         # the special __wrap__ method
@@ -172,6 +422,10 @@ class RPGWrappedBase(ObjectProxy):
     def autowrap(inst):
         logger.debug("Trying to autowrap %r.", inst)
 
+        # The remote type is needed to wrap the result of a batched call
+        if isinstance(inst, BatchProxy):
+            inst = inst.resolve()
+
         # If we have an object proxy, wrap it if it is in the list of wrappable types
         if isinstance(inst, ObjectProxy):
             if isinstance(inst, RPGWrappedBase):
@@ -180,6 +434,16 @@ class RPGWrappedBase(ObjectProxy):
                 )
                 return inst
 
+            # Try to match the type from the description of the remote object first,
+            # which doesn't need a round trip. Deferred attributes share the description
+            # of their parent, so can't be matched this way.
+            if not isinstance(inst, DeferredObjectProxy):
+                typestr = _type_re.match(str(inst._typeStr))
+                if typestr and typestr.groups()[0] in RPGWrappedBase._subclass_types:
+                    typestr = typestr.groups()[0]
+                    logger.debug("Extracted remote type: %s.", typestr)
+                    return RPGWrappedBase._subclass_types[typestr].wrap(inst)
+
             # Get name of remote type
             remote_type = inst._getSpecialAttr("__class__").__name__
 
@@ -196,10 +460,7 @@ class RPGWrappedBase(ObjectProxy):
 
             # Otherwise look to see if we have an extended type
             logger.debug("Fallback matching %s", inst._typeStr)
-            typestr = re.match(
-                r"^<[a-zA-Z_.]+\.([a-zA-Z_]+)(?:\(.*\))? (?:object )?at 0x[0-9A-Fa-f]+>$",
-                str(inst._typeStr),
-            )
+            typestr = _type_re.match(str(inst._typeStr))
             if typestr:
                 logger.debug("Extracted remote type: %s.", typestr.groups()[0])
                 typestr = typestr.groups()[0]
@@ -212,9 +473,57 @@ class RPGWrappedBase(ObjectProxy):
         # Otherwise, just return the bare instance
         return inst
 
-    def wrap_adders(self, f):
+    def _predict_result(self, name, res):
+        """
+        Wrap a placeholder returned by a batched call using the type of value the method
+        returned previously, without waiting for the batch to be sent. Returns a flag
+        indicating whether the type was known, and the wrapped value.
+        """
+        if not isinstance(res, BatchProxy):
+            return False, res
+        res_type = self._remote_return_types.get((self._remote_type, name))
+        if res_type is None:
+            return False, res
+        if res_type is type(None):
+            return True, None
+        if res_type is object:
+            return True, res
+        return True, res_type.wrap(res)
+
+    def _record_result(self, name, res, wrapped):
+        """
+        Remember the type of value returned by a method defined on the remote type.
+        """
+        key = (self._remote_type, name)
+        if key not in self._remote_attr_callable:
+            return
+        if res is None:
+            res_type = type(None)
+        elif isinstance(wrapped, RPGWrappedBase):
+            res_type = type(wrapped)
+        elif wrapped is res:
+            res_type = object
+        else:
+            # Other conversions (e.g. remote lists) need the value
+            return
+        RPGWrappedBase._remote_return_types[key] = res_type
+
+    def wrap_adders(self, f, name=None):
         def save(*args, **kwargs):
             res = f(*args, **kwargs)
+            wrapped = None
+            if name is not None:
+                known, wrapped = self._predict_result(name, res)
+                if known and wrapped is not None:
+                    return wrapped
+                if not known:
+                    if isinstance(res, BatchProxy):
+                        res = res.resolve()
+                    wrapped = RPGWrappedBase.autowrap(res)
+                    self._record_result(name, res, wrapped)
+                if wrapped is not None:
+                    return wrapped
+                res = None
             # If the adder doesn't return the newly added item, we can assume the added item
             # was passed as the first non-keyword argument
             if res is None:
@@ -228,8 +537,25 @@ class RPGWrappedBase(ObjectProxy):
 
         return save
 
-    def wrap_getters(self, f):
-        return auto_wrap(f)
+    def wrap_getters(self, f, name=None):
+        if name is None:
+            return auto_wrap(f)
+
+        def wrap(*args, **kwargs):
+            val = f(*args, **kwargs)
+            if val is None:
+                return val
+            known, wrapped = self._predict_result(name, val)
+            if known:
+                # A method that returned None before may not now, so keep the placeholder
+                return val if wrapped is None else wrapped
+            if isinstance(val, BatchProxy):
+                val = val.resolve()
+            wrapped = RPGWrappedBase.autowrap(val)
+            self._record_result(name, val, wrapped)
+            return wrapped
+
+        return wrap
 
     def __setattr__(self, name, val, **kwargs):  # pylint: disable
         for cls in self.__class__.__mro__:
@@ -253,6 +579,8 @@ class RPGWrappedBase(ObjectProxy):
         # Figure out where we should look for the attribute ("remote", "local" or "both")
         search_location = kwargs.pop("_location", "both")
         attr = None
+        is_callable = None
+        remote_name = None
         # Get attribute from object proxy, checking if it exists locally first
         if search_location in ("local", "both"):
             logger.debug("Looking for attr %s locally.", name)
@@ -292,8 +620,22 @@ class RPGWrappedBase(ObjectProxy):
             if name in self._remote_functions:
                 logger.debug("Found cached value for %s.", name)
                 return self._remote_functions[name]
-            # Otherwise look for it on the remote
-            attr = self._base_inst.__getattr__(name, **kwargs)
+            # Known methods are looked up when they are called, values every time
+            remote_name = name
+            key = (self._remote_type, name)
+            is_callable = self._remote_attr_callable.get(key)
+            if is_callable and not kwargs:
+                attr = self._base_inst._deferredAttr(name)
+            else:
+                attr = self._base_inst.__getattr__(name, **kwargs)
+                attr = self.autowrap(attr)
+                if is_callable is None and isinstance(attr, ObjectProxy):
+                    is_callable, on_type = this.rpg._deferredAttr("describe_attribute")(
+                        self._base_inst, name, _returnType="value"
+                    )
+                    # Instance attributes may differ between objects of the same type
+                    if on_type:
+                        self._remote_attr_callable[key] = is_callable
             logger.debug("Found attr %s remotely. Returns value %r.", name, attr)
 
         # If we didn't find the attribute in either location, raise an AttributeError
@@ -303,23 +645,24 @@ class RPGWrappedBase(ObjectProxy):
             )
 
         # Check if item is a wrappable type
-        attr = self.autowrap(attr)
+        if is_callable is None:
+            attr = self.autowrap(attr)
+            is_callable = remote_callable(attr)
+        if not is_callable:
+            return attr
 
         # Wrap adders and getters
-        if name.startswith("add") and remote_callable(attr):
-            return self.wrap_adders(attr)
-        elif name.startswith("get") and remote_callable(attr):
-            return self.wrap_getters(attr)
+        if name.startswith("add"):
+            return self.wrap_adders(attr, remote_name)
+        elif name.startswith("get"):
+            return self.wrap_getters(attr, remote_name)
 
         # Save a cached copy, if we have a function with specific options
-        if remote_callable(attr) and name in self._remote_function_options:
+        if name in self._remote_function_options:
             attr._setProxyOptions(**self._remote_function_options[name])
-            self._remote_functions[name] = self.wrap_getters(attr)
+            self._remote_functions[name] = self.wrap_getters(attr, remote_name)
             return self._remote_functions[name]
-        if remote_callable(attr):
-            return self.wrap_getters(attr)
-
-        return attr
+        return self.wrap_getters(attr, remote_name)
 
     def __repr__(self):
-        return "<%s for %s>" % (self.__class__.__name__, super().__repr__())
+        return "<%s for %r>" % (self.__class__.__name__, self._base_inst)
@@ -123,7 +123,6 @@ class PlotAxis(RPGWrappedBase):
         return True
 
     def setParamspec(self, paramspec: ParamSpec):
-        self.label = paramspec.label
-        self.unit = paramspec.unit
+        self.setLabel(text=paramspec.label, units=paramspec.unit)
 
     paramspec = property(None, setParamspec)
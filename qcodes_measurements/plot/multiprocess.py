@@ -1,24 +1,258 @@
 # pylint: disable=import-outside-toplevel,invalid-name,wrong-import-position
+import asyncio
 import atexit
+import bisect
+import builtins
+import collections
+import contextlib
+import itertools
 import multiprocessing
+import multiprocessing.connection
+import multiprocessing.util
 import os
+import pickle
+import re
 import sys
+import threading
 import time
+import traceback
 
+import numpy as np
 import pyqtgraph.multiprocess.remoteproxy
-from pyqtgraph.multiprocess.remoteproxy import ClosedError, NoResultError, ObjectProxy
+from pyqtgraph.multiprocess.remoteproxy import (
+    ClosedError,
+    DeferredObjectProxy,
+    LocalObjectProxy,
+    NoResultError,
+    ObjectProxy,
+    Request,
+)
 
 # Allow a speedy import of logging from qcodes_measurements
 PREV_REMOTE = os.environ.get("QCM_REMOTE", None)
 os.environ["QCM_REMOTE"] = "IMP_LOGGING"
-from qcodes_measurements.logging import LoggingStream, get_logger
+from qcodes_measurements.logging import (
+    LoggingStream,
+    get_log_queue,
+    get_logger,
+    log_to_queue,
+)
 
 if PREV_REMOTE is None:
     del os.environ["QCM_REMOTE"]
 else:
     os.environ["QCM_REMOTE"] = PREV_REMOTE
 
-__all__ = ["Process", "QtProcess", "ClosedError", "NoResultError", "ObjectProxy"]
+# Longest time to wait for a result before checking whether another thread received it
+RESULT_POLL_INTERVAL = 0.05
+
+# Interval at which results are polled for in event loops that can't watch the pipe
+ASYNC_POLL_INTERVAL = 0.002
+
+# Buffers (e.g. array data) larger than this many bytes are sent separately from the
+# pickled request, straight from memory
+OUT_OF_BAND_THRESHOLD = 16 * 1024
+
+# Whether buffers can be written to and read from the connection's file descriptor
+# directly. Pipes on windows are not file descriptors.
+_RAW_BUFFERS = sys.platform != "win32"
+
+# Methods whose calls with callSync="off" replace any earlier call to the same method of
+# the same object that hasn't been sent yet
+COALESCED_METHODS = frozenset(
+    ("setData", "setImage", "update", "setLevels", "imageChanged")
+)
+
+# Methods whose calls with callSync="off" add to the data sent by earlier calls. They are
+# held back along with the coalesced calls, in order, but never replaced
+APPENDED_METHODS = frozenset(("extendData", "updateRows", "updateRowsShared"))
+
+# Default number of groups of these calls that may be waiting to be handled by the remote
+# before further calls are held back
+MAX_IN_FLIGHT = 4
+
+# Default longest time, in seconds, that a call is held back before it is sent anyway
+MAX_HOLD_TIME = 0.1
+
+# Default largest number of calls to appended methods that are held back before they are
+# sent anyway
+MAX_HELD_APPENDS = 32
+
+# Upper edges of the buckets of the latency histograms kept by RemoteStats, in seconds
+LATENCY_BUCKETS = (
+    1e-4, 2e-4, 5e-4, 1e-3, 2e-3, 5e-3, 1e-2, 2e-2, 5e-2, 0.1, 0.2, 0.5, 1.0, float("inf")
+)  # fmt: skip
+
+# Extract the name of a function from the description of a remote object
+_function_re = re.compile(
+    r"^<(?:bound method|function|built-in method|built-in function) "
+    r"((?:[\w.]|<locals>)+)"
+)
+
+__all__ = [
+    "Process",
+    "QtProcess",
+    "ClosedError",
+    "NoResultError",
+    "ObjectProxy",
+    "DeferredObjectProxy",
+    "BatchProxy",
+    "ServerConnection",
+    "RemoteStats",
+    "LATENCY_BUCKETS",
+]
+
+
+def _method_name(obj):
+    """
+    Return the name of the method referred to by a proxy, or None if it isn't known.
+    """
+    # Look in the instance dictionary, as unknown attributes are forwarded to the remote
+    attributes = obj.__dict__.get("_attributes")
+    if attributes:
+        return attributes[-1]
+    match = _function_re.match(str(obj.__dict__.get("_typeStr", "")))
+    if match:
+        return match.group(1).rsplit(".", 1)[-1]
+    return None
+
+
+def _request_name(request, opts):
+    """
+    Return the name under which a request is counted: the name of the method for
+    calls, otherwise the type of request.
+    """
+    if request != "callObj":
+        return request
+    obj = opts["obj"]
+    if not isinstance(obj, ObjectProxy):
+        return getattr(obj, "__name__", request)
+    return _method_name(obj) or request
+
+
+# Distinguishes the keys of calls to appended methods, so that they are never replaced
+_append_ids = itertools.count()
+
+
+def _coalesce_key(obj):
+    """
+    Return a key identifying calls to the same method of the same remote object, or
+    None if calls to the method are not held back. Each call to an appended method
+    gets its own key.
+    """
+    if not isinstance(obj, ObjectProxy):
+        return None
+    name = _method_name(obj)
+    if name not in COALESCED_METHODS and name not in APPENDED_METHODS:
+        return None
+    proxyId = obj.__dict__.get("_proxyId")
+    if proxyId is None:
+        # Placeholders in a batch don't refer to an object yet
+        return None
+    key = (obj.__dict__["_processId"], proxyId, obj.__dict__.get("_attributes"))
+    if name in APPENDED_METHODS:
+        key += (next(_append_ids),)
+    return key
+
+
+class RemoteStats:
+    """
+    Statistics about the requests sent to a remote process, for each method called.
+    For each method, the number of calls (and how many of those were batched, or
+    dropped as they were replaced by a later call), the bytes sent and received, the
+    total time spent waiting for results and a histogram of round trip times (see
+    LATENCY_BUCKETS) are recorded, along with the number of requests waiting for a
+    result.
+    """
+
+    def __init__(self):
+        # Reentrant, since garbage collected proxies send a request to release the remote
+        # object, which may happen while the statistics are being updated
+        self._lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._methods = {}
+            # Name and send time of each request waiting for a result
+            self._pending = {}
+            self._maxPending = 0
+            self._maxBatch = 0
+
+    def _method(self, name):
+        method = self._methods.get(name)
+        if method is None:
+            method = self._methods[name] = {
+                "calls": 0,
+                "batched": 0,
+                "dropped": 0,
+                "bytes_sent": 0,
+                "bytes_received": 0,
+                "wait_time": 0.0,
+                "latency": [0] * len(LATENCY_BUCKETS),
+            }
+        return method
+
+    def sent(self, name, reqId, nbytes):
+        with self._lock:
+            method = self._method(name)
+            method["calls"] += 1
+            method["bytes_sent"] += nbytes
+            if reqId is not None:
+                self._pending[reqId] = (name, time.perf_counter())
+                self._maxPending = max(self._maxPending, len(self._pending))
+
+    def queued(self, name, batchSize):
+        with self._lock:
+            method = self._method(name)
+            method["calls"] += 1
+            method["batched"] += 1
+            self._maxBatch = max(self._maxBatch, batchSize)
+
+    def dropped(self, name):
+        with self._lock:
+            self._method(name)["dropped"] += 1
+
+    def received(self, reqId, nbytes):
+        with self._lock:
+            pending = self._pending.pop(reqId, None)
+            if pending is None:
+                return
+            name, start = pending
+            method = self._method(name)
+            method["bytes_received"] += nbytes
+            bucket = bisect.bisect_left(LATENCY_BUCKETS, time.perf_counter() - start)
+            method["latency"][bucket] += 1
+
+    def nameOf(self, reqId):
+        with self._lock:
+            pending = self._pending.get(reqId)
+        return None if pending is None else pending[0]
+
+    def waited(self, name, seconds):
+        with self._lock:
+            self._method(name)["wait_time"] += seconds
+
+    def snapshot(self):
+        """
+        Return a copy of the statistics. Methods are sorted by the time spent waiting
+        for them, longest first.
+        """
+        with self._lock:
+            methods = {
+                name: {**method, "latency": list(method["latency"])}
+                for name, method in sorted(
+                    self._methods.items(),
+                    key=lambda item: (item[1]["wait_time"], item[1]["calls"]),
+                    reverse=True,
+                )
+            }
+            return {
+                "methods": methods,
+                "pending": len(self._pending),
+                "max_pending": self._maxPending,
+                "max_batch": self._maxBatch,
+            }
 
 
 class RemoteEventHandler(pyqtgraph.multiprocess.remoteproxy.RemoteEventHandler):
@@ -28,8 +262,13 @@ class RemoteEventHandler(pyqtgraph.multiprocess.remoteproxy.RemoteEventHandler):
     """
 
     def __init__(self, connection, name, pid, debug=False, logger=None):
+        if pid is None:
+            # Exchange pids with the remote process
+            connection.send(os.getpid())
+            pid = connection.recv()
         super().__init__(connection, name, pid, debug=False)
         del self.debug
+        self.remotePid = pid
 
         # Set up logger if it does not exist
         if logger is not None:
@@ -37,12 +276,828 @@ class RemoteEventHandler(pyqtgraph.multiprocess.remoteproxy.RemoteEventHandler):
         elif not hasattr(self, "logger"):
             self.logger = get_logger(name, debug=debug)
 
+        # Requests queued by batch(), for each thread
+        self._batchLocal = threading.local()
+
+        # Calls held back until the remote catches up, by coalescing key, and requests
+        # answered once the remote has handled each group of calls that was sent
+        self._outbox = {}
+        self._inFlight = collections.deque()
+        self._outboxLock = threading.RLock()
+        self._holdTimer = None
+        self._heldAppends = 0
+        self.maxInFlight = MAX_IN_FLIGHT
+        self.maxHoldTime = MAX_HOLD_TIME
+        self.maxHeldAppends = MAX_HELD_APPENDS
+
+        # Futures woken when data arrives, for coroutines waiting in awaitResult
+        self._asyncWaiters = set()
+        self._asyncReader = None
+
+        self.stats = RemoteStats()
+
     def debugMsg(self, msg, *args):
         """
         Use the logger for debugging instead
         """
         self.logger.debug(msg.strip("\r\n"), *args)
 
+    def waitForRequests(self, timeout=None):
+        """
+        Block until there is data to read from the remote process, or until timeout
+        seconds have passed. Returns True if there is data to read.
+        """
+        return bool(multiprocessing.connection.wait([self.conn], timeout))
+
+    def waitForResult(self, request, timeout=None):
+        """
+        Wait for the result of a request, waking up as soon as data arrives from the
+        remote process rather than polling.
+        """
+        if timeout is None:
+            timeout = request.timeout
+        name = self.stats.nameOf(request.reqId)
+        start = time.monotonic()
+        deadline = None if timeout is None or timeout < 0 else start + timeout
+        try:
+            while not request.hasResult():
+                if self.exited:
+                    raise ClosedError()
+                wait = RESULT_POLL_INTERVAL
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.logger.warning(
+                            "Request timed out: %s", request.description
+                        )
+                        raise NoResultError()
+                    wait = min(wait, remaining)
+                # Another thread may read the result for us, so don't wait forever
+                self.waitForRequests(wait)
+        finally:
+            if name is not None:
+                self.stats.waited(name, time.monotonic() - start)
+        return request.result()
+
+    async def awaitResult(self, request, timeout=None):
+        """
+        Wait for the result of a request sent with callSync="async", without blocking
+        the running event loop. Data from the remote process is read by the event loop
+        as it arrives.
+
+        Example::
+
+            request = rnumpy.sum(data, _callSync="async")
+            total = await proc.awaitResult(request)
+        """
+        if timeout is None:
+            timeout = request.timeout
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None or timeout < 0 else loop.time() + timeout
+        while not request.hasResult():
+            if self.exited:
+                raise ClosedError()
+            waiter = loop.create_future()
+            wait = self._addWaiter(loop, waiter)
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self._removeWaiter(loop, waiter)
+                    self.logger.warning("Request timed out: %s", request.description)
+                    raise NoResultError()
+                wait = min(wait, remaining)
+            try:
+                # Another thread may read the result for us, so don't wait forever
+                await asyncio.wait([waiter], timeout=wait)
+            finally:
+                self._removeWaiter(loop, waiter)
+        return request.result()
+
+    def _addWaiter(self, loop, waiter):
+        """
+        Add a future to be woken when data arrives from the remote process, watching the
+        pipe if it isn't already. Returns the longest time to wait before polling.
+        """
+        if not self._asyncWaiters:
+            try:
+                fd = self.conn.fileno()
+                loop.add_reader(fd, self._readAsync)
+                self._asyncReader = (loop, fd)
+            except (NotImplementedError, OSError):
+                # Event loops on windows can't watch pipes
+                self._asyncReader = None
+        self._asyncWaiters.add(waiter)
+        if self._asyncReader is None:
+            return ASYNC_POLL_INTERVAL
+        return RESULT_POLL_INTERVAL
+
+    def _removeWaiter(self, loop, waiter):
+        self._asyncWaiters.discard(waiter)
+        if not self._asyncWaiters and self._asyncReader is not None:
+            readerLoop, fd = self._asyncReader
+            if readerLoop is loop:
+                loop.remove_reader(fd)
+                self._asyncReader = None
+
+    def _readAsync(self):
+        """
+        Process requests when the pipe becomes readable, and wake waiting coroutines.
+        """
+        try:
+            self.processRequests()
+        except ClosedError:
+            pass
+        for waiter in self._asyncWaiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Queue requests made from this thread, and send them to the remote process as a
+        single message when the block exits.
+
+        Calls return a BatchProxy placeholder instead of their result. Placeholders can
+        be passed to later calls in the same batch, and are filled in when the batch is
+        sent. Anything that needs a value from the remote, such as reading an attribute
+        of an existing object or using a placeholder as a local value, sends the queued
+        requests first. Arguments are pickled when the batch is sent, so they should not
+        be modified inside the block.
+        """
+        state = self._batchLocal
+        if getattr(state, "ops", None) is not None:
+            # Nested batches are merged into the outer one
+            yield
+            return
+
+        state.ops, state.proxies = [], []
+        try:
+            yield
+        except BaseException:
+            try:
+                self.flushBatch()
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception("Failed to send batched requests.")
+            raise
+        else:
+            self.flushBatch()
+        finally:
+            state.ops = state.proxies = None
+
+    def flushBatch(self):
+        """
+        Send requests queued in this thread and fill in their placeholders.
+        """
+        state = self._batchLocal
+        ops = getattr(state, "ops", None)
+        if not ops:
+            return
+        proxies = state.proxies
+        timeout = max((op[5] for op in ops if op[5] is not None), default=10)
+        state.ops, state.proxies = None, None
+        try:
+            self.debugMsg("flushBatch: sending %d requests", len(ops))
+            results, error = RemoteEventHandler.send(
+                self,
+                request="callObj",
+                opts=dict(
+                    obj=_run_batch,
+                    args=[os.getpid(), [op[:5] for op in ops]],
+                    kwds={},
+                ),
+                callSync="sync",
+                timeout=timeout,
+                returnType="value",
+            )
+        except Exception as e:
+            for proxy in proxies:
+                if proxy is not None:
+                    proxy._fail(e)
+            raise
+        finally:
+            state.ops, state.proxies = [], []
+
+        for proxy, result in zip(proxies, results):
+            if proxy is not None:
+                proxy._fill(result)
+        if error is not None:
+            index, exc, excStr = error
+            self.logger.error(
+                "Batched request %d failed on the remote:\n%s", index, "".join(excStr)
+            )
+            if exc is None:
+                exc = Exception(
+                    "Batched request failed. See log for the exception from the remote."
+                )
+            for proxy in proxies[index:]:
+                if proxy is not None:
+                    proxy._fail(exc)
+            raise exc
+
+    def send(
+        self,
+        request,
+        opts=None,
+        reqId=None,
+        callSync="sync",
+        timeout=10,
+        returnType=None,
+        byteData=None,
+        **kwds,
+    ):
+        ops = getattr(self._batchLocal, "ops", None)
+        if (
+            ops is not None
+            and callSync != "async"
+            and (
+                request == "callObj"
+                or (request == "getObjAttr" and isinstance(opts["obj"], BatchProxy))
+            )
+        ):
+            return self._queueRequest(ops, request, opts, callSync, timeout, returnType)
+        if ops and request not in ("result", "error", "del"):
+            # Preserve ordering with requests that are already queued
+            self.flushBatch()
+        if callSync == "off" and request == "callObj":
+            key = _coalesce_key(opts["obj"])
+            if key is not None:
+                return self._sendCoalesced(key, opts, timeout, returnType, byteData)
+        if self._outbox and request not in ("result", "error"):
+            # Preserve ordering with calls that are held back
+            self.flushOutbox()
+        req = self._sendMessage(
+            request,
+            opts,
+            reqId,
+            "async" if callSync == "sync" else callSync,
+            timeout,
+            returnType,
+            byteData,
+        )
+        if callSync == "sync":
+            return self.waitForResult(req, timeout)
+        return req
+
+    def _sendMessage(self, request, opts, reqId, callSync, timeout, returnType, byteData):
+        """
+        Send a request to the remote process.
+
+        The request is pickled with protocol 5. Large buffers found while pickling, along
+        with byteData, are sent as separate byte messages straight from their memory,
+        and their sizes are sent with the request so that the remote can read them into
+        preallocated buffers. Returns a Request unless callSync is "off".
+        """
+        if self.exited:
+            self.debugMsg("  send: exited already; raise ClosedError.")
+            raise ClosedError()
+
+        with self.sendLock:
+            if opts is None:
+                opts = {}
+
+            assert callSync in (
+                "off",
+                "sync",
+                "async",
+            ), f'callSync must be one of "off", "sync", or "async" (got {callSync!r})'
+            if reqId is None:
+                if callSync != "off":
+                    reqId = self.nextRequestId
+                    self.nextRequestId += 1
+            else:
+                # A request ID is only given when replying to a request
+                assert request in ("result", "error")
+
+            if returnType is not None:
+                opts["returnType"] = returnType
+
+            buffers = [_byte_view(data) for data in byteData or ()]
+
+            def out_of_band(buffer):
+                raw = buffer.raw()
+                if raw.nbytes < OUT_OF_BAND_THRESHOLD:
+                    return True
+                buffers.append(raw)
+                return False
+
+            try:
+                optStr = pickle.dumps(opts, protocol=5, buffer_callback=out_of_band)
+            except Exception:
+                self.logger.exception("Error pickling request %s: %r", request, opts)
+                raise
+
+            nByteMsgs = len(byteData) if byteData is not None else 0
+            sizes = [buffer.nbytes for buffer in buffers]
+            self.debugMsg(
+                "send request: cmd=%s nByteMsgs=%d nBuffers=%d id=%s opts=%s",
+                request,
+                nByteMsgs,
+                len(buffers) - nByteMsgs,
+                reqId,
+                opts,
+            )
+            self.stats.sent(
+                _request_name(request, opts),
+                reqId if request not in ("result", "error") else None,
+                len(optStr) + sum(sizes),
+            )
+            self.conn.send((request, reqId, nByteMsgs, optStr, sizes))
+            for buffer in buffers:
+                _send_buffer(self.conn, buffer)
+
+            self.debugMsg("  call sync: %s", callSync)
+            if callSync == "off":
+                return None
+
+        return Request(self, reqId, description=f"{request} {reqId}", timeout=timeout)
+
+    def _sendCoalesced(self, key, opts, timeout, returnType, byteData):
+        """
+        Send a call that replaces any unsent call to the same method of the same object.
+        Calls are held back while maxInFlight groups of calls haven't yet been handled
+        by the remote, so that only the most recent calls are sent once it catches up.
+        Held calls are sent as acknowledgements are read, at most maxHoldTime seconds
+        after they were first held back, and once maxHeldAppends calls to appended
+        methods are held back.
+        """
+        if self.exited:
+            raise ClosedError()
+        name = _request_name("callObj", opts)
+        with self._outboxLock:
+            if self._outbox.pop(key, None) is not None:
+                self.stats.dropped(name)
+            # A replaced call moves to the end of the queue, so that it stays after any
+            # appended calls made since
+            self._outbox[key] = (opts, timeout, returnType, byteData)
+            if name in APPENDED_METHODS:
+                self._heldAppends += 1
+            sent = self._drainOutbox(force=self._heldAppends >= self.maxHeldAppends)
+        if not sent:
+            # Read any acknowledgements that have arrived, sending the held calls
+            self.processRequests()
+            self._armHoldTimer()
+
+    def _armHoldTimer(self):
+        """
+        Make sure that held calls are sent within maxHoldTime, even if nothing reads
+        the acknowledgements from the remote.
+        """
+        with self._outboxLock:
+            if self._holdTimer is not None or not self._outbox:
+                return
+            self._holdTimer = threading.Timer(self.maxHoldTime, self._holdExpired)
+            self._holdTimer.daemon = True
+            self._holdTimer.start()
+
+    def _holdExpired(self):
+        with self._outboxLock:
+            self._holdTimer = None
+            if self.exited:
+                return
+            try:
+                self._drainOutbox(force=True)
+            except ClosedError:
+                pass
+            except Exception:  # pylint: disable=broad-except
+                self.logger.exception("Failed to send held calls.")
+
+    def _drainOutbox(self, force=False):
+        """
+        Send the held calls, unless maxInFlight groups of calls haven't yet been
+        handled by the remote and force is False. Returns whether calls were sent.
+        """
+        with self._outboxLock:
+            inFlight = self._popAnswered()
+            if not self._outbox or (not force and len(inFlight) >= self.maxInFlight):
+                return False
+            outbox, self._outbox = self._outbox, {}
+            self._heldAppends = 0
+            if self._holdTimer is not None:
+                self._holdTimer.cancel()
+                self._holdTimer = None
+            for opts, timeout, returnType, byteData in outbox.values():
+                self._sendMessage(
+                    "callObj", opts, None, "off", timeout, returnType, byteData
+                )
+            # Answered once the remote has handled the calls
+            inFlight.append(
+                self._sendMessage(
+                    "getObjValue", {"obj": None}, None, "async", None, None, None
+                )
+            )
+            return True
+
+    def _popAnswered(self):
+        """
+        Forget the groups of calls that the remote has acknowledged, and return those
+        still in flight.
+        """
+        inFlight = self._inFlight
+        while inFlight and (inFlight[0].gotResult or inFlight[0].reqId in self.results):
+            inFlight.popleft().result(block=False)
+        return inFlight
+
+    def hasPendingCalls(self):
+        """
+        Return whether calls that go through the outbox (see COALESCED_METHODS and
+        APPENDED_METHODS) are held back, or haven't yet been handled by the remote.
+        Acknowledgements that have arrived are read, which sends any held calls that
+        are allowed, but held calls are never forced out.
+        """
+        self.processRequests()
+        with self._outboxLock:
+            return bool(self._outbox or self._popAnswered())
+
+    def flushOutbox(self):
+        """
+        Send any calls that are held back until the remote catches up.
+        """
+        self._drainOutbox(force=True)
+
+    def processRequests(self):
+        numProcessed = super().processRequests()
+        if self._outbox:
+            self._drainOutbox()
+        return numProcessed
+
+    def handleRequest(self):
+        """
+        Handle a single request from the remote process.
+        Blocks until a request is available.
+        """
+        try:
+            cmd, reqId, nByteMsgs, optStr, sizes = self.conn.recv()
+        except (EOFError, OSError):
+            self.debugMsg("  handleRequest: connection closed; raise ClosedError.")
+            raise ClosedError()
+        self.debugMsg("  handleRequest: received %s %s", cmd, reqId)
+
+        # Read the buffers sent after the request into preallocated memory
+        buffers = []
+        for size in sizes:
+            buffer = np.empty(size, dtype=np.uint8)
+            try:
+                _recv_buffer(self.conn, buffer)
+            except (EOFError, OSError):
+                self.debugMsg("  handleRequest: connection closed; raise ClosedError.")
+                raise ClosedError()
+            buffers.append(buffer)
+        byteData, buffers = buffers[:nByteMsgs], buffers[nByteMsgs:]
+
+        result = None
+        try:
+            if cmd in ("result", "error"):
+                # This is the reply to a previous request
+                resultId = reqId
+                reqId = None
+                self.stats.received(resultId, len(optStr) + sum(sizes))
+
+            opts = pickle.loads(optStr, buffers=buffers)
+            self.debugMsg("    handleRequest: id=%s opts=%s", reqId, opts)
+            returnType = opts.get("returnType", "auto")
+
+            if cmd == "result":
+                with self.resultLock:
+                    self.results[resultId] = ("result", opts["result"])
+            elif cmd == "error":
+                with self.resultLock:
+                    self.results[resultId] = (
+                        "error",
+                        (opts["exception"], opts["excString"]),
+                    )
+            elif cmd == "getObjAttr":
+                result = getattr(opts["obj"], opts["attr"])
+            elif cmd == "callObj":
+                obj = opts["obj"]
+                fnargs = opts["args"]
+                fnkwds = opts["kwds"]
+                if len(fnkwds) == 0:
+                    # Some functions don't accept keyword arguments
+                    result = obj(*fnargs)
+                else:
+                    result = obj(*fnargs, **fnkwds)
+            elif cmd == "getObjValue":
+                result = opts["obj"]  # Already unpickled into its local value
+                returnType = "value"
+            elif cmd == "transfer":
+                result = opts["obj"]
+                returnType = "proxy"
+            elif cmd == "transferArray":
+                result = np.frombuffer(byteData[0], dtype=opts["dtype"]).reshape(
+                    opts["shape"]
+                )
+                returnType = "proxy"
+            elif cmd == "import":
+                name = opts["module"]
+                fromlist = opts.get("fromlist", [])
+                mod = builtins.__import__(name, fromlist=fromlist)
+                if len(fromlist) == 0:
+                    result = mod
+                    for part in name.lstrip(".").split(".")[1:]:
+                        result = getattr(result, part)
+                else:
+                    result = map(mod.__getattr__, fromlist)
+            elif cmd == "del":
+                self.releaseProxy(opts["proxyId"])
+            elif cmd == "close":
+                if reqId is not None:
+                    result = True
+                    returnType = "value"
+            exc = None
+        except Exception:  # pylint: disable=broad-except
+            exc = sys.exc_info()
+
+        if reqId is not None:
+            if exc is None:
+                self.debugMsg("    handleRequest: sending return value for %d", reqId)
+                if returnType == "auto":
+                    with self.optsLock:
+                        noProxyTypes = self.proxyOptions["noProxyTypes"]
+                    result = self.autoProxy(result, noProxyTypes)
+                elif returnType == "proxy":
+                    result = LocalObjectProxy(result)
+
+                try:
+                    self.replyResult(reqId, result)
+                except Exception:  # pylint: disable=broad-except
+                    sys.excepthook(*sys.exc_info())
+                    self.replyError(reqId, *sys.exc_info())
+            else:
+                self.debugMsg("    handleRequest: returning exception for %d", reqId)
+                self.replyError(reqId, *exc)
+        elif exc is not None:
+            sys.excepthook(*exc)
+
+        if cmd == "close":
+            if opts.get("noCleanup", False) is True:
+                os._exit(0)  # Exit immediately, without running cleanup
+            else:
+                raise ClosedError()
+
+    def releaseProxy(self, proxyId):
+        """
+        Release an object proxied for the remote, once the remote has deleted its proxy.
+        """
+        LocalObjectProxy.releaseProxyId(proxyId)
+
+    def callObj(self, obj, args, kwds, **opts):
+        opts = opts.copy()
+        args = list(args)
+
+        # Decide whether to send arguments by value or by proxy
+        with self.optsLock:
+            noProxyTypes = opts.pop("noProxyTypes", None)
+            if noProxyTypes is None:
+                noProxyTypes = self.proxyOptions["noProxyTypes"]
+            autoProxy = opts.pop("autoProxy", self.proxyOptions["autoProxy"])
+
+        if autoProxy is True:
+            args = [self.autoProxy(v, noProxyTypes) for v in args]
+            kwds = {k: self.autoProxy(v, noProxyTypes) for k, v in kwds.items()}
+
+        # Arrays are sent out-of-band when the request is pickled
+        return self.send(
+            request="callObj", opts=dict(obj=obj, args=args, kwds=kwds), **opts
+        )
+
+    def _queueRequest(self, ops, request, opts, callSync, timeout, returnType):
+        """
+        Add a request to the current batch, returning a placeholder for its result.
+        """
+        if request == "getObjAttr":
+            args, kwds = (opts["attr"],), {}
+        else:
+            args, kwds = opts["args"], opts["kwds"]
+        if callSync == "off":
+            returnType = "off"
+        elif returnType is None:
+            returnType = opts.get("returnType", "auto")
+        ops.append((request, opts["obj"], args, kwds, returnType, timeout))
+        self.stats.queued(_request_name(request, opts), len(ops))
+
+        state = self._batchLocal
+        if callSync == "off":
+            state.proxies.append(None)
+            return None
+        proxy = BatchProxy(self, len(ops) - 1)
+        state.proxies.append(proxy)
+        return proxy
+
+
+def _send_buffer(conn, buffer):
+    """
+    Send the contents of a buffer. The size of the buffer must be known by the receiver.
+    """
+    if not _RAW_BUFFERS:
+        conn.send_bytes(buffer)
+        return
+    fd = conn.fileno()
+    while buffer.nbytes:
+        buffer = buffer[os.write(fd, buffer) :]
+
+
+def _recv_buffer(conn, buffer):
+    """
+    Read data sent by _send_buffer directly into a buffer of the same size.
+    """
+    if not _RAW_BUFFERS:
+        conn.recv_bytes_into(buffer)
+        return
+    fd = conn.fileno()
+    view = memoryview(buffer).cast("B")
+    while view.nbytes:
+        count = os.readv(fd, [view])
+        if count == 0:
+            raise EOFError
+        view = view[count:]
+
+
+def _byte_view(data):
+    """
+    Return a flat byte view of data (e.g. an array) that can be sent without copying.
+    """
+    if isinstance(data, np.ndarray):
+        if data.nbytes == 0:
+            return memoryview(b"")
+        data = np.ascontiguousarray(data)
+    return memoryview(data).cast("B")
+
+
+class _Slot:
+    """
+    Reference to the result of an earlier request in the same batch.
+    """
+
+    __slots__ = ("index",)
+
+    def __init__(self, index):
+        self.index = index
+
+    def __reduce__(self):
+        return (_Slot, (self.index,))
+
+
+def _identity(value):
+    return value
+
+
+def _fill_slots(value, values):
+    """
+    Replace references to earlier results in the arguments of a batched request.
+    """
+    if isinstance(value, _Slot):
+        return values[value.index]
+    if type(value) in (list, tuple):
+        return type(value)(_fill_slots(v, values) for v in value)
+    if type(value) is dict:
+        return {k: _fill_slots(v, values) for k, v in value.items()}
+    return value
+
+
+def _run_batch(pid, ops):
+    """
+    Run a batch of requests in the remote process, returning the results and any error.
+    Execution stops at the first request that fails.
+    """
+    handler = RemoteEventHandler.getHandler(pid)
+    noProxyTypes = handler.getProxyOption("noProxyTypes")
+    values, results = [], []
+    for request, obj, args, kwds, returnType in ops:
+        try:
+            obj = _fill_slots(obj, values)
+            args = _fill_slots(args, values)
+            if request == "getObjAttr":
+                value = getattr(obj, args[0])
+            else:
+                value = obj(*args, **_fill_slots(kwds, values))
+        except Exception:  # pylint: disable=broad-except
+            exc = sys.exc_info()
+            excStr = traceback.format_exception(*exc)
+            try:
+                pickle.dumps(exc[1])
+                error = exc[1]
+            except Exception:  # pylint: disable=broad-except
+                error = None
+            return results, (len(results), error, excStr)
+
+        values.append(value)
+        if returnType == "off":
+            results.append(None)
+        elif returnType == "value":
+            results.append(value)
+        elif returnType == "proxy":
+            results.append(LocalObjectProxy(value))
+        else:
+            results.append(handler.autoProxy(value, noProxyTypes))
+    return results, None
+
+
+class BatchProxy(ObjectProxy):
+    """
+    Placeholder for the result of a request queued in a batch.
+
+    Attribute lookups and calls on a placeholder are queued in the same batch. Using it
+    as a local value (converting it to a bool, str or number, comparing or iterating
+    over it) sends the batch first. Once the batch has been sent, placeholders for
+    remote objects turn into ordinary proxies.
+    """
+
+    def __init__(self, handler, index):  # pylint: disable=super-init-not-called
+        # Don't register with the handler, as there is no remote object yet
+        self.__dict__.update(
+            _processId=handler.remotePid,
+            _typeStr="<pending batch result>",
+            _proxyId=None,
+            _attributes=(),
+            _handler=handler,
+            _proxyOptions={k: None for k in handler.proxyOptions},
+            _batchIndex=index,
+            _batchState="pending",
+            _batchValue=None,
+        )
+
+    def _fill(self, value):
+        if isinstance(value, ObjectProxy):
+            # Become a proxy for the remote object, keeping the original alive
+            # so that the remote object is not released.
+            attrs = dict(value.__dict__)
+            attrs["_batchTarget"] = value
+            object.__setattr__(self, "__dict__", attrs)
+            object.__setattr__(self, "__class__", type(value))
+        else:
+            self.__dict__.update(_batchState="done", _batchValue=value)
+
+    def _fail(self, exc):
+        self.__dict__.update(_batchState="failed", _batchValue=exc)
+
+    def resolve(self):
+        """
+        Send the batch if necessary, and return the result of the request.
+        """
+        if self.__dict__.get("_batchState") == "pending":
+            self._handler.flushBatch()
+        if "_batchTarget" in self.__dict__:
+            return self
+        if self._batchState == "failed":
+            raise self._batchValue
+        if self._batchState == "pending":
+            raise NoResultError("Batched request was not sent.")
+        return self._batchValue
+
+    def __reduce__(self):
+        if self._batchState == "pending":
+            return (_Slot, (self._batchIndex,))
+        return (_identity, (self.resolve(),))
+
+    def __repr__(self):
+        return f"<BatchProxy for request {self._batchIndex} ({self._batchState})>"
+
+    def __getattr__(self, attr, **kwds):
+        if attr.startswith("__") and attr.endswith("__"):
+            raise AttributeError(attr)
+        return self._deferredAttr(attr)
+
+    def _deferredAttr(self, attr):
+        if self._batchState == "pending":
+            return self._handler.getObjAttr(self, attr, callSync="sync")
+        return getattr(self.resolve(), attr)
+
+    def __call__(self, *args, **kwds):
+        if self._batchState == "pending":
+            return ObjectProxy.__call__(self, *args, **kwds)
+        return self.resolve()(*args, **kwds)
+
+    # Special methods that need a local value
+    def __bool__(self):
+        return bool(self.resolve())
+
+    def __str__(self):
+        return str(self.resolve())
+
+    def __len__(self):
+        return len(self.resolve())
+
+    def __iter__(self):
+        return iter(self.resolve())
+
+    def __int__(self):
+        return int(self.resolve())
+
+    def __float__(self):
+        return float(self.resolve())
+
+    def __index__(self):
+        return self.resolve().__index__()
+
+    def __eq__(self, other):
+        return self.resolve() == other
+
+    def __ne__(self, other):
+        return self.resolve() != other
+
+    def __hash__(self):
+        return hash(self.resolve())
+
 
 class Process(RemoteEventHandler):
     """
@@ -78,7 +1133,8 @@ class Process(RemoteEventHandler):
                         By default, this is startEventLoop(), which causes the remote
                         process to handle requests from the parent process until it
                         is asked to quit. If you wish to specify a different target,
-                        it must be picklable (bound methods are not).
+                        it must be picklable (bound methods are not), and accept
+                        the same arguments as startEventLoop().
         debug           If True, print detailed information about communication
                         with the child process.
         ==============  =============================================================
@@ -91,6 +1147,7 @@ class Process(RemoteEventHandler):
 
         ## Create a connection for the client/server
         self.conn, child_conn = multiprocessing.Pipe(True)
+        multiprocessing.util.register_after_fork(self, _close_after_fork)
 
         self.logger.info("Starting child process")
 
@@ -103,6 +1160,7 @@ class Process(RemoteEventHandler):
             conn=child_conn,
             ppid=pid,
             debug=debug,
+            log_queue=get_log_queue(),
         )
 
         # Start the process. We'll set the file that multiprocessing loads to this file
@@ -124,6 +1182,9 @@ class Process(RemoteEventHandler):
 
         atexit.register(self.join)
 
+    def is_alive(self):
+        return self.proc.is_alive()
+
     def join(self, timeout=10):
         self.logger.debug("Joining child process..")
 
@@ -140,24 +1201,41 @@ class Process(RemoteEventHandler):
             )
 
 
-def startEventLoop(name, conn, ppid, debug=False):
+def _close_after_fork(handler):
+    """
+    Called in processes forked from this one, including the child of handler itself.
+    Stop reading the connection of handler and close it, so that the forked process
+    doesn't take replies meant for this one, and the remote sees the connection close
+    once this process exits.
+    """
+    if getattr(handler, "timer", None) is not None:
+        handler.stopRequestProcessing()
+    handler.exited = True
+    handler.conn.close()
+    if RemoteEventHandler.handlers.get(getattr(handler, "remotePid", None)) is handler:
+        del RemoteEventHandler.handlers[handler.remotePid]
+
+
+def startEventLoop(name, conn, ppid, debug=False, log_queue=None):
     # Set up environment
     os.environ["QCM_REMOTE"] = name
 
-    # Set up logger
+    # Set up logger, sending records to the parent to be written
+    if log_queue is not None:
+        log_to_queue(log_queue)
     logger = get_logger(debug=debug)
 
     # Redirect stdout and stderr to the logger
-    sys.stdout = LoggingStream(logger.info)
-    sys.stderr = LoggingStream(logger.error)
+    sys.stdout = LoggingStream(logger, "info")
+    sys.stderr = LoggingStream(logger, "error")
 
     logger.info("Connected; starting remote proxy.\n")
 
     handler = RemoteEventHandler(conn, name, ppid, logger=logger)
     while True:
         try:
+            handler.waitForRequests()
             handler.processRequests()  # exception raised when the loop should exit
-            time.sleep(0.01)
         except (ClosedError, BrokenPipeError):
             logger.debug("Exiting server loop.")
             sys.exit(0)
@@ -166,31 +1244,63 @@ def startEventLoop(name, conn, ppid, debug=False):
 ##Special set of subclasses that implement a Qt event loop instead.
 
 
+def _connection_notifier(conn, slot):
+    """
+    Return a QSocketNotifier that calls slot whenever conn has data to read, or None if
+    the connection can't be watched (pipes on windows are not sockets).
+    """
+    if sys.platform == "win32":
+        return None
+    from Qt import QtCore
+
+    read = getattr(QtCore.QSocketNotifier, "Read", None)
+    if read is None:
+        read = QtCore.QSocketNotifier.Type.Read
+    notifier = QtCore.QSocketNotifier(conn.fileno(), read)
+    notifier.activated.connect(lambda *args: slot())
+    return notifier
+
+
 class RemoteQtEventHandler(RemoteEventHandler):
     def __init__(self, *args, **kwds):
         RemoteEventHandler.__init__(self, *args, **kwds)
         self.timer = None
+        self.notifier = None
 
-    def startEventTimer(self):
-        from Qt import QtCore
+    def startEventNotifier(self):
+        """
+        Process requests from the parent as soon as they arrive, falling back to polling
+        where the connection can't be watched.
+        """
+        self.notifier = _connection_notifier(self.conn, self.processRequests)
+        if self.notifier is None:
+            from Qt import QtCore
 
-        self.timer = QtCore.QTimer()
-        self.timer.timeout.connect(self.processRequests)
-        self.timer.start(1)
+            self.timer = QtCore.QTimer()
+            self.timer.timeout.connect(self.processRequests)
+            self.timer.start(1)
 
     def processRequests(self):
         try:
             return RemoteEventHandler.processRequests(self)
         except (ClosedError, BrokenPipeError):
-            from Qt import QtWidgets
-
             if self.timer is not None:
                 self.timer.stop()
-            instance = QtWidgets.QApplication.instance()
-            if instance is not None:
-                instance.quit()
+            if self.notifier is not None:
+                self.notifier.setEnabled(False)
+            self.connectionClosed()
             return 0
 
+    def connectionClosed(self):
+        """
+        Called once the connection to the parent has closed. Quits the application.
+        """
+        from Qt import QtWidgets
+
+        instance = QtWidgets.QApplication.instance()
+        if instance is not None:
+            instance.quit()
+
 
 class QtProcess(Process):
     """
@@ -239,32 +1349,88 @@ class QtProcess(Process):
         from Qt import QtCore  # # avoid module-level import to keep bootstrap snappy.
 
         self.timer = QtCore.QTimer()
+        self.timer.timeout.connect(self.processRequests)
+        self.notifier = None
         if self._processRequests:
             self.startRequestProcessing()
 
     def startRequestProcessing(self, interval=0.01):
         """Start listening for requests coming from the child process.
         This allows signals to be connected from the child process to the parent.
+        Requests are handled as soon as they arrive, or every interval seconds on
+        platforms where the connection can't be watched.
         """
-        self.timer.timeout.connect(self.processRequests)
-        self.timer.start(max(1, int(interval * 1000)))
+        if self.notifier is None:
+            self.notifier = _connection_notifier(self.conn, self.processRequests)
+        if self.notifier is not None:
+            self.notifier.setEnabled(True)
+        else:
+            self.timer.start(max(1, int(interval * 1000)))
 
     def stopRequestProcessing(self):
         self.timer.stop()
+        if self.notifier is not None:
+            self.notifier.setEnabled(False)
 
     def processRequests(self):
         try:
             return Process.processRequests(self)
         except ClosedError:
-            self.timer.stop()
+            self.stopRequestProcessing()
             return 0
 
 
-def startQtEventLoop(name, conn, ppid, debug=False):
+class ServerConnection(QtProcess):
+    """
+    Connection to a plot server (see plot.server) that may be shared with other
+    processes. It is used in place of a QtProcess. Joining closes the connection,
+    leaving the server and its windows running.
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, conn, name=None, debug=False, processRequests=True):
+        from Qt import QtWidgets
+
+        self._processRequests = processRequests
+        if self._processRequests and QtWidgets.QApplication.instance() is None:
+            raise Exception(
+                "Must create QApplication before connecting to a plot server, "
+                "or use ServerConnection(processRequests=False)"
+            )
+        if name is None:
+            name = str(os.getpid())
+        self.logger = get_logger(f"local_{os.getpid()}", debug=debug)
+        self.conn = conn
+        multiprocessing.util.register_after_fork(self, _close_after_fork)
+
+        RemoteEventHandler.__init__(
+            self, conn, name + "_client", pid=None, logger=self.logger
+        )
+        self.logger.info("Connected to plot server with pid %d.", self.remotePid)
+        self.startEventTimer()
+
+        atexit.register(self.join)
+
+    def is_alive(self):
+        return not self.exited
+
+    def join(self, timeout=10):
+        if not self.exited:
+            self.logger.debug("Disconnecting from plot server.")
+            self.stopRequestProcessing()
+            self.exited = True
+            self.conn.close()
+        if RemoteEventHandler.handlers.get(self.remotePid) is self:
+            del RemoteEventHandler.handlers[self.remotePid]
+
+
+def startQtEventLoop(name, conn, ppid, debug=False, log_queue=None):
     # Set up environment
     os.environ["QCM_REMOTE"] = name
 
-    # Get logger
+    # Get logger, sending records to the parent to be written
+    if log_queue is not None:
+        log_to_queue(log_queue)
     logger = get_logger(debug=debug)
 
     # Redirect stdout and stderr to the logger
@@ -282,5 +1448,5 @@ def startQtEventLoop(name, conn, ppid, debug=False):
         app.setQuitOnLastWindowClosed(False)
 
     handler = RemoteQtEventHandler(conn, name, ppid, logger=logger)
-    handler.startEventTimer()
+    handler.startEventNotifier()
     sys.exit(app.exec_())
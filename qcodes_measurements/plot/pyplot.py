@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
-from .local.RemoteProcessWrapper import start_remote, restart_remote, get_remote
+from .local.RemoteProcessWrapper import (start_remote, restart_remote, get_remote, batch,
+                                         use_plot_server, get_remote_stats,
+                                         reset_remote_stats)
 from .local.PlotWindow import PlotWindow
 from .local.UIItems import TableWidget, LegendItem, TextItem, PlotAxis
 from .local.ColorMap import ColorMap
@@ -13,4 +15,5 @@ from .local.MeshPlots import VoronoiPlot, ColorMesh
 
 __all__ = ["PlotWindow", "PlotItem", "ExtendedDataItem", "PlotDataItem", "ExtendedPlotDataItem", "ImageItem",
            "ExtendedImageItem", "ImageItemWithHistogram", "TableWidget", "LegendItem", "TextItem", "ColorMap",
-           "PlotAxis", "VoronoiPlot", "ColorMesh", "start_remote", "restart_remote", "get_remote"]
+           "PlotAxis", "VoronoiPlot", "ColorMesh", "start_remote", "restart_remote", "get_remote",
+           "batch", "use_plot_server", "get_remote_stats", "reset_remote_stats"]
@@ -1,17 +1,18 @@
-import itertools
-import struct
 from typing import Union
 
 import numpy as np
 import pandas as pd
-from Qt import QtCore, QtGui
+from Qt import QtCore
 
 from ...logging import get_logger
 from .DataItem import ExtendedDataItem
-from .MeshPlot import MeshPlot
+from .MeshPlot import MeshPlot, read_polygons
 
 logger = get_logger("ColorMesh")
 
+# Layout of a serialized QPolygonF containing a closed quad
+QUAD_DTYPE = np.dtype([("count", ">i4"), ("points", ">f8", (5, 2))])
+
 axis_input = Union[None, str, np.ndarray]
 data_type = Union[None, np.ndarray, pd.Series]
 
@@ -235,27 +236,23 @@ class ColorMesh(ExtendedDataItem, MeshPlot):
         """
         Convert the raw data into a mesh plot
         """
-        # Then generate a list of polygons for finite regions
         logger.debug("Generating Polygons")
         self.polygons.clear()
-        xsize, ysize = self.x_axis.shape[0] - 1, self.y_axis.shape[1] - 1
-        for x, y in itertools.product(range(xsize), range(ysize)):
-            buf = bytearray(4 + 5 * 16)
-            buf[3] = 5
-            struct.pack_into(">2d", buf, 4, self.x_axis[x, y], self.y_axis[x, y])
-            struct.pack_into(
-                ">2d", buf, 20, self.x_axis[x + 1, y], self.y_axis[x + 1, y]
-            )
-            struct.pack_into(
-                ">2d", buf, 36, self.x_axis[x + 1, y + 1], self.y_axis[x + 1, y + 1]
-            )
-            struct.pack_into(
-                ">2d", buf, 52, self.x_axis[x, y + 1], self.y_axis[x, y + 1]
-            )
-            struct.pack_into(">2d", buf, 68, self.x_axis[x, y], self.y_axis[x, y])
-            ds = QtCore.QDataStream(QtCore.QByteArray.fromRawData(buf))
-            poly = QtGui.QPolygonF()
-            ds >> poly  # pylint: disable=pointless-statement
-            self.polygons.append((x * ysize + y, poly))
+        x_axis = np.asarray(self.x_axis, dtype=np.float64)
+        y_axis = np.asarray(self.y_axis, dtype=np.float64)
+        xsize, ysize = x_axis.shape[0] - 1, x_axis.shape[1] - 1
+
+        # Each polygon is a closed quad, serialized in the order QDataStream expects
+        quads = np.empty(xsize * ysize, dtype=QUAD_DTYPE)
+        quads["count"] = 5
+        corners = quads["points"].reshape(xsize, ysize, 5, 2)
+        for i, (dx, dy) in enumerate(((0, 0), (1, 0), (1, 1), (0, 1), (0, 0))):
+            corners[:, :, i, 0] = x_axis[dx : dx + xsize, dy : dy + ysize]
+            corners[:, :, i, 1] = y_axis[dx : dx + xsize, dy : dy + ysize]
 
+        self.polygons.extend(enumerate(read_polygons(quads.tobytes(), quads.size)))
+        points = quads["points"]
+        self.indexPolygons(
+            np.concatenate((points.min(axis=1), points.max(axis=1)), axis=1)
+        )
         logger.info("Done")
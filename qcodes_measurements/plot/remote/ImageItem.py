@@ -7,6 +7,7 @@ from pyqtgraph.graphicsItems import GradientEditorItem
 from Qt import QtCore, QtGui, QtWidgets
 
 from ...logging import get_logger
+from ..shared_array import SharedAttachment
 from .colors import COLORMAPS, DEFAULT_CMAP
 from .DataItem import ExtendedDataItem
 from .PlotWindow import ExtendedPlotWindow
@@ -23,6 +24,25 @@ class ExtendedImageItem(ExtendedDataItem, ImageItem):
         self.menu = None
         self.gradientSelectorMenu = None
         self.cmap = None
+
+        # Image buffer filled row by row by updateRows, and statistics of the
+        # measured points
+        self._rowBuffer = None
+        self._rowWritten = 0
+        self._rowSum = 0.0
+        self._rowCount = 0
+        self._rowLevels = None
+
+        # How points that haven't been measured are drawn (see setFillMode)
+        self._fillMode = "mean"
+        self._fillLevel = None
+        self._fillValue = None
+
+        # Shared memory block that data is sent through, detached when this item is
+        # destroyed
+        self._shared = SharedAttachment()
+        self.destroyed.connect(self._shared.close)
+
         if colormap is not None:
             self.changeColorScale(name=colormap)
         else:
@@ -200,6 +220,128 @@ class ExtendedImageItem(ExtendedDataItem, ImageItem):
         image = self.image - col_mean
         self.setImage(image)
 
+    def setFillMode(self, mode, level=None):
+        """
+        Set how points that haven't been measured yet are drawn by updateRows. The mode
+        may be "mean" (the default) to fill with the mean of the measured points,
+        "level" to fill with a fixed level, or "transparent".
+        """
+        if mode not in ("transparent", "mean", "level"):
+            raise ValueError(f"Unknown fill mode {mode}")
+        if mode == "level" and level is None:
+            raise ValueError("A level must be given for the level fill mode")
+        self._fillMode = mode
+        self._fillLevel = level
+        self._fillValue = None
+
+        # Refill points that haven't been measured yet
+        if self._rowBuffer is not None:
+            flat = self._rowBuffer.reshape(-1)
+            if mode == "transparent":
+                flat[self._rowWritten :] = np.nan
+            elif mode == "level":
+                flat[self._rowWritten :] = level
+            else:
+                self._fillUnmeasured(flat, self._rowWritten, self._rowWritten)
+            self.setImage(self._rowBuffer, autoLevels=False, autoDownsample=True)
+
+    def _resetRows(self, shape):
+        """
+        Allocate a new image buffer for updateRows
+        """
+        self._rowBuffer = np.full(shape, np.nan)
+        self._rowWritten = 0
+        self._rowSum = 0.0
+        self._rowCount = 0
+        self._rowLevels = None
+        self._fillValue = None
+        if self._fillMode == "level":
+            self._rowBuffer.fill(self._fillLevel)
+
+    def _fillUnmeasured(self, flat, writeCount, sentEnd):
+        """
+        Fill points that haven't been measured yet. Points past sentEnd still hold the
+        previous fill value, and are only refilled in mean mode once the mean has moved
+        by more than a step of the color scale.
+        """
+        if self._fillMode == "transparent":
+            # Unmeasured points are sent as NaN, which is drawn transparent
+            return
+        if self._fillMode == "level":
+            flat[writeCount:sentEnd] = self._fillLevel
+            return
+        if self._rowCount == 0:
+            return
+        mean = self._rowSum / self._rowCount
+        lo, hi = self._rowLevels
+        if self._fillValue is None or abs(mean - self._fillValue) > (hi - lo) / 256:
+            self._fillValue = mean
+            flat[writeCount:] = mean
+        else:
+            flat[writeCount:sentEnd] = self._fillValue
+
+    def updateRows(self, rows, start, writeCount, updateRange=True):
+        """
+        Write a block of rows into the image, starting at row `start`, and redraw.
+
+        `writeCount` is the total number of points that have been measured, where points
+        are filled in row-major order. Points that haven't been measured yet are drawn
+        according to the fill mode (see setFillMode). The color range and fill value are
+        updated using only newly measured points.
+        """
+        rows = np.asarray(rows, dtype=np.float64)
+        shape = (len(self.setpoint_x), len(self.setpoint_y))
+        if (
+            self._rowBuffer is None
+            or self._rowBuffer.shape != shape
+            or writeCount < self._rowWritten
+        ):
+            self._resetRows(shape)
+        image = self._rowBuffer
+        stop = start + rows.shape[0]
+        image[start:stop] = rows
+
+        # Update the statistics of the newly measured points
+        flat = image.reshape(-1)
+        written = flat[self._rowWritten : writeCount]
+        written = written[np.isfinite(written)]
+        if written.size:
+            self._rowSum += written.sum()
+            self._rowCount += written.size
+            levels = (written.min(), written.max())
+            if self._rowLevels is not None:
+                levels = (
+                    min(levels[0], self._rowLevels[0]),
+                    max(levels[1], self._rowLevels[1]),
+                )
+            self._rowLevels = levels
+        self._rowWritten = max(self._rowWritten, writeCount)
+
+        # Fill in points that haven't been measured yet
+        if writeCount < flat.size:
+            self._fillUnmeasured(flat, writeCount, stop * shape[1])
+
+        self.setImage(image, autoLevels=False, autoDownsample=True)
+        if updateRange and self._rowLevels is not None:
+            self.setLevels(self._rowLevels)
+
+    def updateRowsShared(
+        self, name, shape, dtype, start, stop, writeCount, updateRange=True
+    ):
+        """
+        Same as updateRows, with the full image stored in a shared memory block
+        """
+        data = self._shared.array(name, shape, dtype)
+        self.updateRows(data[start:stop], start, writeCount, updateRange)
+
+    def setImageShared(self, name, shape, dtype, **kwargs):
+        """
+        Same as setImage, with the image stored in a shared memory block. The image is
+        copied, so that the block may be overwritten while the image is drawn.
+        """
+        data = self._shared.array(name, shape, dtype)
+        self.setImage(np.array(data), **kwargs)
+
     def rescale(self):
         step_x = (self.setpoint_x[-1] - self.setpoint_x[0]) / len(self.setpoint_x)
         step_y = (self.setpoint_y[-1] - self.setpoint_y[0]) / len(self.setpoint_y)
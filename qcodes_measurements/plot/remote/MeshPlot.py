@@ -1,8 +1,8 @@
-from itertools import islice
 from typing import List, Union
 
 import numpy as np
 from pyqtgraph import GraphicsObject, HistogramLUTItem, mkPen
+from pyqtgraph.functions import ndarray_from_qimage, ndarray_to_qimage
 from Qt import QtCore, QtGui
 
 from ...logging import get_logger
@@ -12,6 +12,113 @@ from .ViewBox import CustomViewBox
 
 logger = get_logger("MeshPlot")
 
+# Fraction of the visible region rendered on each side of it into the paint cache, so
+# that small pans don't require the mesh to be redrawn
+CACHE_MARGIN = 0.5
+# Maximum size of the paint cache on each side, in pixels
+MAX_CACHE_SIZE = 8192
+# Number of colors in the lookup table. An extra transparent entry is used for NaNs.
+LUT_SIZE = 256
+# Each pixel of the rendered mesh holds the index of the polygon drawn there in its
+# color, and is opaque where a polygon was drawn
+ID_MASK = 0x00FFFFFF
+ID_DRAWN = 0xFF000000
+
+
+def read_polygons(buf: bytes, count: int) -> List[QtGui.QPolygonF]:
+    """
+    Read count polygons from a buffer in the format written by QDataStream, that is a
+    big-endian int32 vertex count followed by big-endian (x, y) float64 pairs for
+    each polygon.
+    """
+    ds = QtCore.QDataStream(QtCore.QByteArray(buf))
+    polygons = []
+    for _ in range(count):
+        poly = QtGui.QPolygonF()
+        ds >> poly  # pylint: disable=pointless-statement
+        polygons.append(poly)
+    return polygons
+
+
+class GridIndex:
+    """
+    Uniform grid of buckets over the bounding rects of a set of polygons, used to find
+    the polygons that intersect a region without testing every polygon.
+    """
+
+    def __init__(self, bounds: np.ndarray):
+        """
+        Index polygons with the given (xmin, ymin, xmax, ymax) bounds, one row per
+        polygon. Polygons with non-finite bounds are never returned.
+        """
+        self.bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 4)
+        finite = np.flatnonzero(np.isfinite(self.bounds).all(axis=1))
+        bounds = self.bounds[finite]
+
+        # Size the grid to hold around one polygon per bucket
+        if finite.size:
+            self.xmin, self.ymin = bounds[:, :2].min(axis=0)
+            xmax, ymax = bounds[:, 2:].max(axis=0)
+        else:
+            self.xmin, self.ymin, xmax, ymax = 0.0, 0.0, 0.0, 0.0
+        self.nx = self.ny = max(1, int(np.ceil(np.sqrt(finite.size))))
+        self.dx = (xmax - self.xmin) / self.nx or 1.0
+        self.dy = (ymax - self.ymin) / self.ny or 1.0
+
+        # List the buckets covered by each polygon
+        x0, x1 = self._columns(bounds[:, 0], bounds[:, 2])
+        y0, y1 = self._rows(bounds[:, 1], bounds[:, 3])
+        ncols = x1 - x0 + 1
+        counts = ncols * (y1 - y0 + 1)
+        polygon = np.repeat(np.arange(finite.size), counts)
+        offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        bucket = (y0[polygon] + offset // ncols[polygon]) * self.nx + (
+            x0[polygon] + offset % ncols[polygon]
+        )
+
+        # And store them sorted by bucket, so that each bucket is a slice of items
+        order = np.argsort(bucket, kind="stable")
+        self.finite = finite
+        self.items = finite[polygon[order]]
+        self.starts = np.searchsorted(bucket[order], np.arange(self.nx * self.ny + 1))
+
+    def _columns(self, xmin, xmax):
+        x0 = np.clip(np.floor((xmin - self.xmin) / self.dx), 0, self.nx - 1)
+        x1 = np.clip(np.floor((xmax - self.xmin) / self.dx), 0, self.nx - 1)
+        return x0.astype(np.intp), x1.astype(np.intp)
+
+    def _rows(self, ymin, ymax):
+        y0 = np.clip(np.floor((ymin - self.ymin) / self.dy), 0, self.ny - 1)
+        y1 = np.clip(np.floor((ymax - self.ymin) / self.dy), 0, self.ny - 1)
+        return y0.astype(np.intp), y1.astype(np.intp)
+
+    def query(self, xmin, ymin, xmax, ymax) -> np.ndarray:
+        """
+        Return the indices of the polygons whose bounds intersect the given region, in
+        ascending order.
+        """
+        x0, x1 = self._columns(np.array([xmin]), np.array([xmax]))
+        y0, y1 = self._rows(np.array([ymin]), np.array([ymax]))
+        x0, x1, y0, y1 = x0[0], x1[0], y0[0], y1[0]
+        if (x0, y0, x1, y1) == (0, 0, self.nx - 1, self.ny - 1):
+            found = self.finite
+        else:
+            # Buckets in each row are contiguous
+            found = [
+                self.items[self.starts[row + x0] : self.starts[row + x1 + 1]]
+                for row in range(y0 * self.nx, (y1 + 1) * self.nx, self.nx)
+            ]
+            found = np.unique(np.concatenate(found))
+        # Buckets at the edge of the region may contain polygons outside it
+        bounds = self.bounds[found]
+        inside = (
+            (bounds[:, 0] <= xmax)
+            & (bounds[:, 2] >= xmin)
+            & (bounds[:, 1] <= ymax)
+            & (bounds[:, 3] >= ymin)
+        )
+        return found[inside]
+
 
 class MeshPlot(GraphicsObject):
     def __init__(
@@ -27,8 +134,25 @@ class MeshPlot(GraphicsObject):
         # Initialize data structures
         self.positions = positions
         self.data = data
-        self.rgb_data: Union[None, np.ndarray] = None
+        # Colors of each polygon, as indices into a uint8 RGBA lookup table
+        self.color_index: Union[None, np.ndarray] = None
+        self.lut = np.zeros((LUT_SIZE + 1, 4), dtype=np.uint8)
         self.polygons: List[tuple[int, QtGui.QPolygonF]] = []
+        # Spatial index of the polygons, built from their bounds when next drawn
+        self.index: GridIndex | None = None
+        self._polygonBounds: np.ndarray | None = None
+        # Mesh rendered at the current view scale, and the region it covers. The
+        # polygons are drawn into _idImage (see ID_MASK), which is colored through the
+        # lookup table into the pixels of _cache, so that recoloring doesn't redraw the
+        # polygons.
+        self._idImage: QtGui.QImage | None = None
+        self._cache: QtGui.QImage | None = None
+        self._cachePixels: np.ndarray | None = None
+        self._cacheRect = QtCore.QRectF()
+        self._cacheScale: tuple[float, ...] | None = None
+        self._cacheTransform = QtGui.QTransform()
+        # Counts and bin edges of the histogram of the data
+        self._histogram: tuple[np.ndarray, np.ndarray] | None = None
         self.xmin, self.xmax = 0, 0
         self.ymin, self.ymax = 0, 0
         if positions is not None and data is not None:
@@ -45,7 +169,7 @@ class MeshPlot(GraphicsObject):
         # Create LUT item
         self._LUTitem = HistogramLUTItem()
         self._LUTitem.sigLookupTableChanged.connect(self.changedColorScale)
-        self._LUTitem.sigLevelChangeFinished.connect(self.updateRGBData)
+        self._LUTitem.sigLevelsChanged.connect(self.updateRGBData)
         if colormap is not None:
             self.changeColorScale(name=colormap)
         else:
@@ -71,9 +195,42 @@ class MeshPlot(GraphicsObject):
         # Update plot
         self.updateRGBData()
         self.calculate_polygons()
+        self.invalidateCache()
 
         # Update histogram and autorange
-        hist, bins = np.histogram(self.data, "auto")
+        self.updateHistogram()
+
+        # Force viewport update
+        self.getViewBox().itemBoundsChanged(self)
+        self.update()
+
+    def updateHistogram(self, new_data: np.ndarray | None = None):
+        """
+        Recalculate the histogram of the data and autorange the levels. If new_data is
+        given, and lies within the existing bins, it's added to the existing histogram
+        instead and the levels are left unchanged.
+        """
+        if new_data is not None and self._histogram is not None:
+            hist, bins = self._histogram
+            new_data = np.asarray(new_data, dtype=np.float64)
+            new_data = new_data[np.isfinite(new_data)]
+            if not new_data.size or (
+                new_data.min() >= bins[0] and new_data.max() <= bins[-1]
+            ):
+                hist += np.histogram(new_data, bins)[0]
+                self._plotHistogram(autorange=False)
+                return
+
+        data = np.asarray(self.data, dtype=np.float64)
+        data = data[np.isfinite(data)]
+        if not data.size:
+            self._histogram = None
+            return
+        self._histogram = np.histogram(data, "auto")
+        self._plotHistogram(autorange=True)
+
+    def _plotHistogram(self, autorange):
+        hist, bins = self._histogram
         newBins = np.ndarray(bins.size + 1)
         newHist = np.ndarray(hist.size + 2)
         newBins[0] = bins[0]
@@ -82,25 +239,22 @@ class MeshPlot(GraphicsObject):
         newHist[[0, -1]] = 0
         newHist[1:-1] = hist
         self._LUTitem.plot.setData(newBins, newHist)
-        self._LUTitem.setLevels(newBins[0], newBins[-1])
+        if autorange:
+            self._LUTitem.setLevels(newBins[0], newBins[-1])
         self._LUTitem.plot.getViewBox().itemBoundsChanged(self._LUTitem.plot)
 
-        # Force viewport update
-        self.getViewBox().itemBoundsChanged(self)
-        self.update()
-
     ###
     # Functions relating to the size of the image
     def calc_lims(self):
-        if not self.positions:
+        positions = np.asarray(
+            self.positions if self.positions is not None else (), dtype=np.float64
+        ).reshape(-1, 2)
+        if not positions.size:
             self.xmin, self.xmax = 0, 0
             self.ymin, self.ymax = 0, 0
             return
-        self.xmin, self.ymin = self.positions[0]
-        self.xmax, self.ymax = self.positions[0]
-        for x, y in islice(self.positions, 1, None):
-            self.xmin, self.xmax = min(self.xmin, x), max(self.xmax, x)
-            self.ymin, self.ymax = min(self.ymin, y), max(self.ymax, y)
+        self.xmin, self.ymin = positions.min(axis=0)
+        self.xmax, self.ymax = positions.max(axis=0)
         logger.debug(
             "Calculated limits (%f, %f) - (%f, %f)",
             self.xmin,
@@ -146,17 +300,29 @@ class MeshPlot(GraphicsObject):
 
     def changedColorScale(self):
         logger.debug("Changed color scale")
-        self.updateRGBData()
+        # Only the lookup table changes, the index of each color stays the same
+        self.lut[:LUT_SIZE] = self._LUTitem.gradient.getLookupTable(LUT_SIZE, alpha=True)
+        self.recolorCache()
+        self.update()
+
+    def colorIndex(self, data) -> np.ndarray:
+        """
+        Return the index into the lookup table of the color of each value in data, at
+        the current levels.
+        """
+        minr, maxr = self._LUTitem.getLevels()
+        data = np.asarray(data, dtype=np.float64)
+        scale = LUT_SIZE / (maxr - minr) if maxr != minr else 0
+        with np.errstate(invalid="ignore"):
+            scaled = np.clip((data - minr) * scale, 0, LUT_SIZE - 1)
+        return np.where(np.isnan(data), LUT_SIZE, scaled).astype(np.uint16)
 
     def updateRGBData(self):
         minr, maxr = self._LUTitem.getLevels()
         logger.debug("Recoloring to changed levels: (%f, %f)", minr, maxr)
         if self.data is not None:
-            scaled = (self.data - minr) / (maxr - minr)
-
-            logger.debug("Calculating new colors")
-            self.rgb_data = self._LUTitem.gradient.colorMap().map(scaled, mode="qcolor")
-            logger.debug("Done")
+            self.color_index = self.colorIndex(self.data)
+            self.recolorCache()
             self.update()
 
     ###
@@ -168,19 +334,188 @@ class MeshPlot(GraphicsObject):
         """
         raise NotImplementedError()
 
+    def invalidateCache(self):
+        """
+        Discard the rendered mesh, which is redrawn on the next paint. Must be called
+        whenever the polygons change.
+        """
+        self._idImage = None
+        self._cache = None
+        self._cachePixels = None
+
+    def recolorCache(self, region: tuple[slice, slice] | None = None):
+        """
+        Color the rendered mesh, or the given (rows, columns) region of its pixels,
+        through the lookup table. Must be called whenever the colors of the polygons
+        change.
+        """
+        if self._idImage is None or self.color_index is None:
+            return
+        ids = ndarray_from_qimage(self._idImage).view(np.uint32)[..., 0]
+        pixels = self._cachePixels
+        if region is not None:
+            ids, pixels = ids[region], pixels[region]
+
+        # Look up the ARGB color of each polygon. Pixels where no polygon was drawn
+        # use the last, transparent, entry.
+        lut = self.lut.astype(np.uint32)
+        argb = (lut[:, 3] << 24) | (lut[:, 0] << 16) | (lut[:, 1] << 8) | lut[:, 2]
+        count = len(self.color_index)
+        colors = argb[np.append(self.color_index, LUT_SIZE)]
+        ids = np.where(ids & ID_DRAWN, np.minimum(ids & ID_MASK, count), count)
+        pixels[...] = colors[ids]
+        # Wrap the pixels in a new image, so that no stale copy of them is drawn
+        self._cache = ndarray_to_qimage(self._cachePixels, QtGui.QImage.Format_ARGB32)
+
+    def indexPolygons(
+        self, bounds: np.ndarray | None = None, changed: np.ndarray | None = None
+    ):
+        """
+        Reindex the polygons when they are next drawn. Must be called whenever the
+        polygons change. The (xmin, ymin, xmax, ymax) bounds of each polygon are
+        calculated if not given. If the indices of the changed polygons are given, only
+        those polygons are redrawn into the rendered mesh, which is otherwise discarded.
+        """
+        self._polygonBounds = bounds
+        self.index = None
+        if changed is None or bounds is None:
+            self.invalidateCache()
+        else:
+            self.redrawPolygons(changed, bounds[changed])
+
+    def _buildIndex(self):
+        bounds = self._polygonBounds
+        if bounds is None:
+            bounds = np.empty((len(self.polygons), 4))
+            for i, (_, poly) in enumerate(self.polygons):
+                rect = poly.boundingRect()
+                bounds[i] = (rect.left(), rect.top(), rect.right(), rect.bottom())
+        self.index = GridIndex(bounds)
+
+    def drawPolygons(self, p, polygons):
+        """
+        Draw the polygons with the given indices, each filled with the index of its
+        data point (see ID_MASK)
+        """
+        p.setPen(mkPen(None))
+        fromRgba = QtGui.QColor.fromRgba
+        for i in np.asarray(polygons).tolist():
+            ind, poly = self.polygons[i]
+            p.setBrush(fromRgba(ID_DRAWN | int(ind)))
+            p.drawPolygon(poly)
+
+    def redrawPolygons(self, polygons: np.ndarray, bounds: np.ndarray):
+        """
+        Redraw the polygons with the given indices and (xmin, ymin, xmax, ymax) bounds
+        into the rendered mesh, and recolor the pixels they cover. The polygons must
+        cover at least the region that they covered before.
+        """
+        if self._idImage is None:
+            return
+        painter = QtGui.QPainter(self._idImage)
+        try:
+            painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+            painter.setTransform(self._cacheTransform)
+            self.drawPolygons(painter, polygons)
+        finally:
+            painter.end()
+
+        # Recolor only the pixels covered by the polygons
+        bounds = bounds[np.isfinite(bounds).all(axis=1)]
+        if not bounds.size:
+            return
+        xmin, ymin = bounds[:, :2].min(axis=0)
+        xmax, ymax = bounds[:, 2:].max(axis=0)
+        rect = self._cacheTransform.mapRect(
+            QtCore.QRectF(xmin, ymin, xmax - xmin, ymax - ymin)
+        )
+        rows = slice(max(0, int(rect.top()) - 1), max(0, int(rect.bottom()) + 2))
+        columns = slice(max(0, int(rect.left()) - 1), max(0, int(rect.right()) + 2))
+        self.recolorCache((rows, columns))
+
+    def renderCache(self, p, visible):
+        """
+        Render the region around the visible region into an image at the resolution of
+        the device being painted on.
+        """
+        transform = p.deviceTransform()
+        rect = visible.adjusted(
+            -CACHE_MARGIN * visible.width(),
+            -CACHE_MARGIN * visible.height(),
+            CACHE_MARGIN * visible.width(),
+            CACHE_MARGIN * visible.height(),
+        ).intersected(self.boundingRect())
+        ratio = p.device().devicePixelRatioF()
+        size = transform.mapRect(rect).size() * ratio
+        width = max(1, min(MAX_CACHE_SIZE, int(np.ceil(size.width()))))
+        height = max(1, min(MAX_CACHE_SIZE, int(np.ceil(size.height()))))
+        logger.debug("Rendering mesh into %dx%d cache", width, height)
+
+        if self.index is None:
+            self._buildIndex()
+        visible = rect.normalized()
+        polygons = self.index.query(
+            visible.left(), visible.top(), visible.right(), visible.bottom()
+        )
+
+        image = QtGui.QImage(width, height, QtGui.QImage.Format_ARGB32_Premultiplied)
+        image.fill(0)
+        painter = QtGui.QPainter(image)
+        try:
+            # Indices can't be blended, so polygons are drawn without antialiasing
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+            # Map item coordinates onto the image, such that drawing the image into
+            # rect puts each polygon back in place
+            painter.scale(width / rect.width(), height / rect.height())
+            painter.translate(-rect.left(), -rect.top())
+            self._cacheTransform = painter.transform()
+            self.drawPolygons(painter, polygons)
+        finally:
+            painter.end()
+
+        self._idImage = image
+        self._cachePixels = np.empty((height, width), dtype=np.uint32)
+        self.recolorCache()
+        self._cacheRect = rect
+        self._cacheScale = (
+            transform.m11(),
+            transform.m12(),
+            transform.m21(),
+            transform.m22(),
+            ratio,
+        )
+
     def paint(self, p, _options, _widget):
         logger.debug("Starting paint")
-        visible = self.parentItem().boundingRect()
-        if self.polygons is not None and self.polygons and self.rgb_data is not None:
-            p.setPen(mkPen(None))
-            for poly in self.polygons:  # pylint: disable=not-an-iterable
-                if not poly[1].boundingRect().intersects(visible):
-                    continue
-                p.setBrush(self.rgb_data[poly[0]])
-                p.drawPolygon(poly[1])
-            logger.debug("Done painting")
-        else:
+        if not self.polygons or self.color_index is None:
             logger.debug("No polygons to draw")
+            return
+        view = self.viewRect()
+        if view is None:
+            logger.debug("Not in a view")
+            return
+        visible = view.intersected(self.boundingRect())
+        if visible.width() <= 0 or visible.height() <= 0:
+            return
+
+        # Redraw the mesh only if the scale changed, or we panned outside the cache.
+        # Panning may change the scale by rounding error, which is ignored.
+        transform = p.deviceTransform()
+        scale = (
+            transform.m11(),
+            transform.m12(),
+            transform.m21(),
+            transform.m22(),
+            p.device().devicePixelRatioF(),
+        )
+        if (
+            self._cache is None
+            or not np.allclose(scale, self._cacheScale, rtol=1e-6, atol=0)
+            or not self._cacheRect.contains(visible)
+        ):
+            self.renderCache(p, visible)
+        p.drawImage(self._cacheRect, self._cache)
+        logger.debug("Done painting")
 
     def parentChanged(self):
         super().parentChanged()
@@ -1,7 +1,9 @@
 from functools import partial
 
 import numpy as np
+import pyqtgraph
 from pyqtgraph import PlotDataItem, mkColor
+from pyqtgraph.graphicsItems.PlotDataItem import PlotDataset
 from Qt import QtGui, QtWidgets
 
 from ...logging import get_logger
@@ -9,6 +11,117 @@ from .DataItem import ExtendedDataItem
 
 logger = get_logger("PlotDataItem")
 
+# Decimation of traces by ExtendedPlotDataItem overrides private parts of pyqtgraph's
+# PlotDataItem (_getDisplayDataset, _dataset, _datasetDisplay and opts), which may change
+# between releases. It is only used with the releases it was written against, and
+# traces are drawn by pyqtgraph as usual otherwise.
+DECIMATION_VERSIONS = ((0, 14), (0, 15))
+
+
+def _decimation_supported(version):
+    try:
+        release = tuple(int(part) for part in version.split(".")[:2])
+    except ValueError:
+        return False
+    return DECIMATION_VERSIONS[0] <= release < DECIMATION_VERSIONS[1]
+
+
+DECIMATION_SUPPORTED = _decimation_supported(pyqtgraph.__version__)
+
+
+class MinMaxPyramid:
+    """
+    Multi-resolution summary of a trace, used to draw long traces with a bounded
+    number of points. Level k holds the min and max of consecutive blocks of
+    factor**k points, and is updated incrementally as points are appended.
+    """
+
+    factor = 4
+
+    def __init__(self):
+        self.x = None
+        self.y = None
+        self.length = 0
+        self.increasing = True
+        # Buffers holding mins and maxs of each level, and the length used
+        self._mins: list[np.ndarray] = []
+        self._maxs: list[np.ndarray] = []
+        self._lengths: list[int] = []
+
+    def extend(self, x, y, start):
+        """
+        Update the pyramid for the trace x, y, where points from start onwards are new.
+        """
+        if start == 0 or start > self.length:
+            start = 0
+            self.increasing = True
+            self._lengths = [0] * len(self._lengths)
+        self.x, self.y = x, y
+        self.length = length = len(y)
+
+        # Check whether x is still sorted, which is needed to find the visible region
+        if self.increasing and length > start:
+            new_x = x[max(start - 1, 0) : length]
+            self.increasing = bool(np.all(new_x[1:] >= new_x[:-1]))
+
+        # Recompute the blocks that contain new points at each level
+        lower_mins, lower_maxs = y, y
+        level = 0
+        while length > 1:
+            first = start // self.factor
+            count = -(-length // self.factor)
+            if level == len(self._mins):
+                self._mins.append(np.empty(count, dtype=np.float64))
+                self._maxs.append(np.empty(count, dtype=np.float64))
+                self._lengths.append(0)
+            elif count > len(self._mins[level]):
+                capacity = max(count, 2 * len(self._mins[level]))
+                for buffers in (self._mins, self._maxs):
+                    buffer = np.empty(capacity, dtype=np.float64)
+                    buffer[: self._lengths[level]] = buffers[level][
+                        : self._lengths[level]
+                    ]
+                    buffers[level] = buffer
+            indices = np.arange(0, length - first * self.factor, self.factor)
+            mins, maxs = self._mins[level], self._maxs[level]
+            mins[first:count] = np.fmin.reduceat(
+                lower_mins[first * self.factor : length], indices
+            )
+            maxs[first:count] = np.fmax.reduceat(
+                lower_maxs[first * self.factor : length], indices
+            )
+            self._lengths[level] = count
+
+            lower_mins, lower_maxs = mins, maxs
+            start, length = first, count
+            level += 1
+        del self._mins[level:], self._maxs[level:], self._lengths[level:]
+
+    def decimate(self, xmin, xmax, npoints):
+        """
+        Return at most about 2 * npoints points covering the range xmin to xmax. Each
+        block of points is replaced by its max and min, so peaks are preserved. Zoomed
+        in far enough, the original points are returned.
+        """
+        start = int(np.searchsorted(self.x[: self.length], xmin, side="left")) - 1
+        stop = int(np.searchsorted(self.x[: self.length], xmax, side="right")) + 1
+        start, stop = max(start, 0), min(stop, self.length)
+
+        # Find the finest level with few enough blocks
+        level, block = 0, 1
+        while (stop - start) / block > npoints and level < len(self._mins):
+            level += 1
+            block *= self.factor
+        if level == 0:
+            return self.x[start:stop], self.y[start:stop]
+
+        first, last = start // block, -(-stop // block)
+        x = np.repeat(self.x[first * block : last * block : block], 2)
+        y = np.empty(2 * (last - first), dtype=np.float64)
+        y[0::2] = self._maxs[level - 1][first:last]
+        y[1::2] = self._mins[level - 1][first:last]
+        return x, y
+
 
 class ExtendedPlotDataItem(ExtendedDataItem, PlotDataItem):
     def __init__(self, *args, **kwargs):
@@ -28,6 +141,18 @@ class ExtendedPlotDataItem(ExtendedDataItem, PlotDataItem):
         # Store x-setpoint, since we may add nan values back in
         self.setpoint_x = tuple()
 
+        # Buffers that are grown in place by extendData
+        self._xBuffer = None
+        self._yBuffer = None
+        self._bufferLength = 0
+        self._bufferDataset = None
+
+        # Min/max pyramid used to decimate long traces
+        self._decimate = DECIMATION_SUPPORTED
+        self._pyramid = MinMaxPyramid()
+        self._pyramidDataset = None
+        self._pyramidPending = False
+
     def getContextMenus(self, *, rect=None, event=None):
         if self.menu is None:
             self.menu = QtWidgets.QMenu()
@@ -58,6 +183,16 @@ class ExtendedPlotDataItem(ExtendedDataItem, PlotDataItem):
     def colorSelected(self, color):
         self.setPen(color)
 
+    def setData(self, *args, **kwargs):
+        """
+        Set the data of the trace. If x values are given, they become the setpoints used
+        by update.
+        """
+        x = kwargs.get("x", args[0] if len(args) == 2 else None)
+        if x is not None:
+            self.setpoint_x = np.asarray(x)
+        super().setData(*args, **kwargs)
+
     def update(self, yData, *args, **kwargs):
         # Filter out nan values, due to https://github.com/pyqtgraph/pyqtgraph/issues/1057
         if not isinstance(yData, np.ndarray):
@@ -76,8 +211,135 @@ class ExtendedPlotDataItem(ExtendedDataItem, PlotDataItem):
             connect = np.ones_like(xData, dtype=np.int32)
             connect[dontconnect] = 0
 
-        # Update data
-        self.setData(x=xData, y=yData, connect=connect, *args, **kwargs)
+        # Update data, leaving the setpoints in place
+        super().setData(x=xData, y=yData, connect=connect, *args, **kwargs)
+
+    def extendData(self, xData, yData, *args, **kwargs):
+        """
+        Append points to the end of the trace. Points are stored in buffers that grow
+        geometrically, so that only new points need to be sent when a trace is
+        updated during a sweep.
+        """
+        xData = np.asarray(xData, dtype=np.float64)
+        yData = np.asarray(yData, dtype=np.float64)
+        if len(xData) != len(yData):
+            raise ValueError(
+                f"Length of x ({len(xData)}) and y ({len(yData)}) data must match"
+            )
+
+        # If the data was replaced since the last extend, start again from
+        # whatever is currently plotted.
+        if self._dataset is not self._bufferDataset:
+            self._xBuffer = self._yBuffer = None
+            self._bufferLength = 0
+            xCurrent, yCurrent = self.getOriginalDataset()
+            if xCurrent is not None and yCurrent is not None and len(yCurrent):
+                xData = np.concatenate((xCurrent, xData))
+                yData = np.concatenate((yCurrent, yData))
+
+        start = self._bufferLength
+        length = start + len(yData)
+        if self._xBuffer is None or length > len(self._xBuffer):
+            capacity = max(64, length, 2 * self._bufferLength)
+            xBuffer = np.empty(capacity, dtype=np.float64)
+            yBuffer = np.empty(capacity, dtype=np.float64)
+            if self._xBuffer is not None:
+                xBuffer[: self._bufferLength] = self._xBuffer[: self._bufferLength]
+                yBuffer[: self._bufferLength] = self._yBuffer[: self._bufferLength]
+            self._xBuffer, self._yBuffer = xBuffer, yBuffer
+        self._xBuffer[self._bufferLength : length] = xData
+        self._yBuffer[self._bufferLength : length] = yData
+        self._bufferLength = length
+
+        # Update the pyramid with only the new points. It is picked up by the
+        # dataset created in setData.
+        self._pyramid.extend(self._xBuffer[:length], self._yBuffer[:length], start)
+        self._pyramidPending = True
+        super().setData(
+            x=self._xBuffer[:length], y=self._yBuffer[:length], *args, **kwargs
+        )
+        self._bufferDataset = self._pyramidDataset = self._dataset
+        self._pyramidPending = False
+
+    def setDecimation(self, enabled=True):
+        """
+        Enable or disable decimation of long traces. When enabled, traces are drawn with
+        about two points per pixel of the view, keeping the min and max of each
+        block of points. The clipToView and autoDownsample options of pyqtgraph are
+        ignored for decimated traces, so disable decimation to use them instead.
+
+        Decimation can't be enabled with versions of pyqtgraph other than those in
+        DECIMATION_VERSIONS.
+        """
+        if not DECIMATION_SUPPORTED:
+            if enabled:
+                logger.warning(
+                    "Decimation isn't supported with pyqtgraph %s", pyqtgraph.__version__
+                )
+            return
+        self._decimate = bool(enabled)
+        self._datasetDisplay = None
+        self.updateItems(styleUpdate=False)
+
+    def _decimationPyramid(self):
+        """
+        Return the pyramid for the current data if it can be decimated, otherwise None.
+        """
+        if not getattr(self, "_decimate", False) or self._dataset is None:
+            return None
+        opts = self.opts
+        if (
+            opts["fftMode"]
+            or opts["derivativeMode"]
+            or opts["phasemapMode"]
+            or opts["subtractMeanMode"]
+            or True in opts["logMode"]
+            or isinstance(opts["connect"], np.ndarray)
+        ):
+            return None
+        if self._pyramidDataset is not self._dataset:
+            if not self._pyramidPending:
+                self._pyramid.extend(self._dataset.x, self._dataset.y, 0)
+            self._pyramidDataset = self._dataset
+            self._pyramidPending = False
+        if not self._pyramid.increasing:
+            return None
+        return self._pyramid
+
+    # The overrides below fall back to pyqtgraph unless the trace is being decimated,
+    # which is never the case with unsupported versions of pyqtgraph
+    def _getDisplayDataset(self):
+        pyramid = self._decimationPyramid()
+        view = self.getViewBox()
+        if pyramid is None or view is None or view.width() <= 0:
+            return super()._getDisplayDataset()
+
+        # Reuse the decimated data unless the view has moved
+        if self._datasetDisplay is not None and not self.property(
+            "xViewRangeWasChanged"
+        ):
+            return self._datasetDisplay
+
+        if view.autoRangeEnabled()[0]:
+            # Draw everything, so that the view can scale to the full data range
+            xmin, xmax = -np.inf, np.inf
+        else:
+            view_range = view.viewRect()
+            xmin, xmax = view_range.left(), view_range.right()
+        x, y = pyramid.decimate(xmin, xmax, int(view.width()))
+        self._datasetDisplay = PlotDataset(x, y)
+        self.setProperty("xViewRangeWasChanged", False)
+        self.setProperty("yViewRangeWasChanged", False)
+        return self._datasetDisplay
+
+    def viewRangeChanged(self, vb=None, ranges=None, changed=None):
+        if (changed is None or changed[0]) and self._decimationPyramid() is not None:
+            # Redecimate for the new view range
+            self.setProperty("xViewRangeWasChanged", True)
+            self._datasetDisplay = None
+            self.updateItems(styleUpdate=False)
+            return
+        super().viewRangeChanged(vb, ranges, changed)
 
     def setName(self, name):
         self.opts["name"] = str(name)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pyqtgraph import GraphicsLayoutWidget
 from pyqtgraph.exporters import ImageExporter, SVGExporter
@@ -11,9 +11,13 @@ logger = get_logger("PlotWindow")
 
 class ExtendedPlotWindow(GraphicsLayoutWidget):
     _windows: List["ExtendedPlotWindow"] = []
+    # Client of the plot server whose request is being handled, or 0 outside a plot
+    # server (see plot.server). Windows belong to the client that created them.
+    currentClient: int = 0
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.client: Optional[int] = self.currentClient
         self._windows.append(self)
 
     def export(self, fname, export_type="image"):
@@ -43,4 +47,17 @@ class ExtendedPlotWindow(GraphicsLayoutWidget):
 
     @classmethod
     def getWindows(cls):
-        return cls._windows
+        """
+        Return the open windows that belong to the current client
+        """
+        return [win for win in cls._windows if win.client == cls.currentClient]
+
+    @classmethod
+    def orphanWindows(cls, client):
+        """
+        Detach the windows of a plot server client that has disconnected. They stay
+        open, but are no longer returned to any client by getWindows.
+        """
+        for win in cls._windows:
+            if win.client == client:
+                win.client = None
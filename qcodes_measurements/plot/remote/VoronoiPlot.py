@@ -1,23 +1,147 @@
-import struct
-
+import numpy as np
 import scipy.spatial as spatial
-from Qt import QtCore, QtGui
+from Qt import QtGui
 
 from ...logging import get_logger
 from .DataItem import ExtendedDataItem
-from .MeshPlot import MeshPlot
+from .MeshPlot import MeshPlot, read_polygons
 
 logger = get_logger("VoronoiPlot")
 
+# Fraction of the extent of the points by which the plot extends past the outermost
+# points. Cells on the edge of the plot are clipped to this boundary.
+BOUNDARY_MARGIN = 0.05
+# Radius of the triangle of points that encloses the data, relative to the size of
+# the plot. These points ensure that the cells of every point in the plot are finite.
+FRAME_SCALE = 10
+FRAME_POINTS = 3
+# Number of nearest points around each new point from which cells are recalculated
+# in incremental mode. This is increased until the recalculated cells are exact.
+LOCAL_POINTS = 32
+MAX_LOCAL_POINTS = 4096
+# Number of points that are added before the search tree is rebuilt
+TREE_REBUILD = 512
+
 
 class VoronoiPlot(ExtendedDataItem, MeshPlot):
-    def __init__(self, *args, positions=None, data=None, colormap=None, **kwargs):
-        super().__init__(
-            *args, positions=positions, data=data, colormap=colormap, **kwargs
+    def __init__(
+        self,
+        *args,
+        positions=None,
+        data=None,
+        colormap=None,
+        incremental=False,
+        **kwargs,
+    ):
+        super().__init__(*args, colormap=colormap, **kwargs)
+
+        # In incremental mode, a search tree over the points is kept, so that only the
+        # cells around added points are recalculated.
+        self.incremental = incremental
+        self._tree: spatial.cKDTree | None = None
+        self._treeSize = 0
+        # Frame points followed by the points in the plot, and the center and radius
+        # of the frame
+        self._points = np.empty((0, 2))
+        self._frame: tuple[float, float, float] | None = None
+        # Extent of the points, and bounds of each polygon
+        self._extent: tuple[float, float, float, float] | None = None
+        self._bounds = np.empty((0, 4))
+        # Unclipped vertices of the cells that are clipped to the boundary of the plot
+        self._clipped: dict[int, np.ndarray] = {}
+
+        if positions is not None and data is not None:
+            self.positions, self.data = self._validate(positions, data)
+            self.calc_lims()
+            self.updateRGBData()
+            self.calculate_polygons()
+        elif not (positions is None and data is None):
+            raise ValueError(
+                "Either positions and data must both be given, or neither."
+            )
+
+    @staticmethod
+    def _validate(positions, data):
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        data = np.asarray(data, dtype=np.float64).reshape(-1)
+        if positions.shape[0] != data.size:
+            raise ValueError(
+                f"Got {positions.shape[0]} positions for {data.size} data points."
+            )
+        return positions, data
+
+    ###
+    # Function related to plot data
+    def setData(self, positions, data):
+        super().setData(*self._validate(positions, data))
+
+    def addPoints(self, positions, data):
+        """
+        Add points to the plot. In incremental mode, only the cells around the new
+        points are recalculated and redrawn.
+        """
+        positions, data = self._validate(positions, data)
+        if not data.size:
+            return
+        if self.positions is None or not len(self.positions):
+            self.setData(positions, data)
+            return
+        first = len(self.positions)
+        self.positions = np.concatenate((self.positions, positions))
+        self.data = np.concatenate((self.data, data))
+        self.color_index = np.concatenate((self.color_index, self.colorIndex(data)))
+
+        # Extend the plot to cover the new points
+        lims = (self.xmin, self.ymin, self.xmax, self.ymax)
+        xmin, ymin, xmax, ymax = self._extent
+        self._extent = (
+            min(xmin, positions[:, 0].min()),
+            min(ymin, positions[:, 1].min()),
+            max(xmax, positions[:, 0].max()),
+            max(ymax, positions[:, 1].max()),
         )
+        self._pad_lims()
+        resized = lims != (self.xmin, self.ymin, self.xmax, self.ymax)
+        if resized:
+            self.prepareGeometryChange()
 
-        # Reserve spot for voronoi
-        self.voronoi = None
+        if (
+            self._tree is None
+            or not self._in_frame(positions)
+            or not self._add_cells(first, resized)
+        ):
+            self.calculate_polygons()
+
+        # The levels and so all colors change if the histogram is autoranged
+        self.updateHistogram(data)
+        if resized:
+            self.getViewBox().itemBoundsChanged(self)
+        self.update()
+
+    ###
+    # Functions relating to the size of the image
+    def calc_lims(self):
+        super().calc_lims()
+        self._extent = (self.xmin, self.ymin, self.xmax, self.ymax)
+        self._pad_lims()
+
+    def _pad_lims(self):
+        """
+        Extend the limits of the plot past the outermost points by the margin.
+        """
+        xmin, ymin, xmax, ymax = self._extent
+        margin = BOUNDARY_MARGIN * (max(xmax - xmin, ymax - ymin) or 1)
+        self.xmin, self.ymin = xmin - margin, ymin - margin
+        self.xmax, self.ymax = xmax + margin, ymax + margin
+
+    def _in_frame(self, positions):
+        """
+        Check that the points lie well within the frame, such that their cells are
+        finite and unaffected by the frame.
+        """
+        x, y, radius = self._frame
+        distance = np.hypot(positions[:, 0] - x, positions[:, 1] - y)
+        return distance.max() < radius / 4
 
     ###
     # Functions relating to drawing
@@ -27,33 +151,166 @@ class VoronoiPlot(ExtendedDataItem, MeshPlot):
         Convert the raw data into a voronoi plot
         """
         logger.debug("Generating voronoi graph")
-        if self.positions is not None and len(self.positions) > 2:
-            self.voronoi = spatial.Voronoi(self.positions)
-        else:
+        if self.positions is None or not len(self.positions):
             return
 
-        # Then generate a list of polygons for finite regions
+        # Enclose the points in a triangle, so that every cell is finite
+        x, y = (self.xmin + self.xmax) / 2, (self.ymin + self.ymax) / 2
+        radius = FRAME_SCALE * max(self.width(), self.height())
+        angles = np.pi / 2 + np.arange(FRAME_POINTS) * 2 * np.pi / FRAME_POINTS
+        frame = np.stack((x + radius * np.cos(angles), y + radius * np.sin(angles)), 1)
+        self._frame = (x, y, radius)
+        self._points = np.concatenate((frame, self.positions))
+        voronoi = spatial.Voronoi(self._points)
+
+        # Then generate a list of polygons for each point
         logger.debug("Generating Polygons")
-        self.polygons.clear()
-        for ind, p in enumerate(self.voronoi.point_region):
-            p_vertices = self.voronoi.regions[p]
-            n_vertices = len(p_vertices)
-            buf = bytearray(4 + n_vertices * 16)
-            struct.pack_into(">i", buf, 0, n_vertices)
-            for i, point in enumerate(p_vertices):
-                if point == -1:
-                    break
-                point = self.voronoi.vertices[point]
-                struct.pack_into(">2d", buf, 4 + i * 16, point[0], point[1])
-            else:
-                ds = QtCore.QDataStream(QtCore.QByteArray(buf))
-                poly = QtGui.QPolygonF()
-                ds >> poly  # pylint: disable=pointless-statement
-                self.polygons.append((ind, poly))
-
-        logger.debug("Clearing Voronoi")
-        # Clear the voronoi
-        del self.voronoi
-        self.voronoi = None
+        count = len(self.positions)
+        self.polygons[:] = [(ind, QtGui.QPolygonF()) for ind in range(count)]
+        self._bounds = np.full((count, 4), np.nan)
+        self._clipped.clear()
+        self._set_cells(
+            (ind, self._cell(voronoi, ind + FRAME_POINTS)) for ind in range(count)
+        )
+        self.indexPolygons(self._bounds)
 
+        if self.incremental:
+            self._tree = spatial.cKDTree(self._points)
+            self._treeSize = len(self._points)
+        else:
+            self._tree = None
         logger.info("Done")
+
+    @staticmethod
+    def _cell(voronoi, point):
+        """
+        Return the vertices of the cell of a point, or None if the point has no cell,
+        which is the case for duplicate points.
+        """
+        region = voronoi.point_region[point]
+        if region == -1 or not voronoi.regions[region]:
+            return None
+        return voronoi.vertices[voronoi.regions[region]]
+
+    def _add_cells(self, first, resized) -> bool:
+        """
+        Recalculate the cells changed by adding the points from index first onwards.
+        If the plot was resized, cells on the boundary are clipped again. Returns False
+        if the cells couldn't be recalculated locally.
+        """
+        count = len(self.positions)
+        self._points = np.concatenate((self._points, self.positions[first:]))
+        new = np.arange(first, count) + FRAME_POINTS
+
+        local = LOCAL_POINTS
+        cells = self._local_cells(new, local)
+        while cells is None:
+            local *= 2
+            if local > MAX_LOCAL_POINTS:
+                return False
+            cells = self._local_cells(new, local)
+        logger.debug("Recalculating %d cells", len(cells))
+
+        if resized:
+            cells = {**self._clipped, **cells}
+        self.polygons.extend((ind, QtGui.QPolygonF()) for ind in range(first, count))
+        self._bounds = np.concatenate(
+            (self._bounds, np.full((count - first, 4), np.nan))
+        )
+        self._set_cells(cells.items())
+        # Cells on the boundary are clipped differently once the plot is resized, so
+        # the whole mesh is redrawn
+        self.indexPolygons(
+            self._bounds, None if resized else np.fromiter(cells, dtype=np.intp)
+        )
+
+        if len(self._points) - self._treeSize > TREE_REBUILD:
+            self._tree = spatial.cKDTree(self._points)
+            self._treeSize = len(self._points)
+        return True
+
+    def _local_cells(self, new, local):
+        """
+        Calculate the cells of the new points and their neighbours from the voronoi of
+        the given number of nearest points around each new point. Returns a dict of
+        cell vertices, or None if the surrounding points weren't enough to find the
+        cells exactly.
+        """
+        # Points added since the tree was built are searched directly
+        distance, nearest = self._tree.query(self._points[new], local)
+        pending = np.arange(self._treeSize, len(self._points))
+        close = spatial.distance.cdist(self._points[new], self._points[pending])
+        close = pending[(close <= distance[:, -1:]).any(axis=0)]
+        points = np.unique(
+            np.concatenate(
+                (np.arange(FRAME_POINTS), nearest[nearest < self._treeSize], close)
+            )
+        )
+        voronoi = spatial.Voronoi(self._points[points])
+
+        # A new point only changes the cells that share an edge with it
+        ridges = voronoi.ridge_points
+        ridges = ridges[np.isin(ridges, np.searchsorted(points, new)).any(axis=1)]
+        changed = np.union1d(points[ridges.ravel()], new)
+        changed = changed[changed >= FRAME_POINTS]
+
+        cells = {}
+        vertices = []
+        owners = []
+        for point in changed:
+            cell = self._cell(voronoi, np.searchsorted(points, point))
+            if cell is not None:
+                vertices.append(cell)
+                owners.append(np.broadcast_to(self._points[point], cell.shape))
+            cells[point - FRAME_POINTS] = cell
+        if not vertices:
+            return cells
+
+        # The cells are exact if no point is closer to their vertices than the point
+        # that owns them
+        vertices = np.concatenate(vertices)
+        owners = np.concatenate(owners)
+        distance, _ = self._tree.query(vertices)
+        if pending.size:
+            distance = np.minimum(
+                distance,
+                spatial.distance.cdist(vertices, self._points[pending]).min(axis=1),
+            )
+        tolerance = 1e-9 * self._frame[2]
+        if (distance < np.hypot(*(vertices - owners).T) - tolerance).any():
+            return None
+        return cells
+
+    def _set_cells(self, cells):
+        """
+        Set the polygons of the given (index, vertices) cells, clipping them to the
+        boundary of the plot.
+        """
+        boundary = QtGui.QPolygonF(self.boundingRect())
+        lower = np.array((self.xmin, self.ymin))
+        upper = np.array((self.xmax, self.ymax))
+
+        # Serialize the vertices of all cells for QDataStream
+        found = []
+        buf = []
+        for ind, vertices in cells:
+            self._clipped.pop(ind, None)
+            if vertices is None:
+                self.polygons[ind] = (ind, QtGui.QPolygonF())
+                self._bounds[ind] = np.nan
+                continue
+            found.append((ind, vertices))
+            buf.append(np.array(len(vertices), dtype=">i4").tobytes())
+            buf.append(vertices.astype(">f8").tobytes())
+
+        polygons = read_polygons(b"".join(buf), len(found))
+        for (ind, vertices), poly in zip(found, polygons):
+            vmin, vmax = vertices.min(axis=0), vertices.max(axis=0)
+            if (vmin < lower).any() or (vmax > upper).any():
+                self._clipped[ind] = vertices
+                poly = poly.intersected(boundary)
+                rect = poly.boundingRect()
+                vmin, vmax = (rect.left(), rect.top()), (rect.right(), rect.bottom())
+            self.polygons[ind] = (ind, poly)
+            self._bounds[ind, :2] = vmin
+            self._bounds[ind, 2:] = vmax
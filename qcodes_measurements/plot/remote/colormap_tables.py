@@ -0,0 +1,518 @@
+# Generated by `python -m qcodes_measurements.plot.remote.colors`. Do not edit.
+# The colors of each colormap, as packed 8-bit RGB triples.
+
+TABLES = {
+    "magma": (
+        b'\x00\x00\x03\x00\x00\x04\x00\x00\x06\x01\x00\x07\x01\x01\t\x01\x01\x0b\x02\x02\r\x02\x02\x0f'
+        b'\x03\x03\x11\x04\x03\x13\x04\x04\x15\x05\x04\x17\x06\x05\x19\x07\x05\x1b\x08\x06\x1d\t\x07\x1f'
+        b'\n\x07"\x0b\x08$\x0c\t&\r\n(\x0e\n*\x0f\x0b,\x10\x0c/\x11\x0c1'
+        b'\x12\r3\x14\r5\x15\x0e8\x16\x0e:\x17\x0f<\x18\x0f?\x1a\x10A\x1b\x10D'
+        b'\x1c\x10F\x1e\x10I\x1f\x11K \x11M"\x11P#\x11R%\x11U&\x11W'
+        b'(\x11Y*\x11\\+\x11^-\x10`/\x10b0\x10e2\x10g4\x10h'
+        b'5\x0fj7\x0fl9\x0fn;\x0fo<\x0fq>\x0fr@\x0fsB\x0ft'
+        b'C\x0fuE\x0fvG\x0fwH\x10xJ\x10yK\x10yM\x11zO\x11{'
+        b'P\x12{R\x12|S\x13|U\x13}W\x14}X\x15~Z\x15~[\x16~'
+        b']\x17~^\x17\x7f`\x18\x7fa\x18\x7fc\x19\x7fe\x1a\x80f\x1a\x80h\x1b\x80'
+        b'i\x1c\x80k\x1c\x80l\x1d\x80n\x1e\x81o\x1e\x81q\x1f\x81s\x1f\x81t \x81'
+        b'v!\x81w!\x81y"\x81z"\x81|#\x81~$\x81\x7f$\x81\x81%\x81'
+        b"\x82%\x81\x84&\x81\x85&\x81\x87'\x81\x89(\x81\x8a(\x81\x8c)\x80\x8d)\x80"
+        b'\x8f*\x80\x91*\x80\x92+\x80\x94+\x80\x95,\x80\x97,\x7f\x99-\x7f\x9a-\x7f'
+        b'\x9c.\x7f\x9e.~\x9f/~\xa1/~\xa30~\xa40}\xa61}\xa71}'
+        b'\xa92|\xab3|\xac3{\xae4{\xb04{\xb15z\xb35z\xb56y'
+        b'\xb66y\xb87x\xb97x\xbb8w\xbd9w\xbe9v\xc0:u\xc2:u'
+        b'\xc3;t\xc5<t\xc6<s\xc8=r\xca>r\xcb>q\xcd?p\xce@p'
+        b'\xd0Ao\xd1Bn\xd3Bm\xd4Cm\xd6Dl\xd7Ek\xd9Fj\xdaGi'
+        b'\xdcHi\xddIh\xdeJg\xe0Kf\xe1Lf\xe2Me\xe4Nd\xe5Pc'
+        b'\xe6Qb\xe7Rb\xe8Ta\xeaU`\xebV`\xecX_\xedY_\xee[^'
+        b'\xee]]\xef^]\xf0`]\xf1a\\\xf2c\\\xf3e\\\xf3g[\xf4h['
+        b'\xf5j[\xf5l[\xf6n[\xf6p[\xf7q[\xf7s\\\xf8u\\\xf8w\\'
+        b'\xf9y\\\xf9{]\xf9}]\xfa\x7f^\xfa\x80^\xfa\x82_\xfb\x84`\xfb\x86`'
+        b'\xfb\x88a\xfb\x8ab\xfc\x8cc\xfc\x8ec\xfc\x90d\xfc\x92e\xfc\x93f\xfd\x95g'
+        b'\xfd\x97h\xfd\x99i\xfd\x9bj\xfd\x9dk\xfd\x9fl\xfd\xa1n\xfd\xa2o\xfd\xa4p'
+        b'\xfe\xa6q\xfe\xa8s\xfe\xaat\xfe\xacu\xfe\xaev\xfe\xafx\xfe\xb1y\xfe\xb3{'
+        b'\xfe\xb5|\xfe\xb7}\xfe\xb9\x7f\xfe\xbb\x80\xfe\xbc\x82\xfe\xbe\x83\xfe\xc0\x85\xfe\xc2\x86'
+        b'\xfe\xc4\x88\xfe\xc6\x89\xfe\xc7\x8b\xfe\xc9\x8d\xfe\xcb\x8e\xfd\xcd\x90\xfd\xcf\x92\xfd\xd1\x93'
+        b'\xfd\xd2\x95\xfd\xd4\x97\xfd\xd6\x98\xfd\xd8\x9a\xfd\xda\x9c\xfd\xdc\x9d\xfd\xdd\x9f\xfd\xdf\xa1'
+        b'\xfd\xe1\xa3\xfc\xe3\xa5\xfc\xe5\xa6\xfc\xe6\xa8\xfc\xe8\xaa\xfc\xea\xac\xfc\xec\xae\xfc\xee\xb0'
+        b'\xfc\xf0\xb1\xfc\xf1\xb3\xfc\xf3\xb5\xfc\xf5\xb7\xfb\xf7\xb9\xfb\xf9\xbb\xfb\xfa\xbd\xfb\xfc\xbf'
+    ),
+    "inferno": (
+        b'\x00\x00\x03\x00\x00\x04\x00\x00\x06\x01\x00\x07\x01\x01\t\x01\x01\x0b\x02\x01\x0e\x02\x02\x10'
+        b'\x03\x02\x12\x04\x03\x14\x04\x03\x16\x05\x04\x18\x06\x04\x1b\x07\x05\x1d\x08\x06\x1f\t\x06!'
+        b'\n\x07#\x0b\x07&\r\x08(\x0e\x08*\x0f\t-\x10\t/\x12\n2\x13\n4'
+        b'\x14\x0b6\x16\x0b9\x17\x0b;\x19\x0b>\x1a\x0b@\x1c\x0cC\x1d\x0cE\x1f\x0cG'
+        b' \x0cJ"\x0bL$\x0bN&\x0bP\'\x0bR)\x0bT+\nV-\nX'
+        b'.\nZ0\n\\2\t]4\t_5\t`7\ta9\tb;\td'
+        b'<\te>\tf@\tfA\tgC\nhE\niF\niH\x0bj'
+        b'J\x0bjK\x0ckM\x0ckO\rlP\rlR\x0elS\x0emU\x0fm'
+        b'W\x0fmX\x10mZ\x11m[\x11n]\x12n_\x12n`\x13nb\x14n'
+        b'c\x14ne\x15nf\x15nh\x16nj\x17nk\x17nm\x18nn\x18n'
+        b'p\x19nr\x19ms\x1amu\x1bmv\x1bmx\x1cmz\x1cm{\x1dl'
+        b'}\x1dl~\x1el\x80\x1fk\x81\x1fk\x83 k\x85 j\x86!j\x88!j'
+        b'\x89"i\x8b"i\x8d#i\x8e$h\x90$h\x91%g\x93%g\x95&f'
+        b"\x96&f\x98'e\x99(d\x9b(d\x9c)c\x9e)c\xa0*b\xa1+a"
+        b'\xa3+a\xa4,`\xa6,_\xa7-_\xa9.^\xab.]\xac/\\\xae0['
+        b'\xaf1[\xb11Z\xb22Y\xb43X\xb53W\xb74V\xb85V\xba6U'
+        b'\xbb7T\xbd7S\xbe8R\xbf9Q\xc1:P\xc2;O\xc4<N\xc5=M'
+        b'\xc7>L\xc8>K\xc9?J\xcb@I\xccAH\xcdBG\xcfDF\xd0ED'
+        b'\xd1FC\xd2GB\xd4HA\xd5I@\xd6J?\xd7K>\xd9M=\xdaN;'
+        b'\xdbO:\xdcP9\xddR8\xdeS7\xdfT6\xe0V4\xe2W3\xe3X2'
+        b'\xe4Z1\xe5[0\xe6\\.\xe6^-\xe7_,\xe8a+\xe9b*\xead('
+        b'\xebe\'\xecg&\xedh%\xedj#\xeel"\xefm!\xf0o\x1f\xf0p\x1e'
+        b'\xf1r\x1d\xf2t\x1c\xf2u\x1a\xf3w\x19\xf3y\x18\xf4z\x16\xf5|\x15\xf5~\x14'
+        b'\xf6\x80\x12\xf6\x81\x11\xf7\x83\x10\xf7\x85\x0e\xf8\x87\r\xf8\x88\x0c\xf8\x8a\x0b\xf9\x8c\t'
+        b'\xf9\x8e\x08\xf9\x90\x08\xfa\x91\x07\xfa\x93\x06\xfa\x95\x06\xfa\x97\x06\xfb\x99\x06\xfb\x9b\x06'
+        b'\xfb\x9d\x06\xfb\x9e\x07\xfb\xa0\x07\xfb\xa2\x08\xfb\xa4\n\xfb\xa6\x0b\xfb\xa8\r\xfb\xaa\x0e'
+        b'\xfb\xac\x10\xfb\xae\x12\xfb\xb0\x14\xfb\xb1\x16\xfb\xb3\x18\xfb\xb5\x1a\xfb\xb7\x1c\xfb\xb9\x1e'
+        b'\xfa\xbb!\xfa\xbd#\xfa\xbf%\xfa\xc1(\xf9\xc3*\xf9\xc5,\xf9\xc7/\xf8\xc91'
+        b'\xf8\xcb4\xf8\xcd7\xf7\xcf:\xf7\xd1<\xf6\xd3?\xf6\xd5B\xf5\xd7E\xf5\xd9H'
+        b'\xf4\xdbK\xf4\xdcO\xf3\xdeR\xf3\xe0V\xf3\xe2Y\xf2\xe4]\xf2\xe6`\xf1\xe8d'
+        b'\xf1\xe9h\xf1\xebl\xf1\xedp\xf1\xeet\xf1\xf0y\xf1\xf2}\xf2\xf3\x81\xf2\xf4\x85'
+        b'\xf3\xf6\x89\xf4\xf7\x8d\xf5\xf8\x91\xf6\xfa\x95\xf7\xfb\x99\xf9\xfc\x9d\xfa\xfd\xa0\xfc\xfe\xa4'
+    ),
+    "plasma": (
+        b'\x0c\x07\x86\x10\x07\x87\x13\x06\x89\x15\x06\x8a\x18\x06\x8b\x1b\x06\x8c\x1d\x06\x8d\x1f\x05\x8e'
+        b"!\x05\x8f#\x05\x90%\x05\x91'\x05\x92)\x05\x93+\x05\x94-\x04\x94/\x04\x95"
+        b'1\x04\x963\x04\x974\x04\x986\x04\x988\x04\x99:\x04\x9a;\x03\x9a=\x03\x9b'
+        b'?\x03\x9c@\x03\x9cB\x03\x9dD\x03\x9eE\x03\x9eG\x02\x9fI\x02\x9fJ\x02\xa0'
+        b'L\x02\xa1N\x02\xa1O\x02\xa2Q\x01\xa2R\x01\xa3T\x01\xa3V\x01\xa3W\x01\xa4'
+        b'Y\x01\xa4Z\x00\xa5\\\x00\xa5^\x00\xa5_\x00\xa6a\x00\xa6b\x00\xa6d\x00\xa7'
+        b'e\x00\xa7g\x00\xa7h\x00\xa7j\x00\xa7l\x00\xa8m\x00\xa8o\x00\xa8p\x00\xa8'
+        b'r\x00\xa8s\x00\xa8u\x00\xa8v\x01\xa8x\x01\xa8y\x01\xa8{\x02\xa8|\x02\xa7'
+        b'~\x03\xa7\x7f\x03\xa7\x81\x04\xa7\x82\x04\xa7\x84\x05\xa6\x85\x06\xa6\x86\x07\xa6\x88\x07\xa5'
+        b'\x89\x08\xa5\x8b\t\xa4\x8c\n\xa4\x8e\x0c\xa4\x8f\r\xa3\x90\x0e\xa3\x92\x0f\xa2\x93\x10\xa1'
+        b'\x95\x11\xa1\x96\x12\xa0\x97\x13\xa0\x99\x14\x9f\x9a\x15\x9e\x9b\x17\x9e\x9d\x18\x9d\x9e\x19\x9c'
+        b'\x9f\x1a\x9b\xa0\x1b\x9b\xa2\x1c\x9a\xa3\x1d\x99\xa4\x1e\x98\xa5\x1f\x97\xa7!\x97\xa8"\x96'
+        b"\xa9#\x95\xaa$\x94\xac%\x93\xad&\x92\xae'\x91\xaf(\x90\xb0*\x8f\xb1+\x8f"
+        b'\xb2,\x8e\xb4-\x8d\xb5.\x8c\xb6/\x8b\xb70\x8a\xb82\x89\xb93\x88\xba4\x87'
+        b'\xbb5\x86\xbc6\x85\xbd7\x84\xbe8\x83\xbf9\x82\xc0;\x81\xc1<\x80\xc2=\x80'
+        b'\xc3>\x7f\xc4?~\xc5@}\xc6A|\xc7B{\xc8Dz\xc9Ey\xcaFx'
+        b'\xcbGw\xccHv\xcdIu\xceJu\xcfKt\xd0Ms\xd1Nr\xd1Oq'
+        b'\xd2Pp\xd3Qo\xd4Rn\xd5Sm\xd6Um\xd7Vl\xd7Wk\xd8Xj'
+        b'\xd9Yi\xdaZh\xdb[g\xdc]f\xdc^f\xdd_e\xde`d\xdfac'
+        b'\xdfbb\xe0da\xe1e`\xe2f`\xe3g_\xe3h^\xe4j]\xe5k\\'
+        b'\xe5l[\xe6mZ\xe7nZ\xe8pY\xe8qX\xe9rW\xeasV\xeatU'
+        b'\xebvT\xecwT\xecxS\xedyR\xed{Q\xee|P\xef}O\xef~N'
+        b'\xf0\x80M\xf0\x81M\xf1\x82L\xf2\x84K\xf2\x85J\xf3\x86I\xf3\x87H\xf4\x89G'
+        b'\xf4\x8aG\xf5\x8bF\xf5\x8dE\xf6\x8eD\xf6\x8fC\xf6\x91B\xf7\x92A\xf7\x93A'
+        b'\xf8\x95@\xf8\x96?\xf8\x98>\xf9\x99=\xf9\x9a<\xfa\x9c;\xfa\x9d:\xfa\x9f:'
+        b'\xfa\xa09\xfb\xa28\xfb\xa37\xfb\xa46\xfc\xa65\xfc\xa75\xfc\xa94\xfc\xaa3'
+        b'\xfc\xac2\xfc\xad1\xfd\xaf1\xfd\xb00\xfd\xb2/\xfd\xb3.\xfd\xb5-\xfd\xb6-'
+        b'\xfd\xb8,\xfd\xb9+\xfd\xbb+\xfd\xbc*\xfd\xbe)\xfd\xc0)\xfd\xc1(\xfd\xc3('
+        b"\xfd\xc4'\xfd\xc6&\xfc\xc7&\xfc\xc9&\xfc\xcb%\xfc\xcc%\xfc\xce%\xfb\xd0$"
+        b'\xfb\xd1$\xfb\xd3$\xfa\xd5$\xfa\xd6$\xfa\xd8$\xf9\xd9$\xf9\xdb$\xf8\xdd$'
+        b'\xf8\xdf$\xf7\xe0$\xf7\xe2%\xf6\xe4%\xf6\xe5%\xf5\xe7&\xf5\xe9&\xf4\xea&'
+        b'\xf3\xec&\xf3\xee&\xf2\xf0&\xf2\xf1&\xf1\xf3&\xf0\xf5%\xf0\xf6#\xef\xf8!'
+    ),
+    "viridis": (
+        b'D\x01TD\x02UD\x03WE\x05XE\x06ZE\x08[F\t\\F\x0b^'
+        b'F\x0c_F\x0eaG\x0fbG\x11cG\x12eG\x14fG\x15gG\x16i'
+        b'G\x18jH\x19kH\x1alH\x1cnH\x1doH\x1epH qH!r'
+        b'H"sH#tG%uG&vG\'wG(xG*yG+z'
+        b'G,{F-|F/|F0}F1~E2\x7fE4\x7fE5\x80'
+        b'E6\x81D7\x81D9\x82C:\x83C;\x83C<\x84B=\x84B>\x85'
+        b'B@\x85AA\x86AB\x86@C\x87@D\x87?E\x87?G\x88>H\x88'
+        b'>I\x89=J\x89=K\x89=L\x89<M\x8a<N\x8a;P\x8a;Q\x8a'
+        b':R\x8b:S\x8b9T\x8b9U\x8b8V\x8b8W\x8c7X\x8c7Y\x8c'
+        b'6Z\x8c6[\x8c5\\\x8c5]\x8c4^\x8d4_\x8d3`\x8d3a\x8d'
+        b'2b\x8d2c\x8d1d\x8d1e\x8d1f\x8d0g\x8d0h\x8d/i\x8d'
+        b'/j\x8d.k\x8e.l\x8e.m\x8e-n\x8e-o\x8e,p\x8e,q\x8e'
+        b',r\x8e+s\x8e+t\x8e*u\x8e*v\x8e*w\x8e)x\x8e)y\x8e'
+        b"(z\x8e(z\x8e({\x8e'|\x8e'}\x8e'~\x8e&\x7f\x8e&\x80\x8e"
+        b'&\x81\x8e%\x82\x8e%\x83\x8d$\x84\x8d$\x85\x8d$\x86\x8d#\x87\x8d#\x88\x8d'
+        b'#\x89\x8d"\x89\x8d"\x8a\x8d"\x8b\x8d!\x8c\x8d!\x8d\x8c!\x8e\x8c \x8f\x8c'
+        b' \x90\x8c \x91\x8c\x1f\x92\x8c\x1f\x93\x8b\x1f\x94\x8b\x1f\x95\x8b\x1f\x96\x8b\x1e\x97\x8a'
+        b'\x1e\x98\x8a\x1e\x99\x8a\x1e\x99\x8a\x1e\x9a\x89\x1e\x9b\x89\x1e\x9c\x89\x1e\x9d\x88\x1e\x9e\x88'
+        b'\x1e\x9f\x88\x1e\xa0\x87\x1f\xa1\x87\x1f\xa2\x86\x1f\xa3\x86 \xa4\x85 \xa5\x85!\xa6\x85'
+        b'!\xa7\x84"\xa7\x84#\xa8\x83#\xa9\x82$\xaa\x82%\xab\x81&\xac\x81\'\xad\x80'
+        b'(\xae\x7f)\xaf\x7f*\xb0~+\xb1},\xb1}.\xb2|/\xb3{0\xb4z'
+        b'2\xb5z3\xb6y5\xb7x6\xb8w8\xb9v9\xb9v;\xbau=\xbbt'
+        b'>\xbcs@\xbdrB\xbeqD\xbepE\xbfoG\xc0nI\xc1mK\xc2l'
+        b'M\xc2kO\xc3iQ\xc4hS\xc5gU\xc6fW\xc6eY\xc7d[\xc8b'
+        b'^\xc9a`\xc9`b\xca_d\xcb]g\xcc\\i\xcc[k\xcdYm\xceX'
+        b'p\xceVr\xcfUt\xd0Tw\xd0Ry\xd1Q|\xd2O~\xd2N\x81\xd3L'
+        b'\x83\xd3K\x86\xd4I\x88\xd5G\x8b\xd5F\x8d\xd6D\x90\xd6C\x92\xd7A\x95\xd7?'
+        b'\x97\xd8>\x9a\xd8<\x9d\xd9:\x9f\xd98\xa2\xda7\xa5\xda5\xa7\xdb3\xaa\xdb2'
+        b"\xad\xdc0\xaf\xdc.\xb2\xdd,\xb5\xdd+\xb7\xdd)\xba\xde'\xbd\xde&\xbf\xdf$"
+        b'\xc2\xdf"\xc5\xdf!\xc7\xe0\x1f\xca\xe0\x1e\xcd\xe0\x1d\xcf\xe1\x1c\xd2\xe1\x1b\xd4\xe1\x1a'
+        b'\xd7\xe2\x19\xda\xe2\x18\xdc\xe2\x18\xdf\xe3\x18\xe1\xe3\x18\xe4\xe3\x18\xe7\xe4\x19\xe9\xe4\x19'
+        b'\xec\xe4\x1a\xee\xe5\x1b\xf1\xe5\x1c\xf3\xe5\x1e\xf6\xe6\x1f\xf8\xe6!\xfa\xe6"\xfd\xe7$'
+    ),
+    "grey": (
+        b'\x00\x00\x00\xff\xff\xff'
+    ),
+    "cividis": (
+        b'\x00"M\x00#O\x00#P\x00$R\x00%T\x00&U\x00&W\x00\'Y'
+        b'\x00([\x00(\\\x00)^\x00*`\x00*b\x00+d\x00,f\x00,g'
+        b'\x00-i\x00.k\x00/m\x00/o\x000p\x000p\x001p\x001p'
+        b'\x042p\x083p\x0b3p\x0e4p\x115o\x146o\x166o\x187o'
+        b'\x1a8o\x1c8n\x1d9n\x1f:n!;n";n$<n%=m'
+        b"'=m(>m*?m+?m,@m.Al/Bl0Bl"
+        b'1Cl2Dl4Dl5El6Fl7Fl8Gl9Hl'
+        b':Hk;Ik=Jk>Kk?Kk@LkAMkBMk'
+        b'CNkDOkEOkFPkGQkHQkIRkJSk'
+        b'KTlLTlMUlNVlNVlOWlPXlQXl'
+        b'RYlSZlTZlU[mV\\mW]mX]mY^m'
+        b'Y_mZ_m[`n\\an]an^bn_cn`dn'
+        b'adoaeobfocfodgoehpfipgip'
+        b'hjphkqikqjlqkmqlmrmnrnor'
+        b'npsopspqsqrsrstsstttutuu'
+        b'uuuvvvwwvxxvyxwyywzzw{{w'
+        b'|{x}|x~}x\x7f}x\x80~x\x81\x7fx\x82\x80x\x83\x80x'
+        b'\x84\x81x\x85\x82x\x85\x83x\x86\x83x\x87\x84x\x88\x85x\x89\x86x\x8a\x86x'
+        b'\x8b\x87x\x8c\x88x\x8d\x89x\x8e\x89x\x8f\x8aw\x90\x8bw\x91\x8cw\x92\x8cw'
+        b'\x93\x8dw\x94\x8ew\x95\x8fw\x96\x8fw\x97\x90v\x98\x91v\x99\x92v\x9a\x93v'
+        b'\x9b\x93v\x9c\x94v\x9d\x95u\x9e\x96u\x9f\x96u\xa0\x97u\xa1\x98t\xa2\x99t'
+        b'\xa3\x9at\xa4\x9at\xa5\x9bs\xa6\x9cs\xa7\x9ds\xa8\x9es\xa9\x9er\xaa\x9fr'
+        b'\xab\xa0r\xac\xa1q\xad\xa2q\xae\xa2q\xaf\xa3p\xb0\xa4p\xb1\xa5p\xb2\xa6o'
+        b'\xb3\xa6o\xb4\xa7o\xb5\xa8n\xb6\xa9n\xb7\xaam\xb8\xabm\xb9\xabm\xba\xacl'
+        b'\xbb\xadl\xbc\xaek\xbd\xafk\xbe\xb0j\xbf\xb0j\xc1\xb1i\xc2\xb2i\xc3\xb3h'
+        b'\xc4\xb4h\xc5\xb5g\xc6\xb5g\xc7\xb6f\xc8\xb7e\xc9\xb8e\xca\xb9d\xcb\xbad'
+        b'\xcc\xbbc\xcd\xbcb\xce\xbcb\xcf\xbda\xd0\xbe`\xd2\xbf`\xd3\xc0_\xd4\xc1^'
+        b'\xd5\xc2^\xd6\xc3]\xd7\xc3\\\xd8\xc4[\xd9\xc5Z\xda\xc6Z\xdb\xc7Y\xdc\xc8X'
+        b'\xde\xc9W\xdf\xcaV\xe0\xcbU\xe1\xccT\xe2\xccS\xe3\xcdR\xe4\xceQ\xe5\xcfP'
+        b'\xe6\xd0O\xe8\xd1N\xe9\xd2M\xea\xd3L\xeb\xd4K\xec\xd5J\xed\xd6H\xee\xd7G'
+        b'\xef\xd8F\xf1\xd9D\xf2\xdaC\xf3\xdaB\xf4\xdb@\xf5\xdc?\xf6\xdd=\xf8\xde;'
+        b'\xf9\xdf:\xfa\xe08\xfb\xe16\xfd\xe24\xfd\xe33\xfd\xe54\xfd\xe66\xfd\xe77'
+    ),
+    "twilight": (
+        b'\xe1\xd8\xe2\xe0\xd9\xe2\xdf\xd9\xe1\xde\xd9\xe0\xdd\xd9\xe0\xdb\xd8\xdf\xd9\xd8\xde\xd8\xd7\xdd'
+        b'\xd6\xd6\xdc\xd4\xd6\xdb\xd2\xd5\xda\xcf\xd4\xd9\xcd\xd2\xd8\xca\xd1\xd7\xc7\xd0\xd6\xc5\xcf\xd4'
+        b'\xc2\xcd\xd3\xbf\xcc\xd2\xbc\xca\xd1\xb9\xc9\xd0\xb6\xc7\xcf\xb3\xc6\xce\xb0\xc4\xcd\xad\xc3\xcc'
+        b'\xaa\xc1\xcb\xa7\xc0\xca\xa4\xbe\xca\xa1\xbc\xc9\x9e\xbb\xc8\x9b\xb9\xc8\x98\xb7\xc7\x96\xb5\xc6'
+        b'\x93\xb4\xc6\x92\xb3\xc6\x8e\xb0\xc5\x8b\xae\xc5\x89\xac\xc4\x88\xab\xc4\x84\xa9\xc3\x82\xa7\xc3'
+        b'\x80\xa5\xc3\x7f\xa4\xc2|\xa1\xc2z\x9f\xc2x\x9d\xc1w\x9c\xc1t\x9a\xc1s\x98\xc0'
+        b'q\x96\xc0p\x95\xc0n\x92\xbfm\x90\xbfk\x8e\xbfk\x8d\xbfi\x89\xbeh\x87\xbe'
+        b'g\x85\xbdf\x84\xbde\x81\xbdd\x7f\xbcd}\xbcc|\xbbbx\xbbbv\xba'
+        b'at\xbaar\xb9aq\xb9`m\xb8`k\xb7_i\xb6_g\xb6_d\xb5'
+        b'_b\xb4_`\xb3_^\xb3^[\xb1^Y\xb0^V\xaf^T\xae^Q\xad'
+        b'^O\xac^M\xaa^K\xaa]H\xa7]E\xa6]C\xa4]@\xa3]>\xa1'
+        b'\\<\x9f\\9\x9d\\8\x9c[4\x99[2\x97Z0\x95Z-\x92Y+\x90'
+        b'Y)\x8dX\'\x8bW%\x89V"\x85U!\x82T\x1f\x7fS\x1d|R\x1bx'
+        b'P\x1auO\x19rN\x18pL\x16kJ\x15gI\x15dG\x14`E\x13]'
+        b'D\x12ZB\x12WA\x12U>\x11Q=\x11N;\x11K:\x10H8\x10F'
+        b'7\x10C6\x10A5\x10@3\x11=2\x11;2\x11:0\x128/\x137'
+        b'/\x1361\x1262\x1273\x1174\x1176\x1187\x1199\x119'
+        b';\x11:=\x11;?\x11<A\x11=C\x12>E\x12?G\x12@J\x13A'
+        b'L\x13BO\x14CQ\x14DT\x15EU\x15FY\x16G\\\x16H^\x17I'
+        b'a\x18Jc\x18Kf\x19Li\x1aLk\x1aMn\x1bNq\x1cNs\x1dN'
+        b'v\x1eOx\x1fO{ O}!P\x7f"P\x82$P\x84%P\x87\'P'
+        b'\x89(P\x8b*P\x8d,P\x90-P\x92/O\x941O\x962O\x984O'
+        b'\x9a6O\x9b8O\x9d:O\x9f<O\xa0=O\xa2@O\xa4BO\xa6DO'
+        b'\xa7FO\xa9IP\xaaKP\xacMP\xadOP\xafQQ\xb0TQ\xb2VR'
+        b'\xb3XR\xb4ZS\xb5]S\xb6_T\xb7`T\xb9dV\xbafW\xbbhW'
+        b'\xbckY\xbdmZ\xbep[\xbfr\\\xc0t]\xc0w_\xc1y`\xc2|b'
+        b'\xc3~d\xc3\x81f\xc4\x83h\xc5\x86j\xc5\x87k\xc6\x8bn\xc7\x8dp\xc7\x8fr'
+        b'\xc8\x92u\xc8\x94x\xc9\x97z\xc9\x99}\xca\x9c\x80\xca\x9e\x83\xcb\xa1\x85\xcc\xa3\x89'
+        b'\xcc\xa5\x8c\xcd\xa8\x8f\xcd\xaa\x92\xce\xac\x95\xce\xae\x97\xcf\xb1\x9c\xd0\xb3\x9f\xd1\xb6\xa3'
+        b'\xd2\xb8\xa6\xd3\xba\xa9\xd3\xbc\xad\xd4\xbe\xb0\xd5\xc0\xb4\xd6\xc2\xb7\xd7\xc4\xbb\xd8\xc6\xbe'
+        b'\xd9\xc8\xc1\xda\xca\xc4\xdb\xcc\xc8\xdb\xce\xcb\xdc\xce\xcc\xdd\xd1\xd0\xde\xd2\xd3\xde\xd3\xd5'
+        b'\xdf\xd5\xd7\xdf\xd6\xd9\xe0\xd6\xdb\xe0\xd7\xdd\xe1\xd8\xde\xe1\xd8\xdf\xe1\xd8\xe1\xe1\xd8\xe1'
+    ),
+    "twilight_shifted": (
+        b'/\x1370\x1282\x11:2\x11;3\x11=4\x10?6\x10A7\x10C'
+        b'8\x10F:\x10H;\x11K=\x11N>\x11Q@\x11TB\x12WD\x12Z'
+        b'E\x13]G\x14`I\x15dJ\x15gL\x16kM\x17nO\x19rP\x1au'
+        b'R\x1bxS\x1d|T\x1f\x7fU!\x82V"\x85W$\x88X\'\x8bY)\x8d'
+        b'Y+\x90Z,\x91Z0\x95[2\x97[4\x99\\5\x9a\\9\x9d\\<\x9f'
+        b']>\xa1]?\xa2]C\xa4]E\xa6]H\xa7]I\xa8^M\xaa^O\xac'
+        b'^Q\xad^S\xad^V\xaf^Y\xb0^[\xb1^\\\xb2_`\xb3_b\xb4'
+        b'_d\xb5_e\xb5_i\xb6`k\xb7`m\xb8`n\xb8ar\xb9at\xba'
+        b'bv\xbabx\xbbcz\xbbd}\xbcd\x7f\xbce\x81\xbdf\x83\xbdg\x85\xbd'
+        b'h\x87\xbei\x89\xbej\x8a\xbek\x8e\xbfm\x90\xbfn\x92\xbfo\x94\xc0q\x96\xc0'
+        b's\x98\xc0t\x9a\xc1u\x9a\xc1x\x9d\xc1z\x9f\xc2|\xa1\xc2~\xa3\xc2\x80\xa5\xc3'
+        b'\x82\xa7\xc3\x84\xa9\xc3\x85\xaa\xc4\x89\xac\xc4\x8b\xae\xc5\x8e\xb0\xc5\x90\xb2\xc5\x93\xb4\xc6'
+        b'\x96\xb5\xc6\x98\xb7\xc7\x9a\xb8\xc7\x9e\xbb\xc8\xa1\xbc\xc9\xa4\xbe\xca\xa7\xc0\xca\xaa\xc1\xcb'
+        b'\xad\xc3\xcc\xb0\xc4\xcd\xb1\xc5\xcd\xb6\xc7\xcf\xb9\xc9\xd0\xbc\xca\xd1\xbf\xcc\xd2\xc2\xcd\xd3'
+        b'\xc5\xcf\xd4\xc7\xd0\xd6\xc9\xd1\xd6\xcd\xd2\xd8\xcf\xd4\xd9\xd2\xd5\xda\xd4\xd6\xdb\xd6\xd6\xdc'
+        b'\xd8\xd7\xdd\xd9\xd8\xde\xda\xd8\xde\xdd\xd9\xe0\xde\xd9\xe0\xdf\xd9\xe1\xe0\xd9\xe2\xe1\xd8\xe2'
+        b'\xe1\xd8\xe1\xe1\xd8\xdf\xe1\xd8\xde\xe0\xd7\xdd\xe0\xd7\xdc\xdf\xd6\xd9\xdf\xd5\xd7\xde\xd3\xd5'
+        b'\xde\xd2\xd3\xdd\xd1\xd0\xdc\xcf\xcd\xdb\xce\xcb\xdb\xcc\xc8\xda\xca\xc4\xd9\xc8\xc1\xd8\xc6\xbe'
+        b'\xd7\xc4\xbb\xd6\xc2\xb7\xd5\xc0\xb4\xd4\xbe\xb0\xd4\xbd\xaf\xd3\xba\xa9\xd2\xb8\xa6\xd1\xb6\xa3'
+        b'\xd0\xb3\x9f\xcf\xb1\x9c\xcf\xaf\x99\xce\xac\x95\xcd\xaa\x92\xcd\xa8\x8f\xcc\xa5\x8c\xcc\xa3\x89'
+        b'\xcb\xa1\x85\xca\x9e\x83\xca\x9c\x80\xc9\x99}\xc9\x98{\xc8\x94x\xc8\x92u\xc7\x8fr'
+        b'\xc7\x8dp\xc6\x8bn\xc5\x88l\xc5\x86j\xc4\x83h\xc3\x81f\xc3~d\xc2|b'
+        b'\xc1y`\xc0w_\xc0t]\xbfr\\\xbeq[\xbdmZ\xbckY\xbbhW'
+        b'\xbafW\xb9dV\xb8aU\xb6_T\xb5]S\xb4ZS\xb3XR\xb2VR'
+        b'\xb0TQ\xafQQ\xadOP\xacMP\xabLP\xa9IP\xa7FO\xa6DO'
+        b'\xa4BO\xa2@O\xa1>O\x9f<O\x9d:O\x9b8O\x9a6O\x984O'
+        b"\x962O\x941O\x92/O\x90-P\x8f,P\x8b*P\x89(P\x87'P"
+        b'\x84%P\x82$P\x80#P}!P{ Ox\x1fOv\x1eOs\x1dN'
+        b'q\x1cNn\x1bNk\x1aMi\x1aLg\x19Lc\x18Ka\x18J^\x17I'
+        b'\\\x16HY\x16GV\x15FT\x15EQ\x14DO\x14CL\x13BJ\x13A'
+        b'G\x12@E\x12?C\x12>A\x11=@\x11<=\x11;;\x11:9\x119'
+        b'7\x1196\x1185\x1183\x1172\x1271\x126/\x136/\x146'
+    ),
+    "Spectral": (
+        b'\x9e\x01B\xa0\x03B\xa2\x05C\xa4\x08C\xa6\nD\xa8\x0cD\xaa\x0fE\xad\x11E'
+        b'\xaf\x14F\xb1\x16F\xb3\x18G\xb5\x1bG\xb7\x1dH\xba H\xbc"I\xbe$I'
+        b"\xc0'J\xc2)J\xc4,K\xc6.K\xc90L\xcb3L\xcd5M\xcf8M"
+        b'\xd1:N\xd3<N\xd5>N\xd6@N\xd8BM\xd9DM\xdaFL\xdbHL'
+        b'\xdcIK\xdeKK\xdfMK\xe0OJ\xe1QJ\xe2SI\xe4UI\xe5VH'
+        b'\xe6XH\xe7ZG\xe9\\G\xea^F\xeb`F\xecaE\xedcE\xefeD'
+        b'\xf0gD\xf1iC\xf2kC\xf4mC\xf4oD\xf4rE\xf5tF\xf5wG'
+        b'\xf5yH\xf6|J\xf6~K\xf6\x81L\xf7\x83M\xf7\x86N\xf7\x89O\xf8\x8bQ'
+        b'\xf8\x8eR\xf8\x90S\xf9\x93T\xf9\x95U\xfa\x98V\xfa\x9aX\xfa\x9dY\xfb\x9fZ'
+        b'\xfb\xa2[\xfb\xa5\\\xfc\xa7^\xfc\xaa_\xfc\xac`\xfd\xaea\xfd\xb0c\xfd\xb2e'
+        b'\xfd\xb4f\xfd\xb6h\xfd\xb8j\xfd\xbak\xfd\xbcm\xfd\xben\xfd\xc0p\xfd\xc2r'
+        b'\xfd\xc4s\xfd\xc6u\xfd\xc8w\xfd\xcax\xfd\xccz\xfd\xce|\xfd\xd0}\xfd\xd2\x7f'
+        b'\xfd\xd4\x81\xfd\xd6\x82\xfd\xd8\x84\xfd\xda\x86\xfd\xdc\x87\xfd\xde\x89\xfe\xe0\x8b\xfe\xe1\x8d'
+        b'\xfe\xe2\x8f\xfe\xe3\x91\xfe\xe4\x93\xfe\xe6\x95\xfe\xe7\x97\xfe\xe8\x99\xfe\xe9\x9b\xfe\xea\x9d'
+        b'\xfe\xec\x9f\xfe\xed\xa1\xfe\xee\xa3\xfe\xef\xa5\xfe\xf1\xa7\xfe\xf2\xa9\xfe\xf3\xab\xfe\xf4\xad'
+        b'\xfe\xf5\xaf\xfe\xf7\xb1\xfe\xf8\xb3\xfe\xf9\xb5\xfe\xfa\xb7\xfe\xfb\xb9\xfe\xfd\xbb\xfe\xfe\xbd'
+        b'\xfe\xfe\xbe\xfd\xfe\xbc\xfc\xfe\xbb\xfb\xfd\xb9\xfa\xfd\xb8\xf9\xfc\xb6\xf8\xfc\xb5\xf7\xfc\xb3'
+        b'\xf6\xfb\xb2\xf5\xfb\xb0\xf4\xfa\xae\xf3\xfa\xad\xf2\xfa\xab\xf1\xf9\xaa\xf0\xf9\xa8\xef\xf8\xa7'
+        b'\xee\xf8\xa5\xed\xf8\xa4\xec\xf7\xa2\xeb\xf7\xa1\xea\xf6\x9f\xe9\xf6\x9e\xe8\xf6\x9c\xe7\xf5\x9b'
+        b'\xe6\xf5\x99\xe6\xf5\x98\xe3\xf4\x98\xe1\xf3\x98\xdf\xf2\x99\xdc\xf1\x99\xda\xf0\x9a\xd8\xef\x9a'
+        b'\xd5\xee\x9b\xd3\xed\x9b\xd1\xec\x9c\xce\xeb\x9c\xcc\xea\x9d\xca\xe9\x9d\xc7\xe8\x9e\xc5\xe7\x9e'
+        b'\xc3\xe6\x9f\xc0\xe5\x9f\xbe\xe5\xa0\xbc\xe4\xa0\xba\xe3\xa0\xb7\xe2\xa1\xb5\xe1\xa1\xb3\xe0\xa2'
+        b'\xb0\xdf\xa2\xae\xde\xa3\xac\xdd\xa3\xa9\xdc\xa4\xa6\xdb\xa4\xa4\xda\xa4\xa1\xd9\xa4\x9e\xd8\xa4'
+        b'\x9c\xd7\xa4\x99\xd6\xa4\x96\xd5\xa4\x94\xd4\xa4\x91\xd2\xa4\x8e\xd1\xa4\x8b\xd0\xa4\x89\xcf\xa4'
+        b'\x86\xce\xa4\x83\xcd\xa4\x81\xcc\xa4~\xcb\xa4{\xca\xa4x\xc9\xa4v\xc8\xa4s\xc7\xa4'
+        b'p\xc6\xa4n\xc5\xa4k\xc4\xa4h\xc3\xa4f\xc2\xa5c\xbf\xa5a\xbd\xa6_\xbb\xa7'
+        b']\xb8\xa8[\xb6\xa9Y\xb4\xaaW\xb2\xabU\xaf\xacS\xad\xadQ\xab\xaeO\xa8\xaf'
+        b'M\xa6\xb0K\xa4\xb1I\xa2\xb2G\x9f\xb3E\x9d\xb4C\x9b\xb5A\x99\xb5?\x96\xb6'
+        b'=\x94\xb7;\x92\xb89\x8f\xb97\x8d\xba5\x8b\xbb3\x89\xbc2\x86\xbc4\x84\xbb'
+        b'6\x82\xba8\x80\xb99}\xb8;{\xb7=y\xb6>w\xb5@u\xb4Br\xb2'
+        b'Dp\xb1En\xb0Gl\xafIi\xaeKg\xadLe\xacNc\xabP`\xaa'
+        b'Q^\xa9S\\\xa8UZ\xa7WW\xa6XU\xa5ZS\xa4\\Q\xa3^O\xa2'
+    ),
+    "SpectralBack": (
+        b'^O\xa2\\Q\xa3ZS\xa4XU\xa5WW\xa6UZ\xa7S\\\xa8Q^\xa9'
+        b'P`\xaaNc\xabLe\xacKg\xadIi\xaeGl\xafEn\xb0Dp\xb1'
+        b'Br\xb2@u\xb4>w\xb5=y\xb6;{\xb79}\xb88\x80\xb96\x82\xba'
+        b'4\x84\xbb2\x86\xbc3\x89\xbc5\x8b\xbb7\x8d\xba9\x8f\xb9;\x92\xb8=\x94\xb7'
+        b'?\x96\xb6A\x99\xb5C\x9b\xb5E\x9d\xb4G\x9f\xb3I\xa2\xb2K\xa4\xb1M\xa6\xb0'
+        b'O\xa8\xafQ\xab\xaeS\xad\xadU\xaf\xacW\xb2\xabY\xb4\xaa[\xb6\xa9]\xb8\xa8'
+        b'_\xbb\xa7a\xbd\xa6c\xbf\xa5f\xc2\xa5h\xc3\xa4k\xc4\xa4n\xc5\xa4p\xc6\xa4'
+        b's\xc7\xa4v\xc8\xa4x\xc9\xa4{\xca\xa4~\xcb\xa4\x81\xcc\xa4\x83\xcd\xa4\x86\xce\xa4'
+        b'\x89\xcf\xa4\x8b\xd0\xa4\x8e\xd1\xa4\x91\xd2\xa4\x94\xd4\xa4\x96\xd5\xa4\x99\xd6\xa4\x9c\xd7\xa4'
+        b'\x9e\xd8\xa4\xa1\xd9\xa4\xa4\xda\xa4\xa6\xdb\xa4\xa9\xdc\xa4\xac\xdd\xa3\xae\xde\xa3\xb0\xdf\xa2'
+        b'\xb3\xe0\xa2\xb5\xe1\xa1\xb7\xe2\xa1\xba\xe3\xa0\xbc\xe4\xa0\xbe\xe5\xa0\xc0\xe5\x9f\xc3\xe6\x9f'
+        b'\xc5\xe7\x9e\xc7\xe8\x9e\xca\xe9\x9d\xcc\xea\x9d\xce\xeb\x9c\xd1\xec\x9c\xd3\xed\x9b\xd5\xee\x9b'
+        b'\xd8\xef\x9a\xda\xf0\x9a\xdc\xf1\x99\xdf\xf2\x99\xe1\xf3\x98\xe3\xf4\x98\xe6\xf5\x98\xe6\xf5\x99'
+        b'\xe7\xf5\x9b\xe8\xf6\x9c\xe9\xf6\x9e\xea\xf6\x9f\xeb\xf7\xa1\xec\xf7\xa2\xed\xf8\xa4\xee\xf8\xa5'
+        b'\xef\xf8\xa7\xf0\xf9\xa8\xf1\xf9\xaa\xf2\xfa\xab\xf3\xfa\xad\xf4\xfa\xae\xf5\xfb\xb0\xf6\xfb\xb2'
+        b'\xf7\xfc\xb3\xf8\xfc\xb5\xf9\xfc\xb6\xfa\xfd\xb8\xfb\xfd\xb9\xfc\xfe\xbb\xfd\xfe\xbc\xfe\xfe\xbe'
+        b'\xfe\xfe\xbd\xfe\xfd\xbb\xfe\xfb\xb9\xfe\xfa\xb7\xfe\xf9\xb5\xfe\xf8\xb3\xfe\xf7\xb1\xfe\xf5\xaf'
+        b'\xfe\xf4\xad\xfe\xf3\xab\xfe\xf2\xa9\xfe\xf1\xa7\xfe\xef\xa5\xfe\xee\xa3\xfe\xed\xa1\xfe\xec\x9f'
+        b'\xfe\xea\x9d\xfe\xe9\x9b\xfe\xe8\x99\xfe\xe7\x97\xfe\xe6\x95\xfe\xe4\x93\xfe\xe3\x91\xfe\xe2\x8f'
+        b'\xfe\xe1\x8d\xfe\xe0\x8b\xfd\xde\x89\xfd\xdc\x87\xfd\xda\x86\xfd\xd8\x84\xfd\xd6\x82\xfd\xd4\x81'
+        b'\xfd\xd2\x7f\xfd\xd0}\xfd\xce|\xfd\xccz\xfd\xcax\xfd\xc8w\xfd\xc6u\xfd\xc4s'
+        b'\xfd\xc2r\xfd\xc0p\xfd\xben\xfd\xbcm\xfd\xbak\xfd\xb8j\xfd\xb6h\xfd\xb4f'
+        b'\xfd\xb2e\xfd\xb0c\xfd\xaea\xfc\xac`\xfc\xaa_\xfc\xa7^\xfb\xa5\\\xfb\xa2['
+        b'\xfb\x9fZ\xfa\x9dY\xfa\x9aX\xfa\x98V\xf9\x95U\xf9\x93T\xf8\x90S\xf8\x8eR'
+        b'\xf8\x8bQ\xf7\x89O\xf7\x86N\xf7\x83M\xf6\x81L\xf6~K\xf6|J\xf5yH'
+        b'\xf5wG\xf5tF\xf4rE\xf4oD\xf4mC\xf2kC\xf1iC\xf0gD'
+        b'\xefeD\xedcE\xecaE\xeb`F\xea^F\xe9\\G\xe7ZG\xe6XH'
+        b'\xe5VH\xe4UI\xe2SI\xe1QJ\xe0OJ\xdfMK\xdeKK\xdcIK'
+        b'\xdbHL\xdaFL\xd9DM\xd8BM\xd6@N\xd5>N\xd3<N\xd1:N'
+        b"\xcf8M\xcd5M\xcb3L\xc90L\xc6.K\xc4,K\xc2)J\xc0'J"
+        b'\xbe$I\xbc"I\xba H\xb7\x1dH\xb5\x1bG\xb3\x18G\xb1\x16F\xaf\x14F'
+        b'\xad\x11E\xaa\x0fE\xa8\x0cD\xa6\nD\xa4\x08C\xa2\x05C\xa0\x03B\x9e\x01B'
+    ),
+    "coolwarm": (
+        b':L\xc0;M\xc1<O\xc3>Q\xc4?S\xc6@T\xc7AV\xc9BX\xca'
+        b'CZ\xccE[\xcdF]\xcfG_\xd0H`\xd1Ib\xd3Kd\xd4Lf\xd6'
+        b'Mg\xd7Ni\xd8Pk\xdaQl\xdbRn\xdcSp\xddUq\xdeVs\xe0'
+        b'Wu\xe1Xv\xe2Zx\xe3[y\xe4\\{\xe5]}\xe6_~\xe7`\x80\xe8'
+        b'a\x82\xeac\x83\xead\x85\xebe\x86\xecg\x88\xedh\x89\xeei\x8b\xefk\x8d\xf0'
+        b'l\x8e\xf1m\x90\xf1o\x91\xf2p\x93\xf3q\x94\xf4s\x95\xf4t\x97\xf5u\x98\xf6'
+        b'w\x9a\xf6x\x9b\xf7z\x9d\xf8{\x9e\xf8|\xa0\xf9~\xa1\xf9\x7f\xa2\xfa\x80\xa4\xfa'
+        b'\x82\xa5\xfb\x83\xa6\xfb\x85\xa8\xfb\x86\xa9\xfc\x87\xaa\xfc\x89\xac\xfc\x8a\xad\xfd\x8b\xae\xfd'
+        b'\x8d\xaf\xfd\x8e\xb1\xfd\x90\xb2\xfe\x91\xb3\xfe\x92\xb4\xfe\x94\xb5\xfe\x95\xb7\xfe\x97\xb8\xfe'
+        b'\x98\xb9\xfe\x99\xba\xfe\x9b\xbb\xfe\x9c\xbc\xfe\x9d\xbd\xfe\x9f\xbe\xfe\xa0\xbf\xfe\xa2\xc0\xfe'
+        b'\xa3\xc1\xfe\xa4\xc2\xfe\xa6\xc3\xfd\xa7\xc4\xfd\xa8\xc5\xfd\xaa\xc6\xfd\xab\xc7\xfc\xac\xc8\xfc'
+        b'\xae\xc9\xfc\xaf\xca\xfb\xb0\xcb\xfb\xb2\xcb\xfb\xb3\xcc\xfa\xb4\xcd\xfa\xb6\xce\xf9\xb7\xcf\xf9'
+        b'\xb8\xcf\xf8\xb9\xd0\xf8\xbb\xd1\xf7\xbc\xd1\xf6\xbd\xd2\xf6\xbe\xd3\xf5\xc0\xd3\xf5\xc1\xd4\xf4'
+        b'\xc2\xd4\xf3\xc3\xd5\xf2\xc5\xd5\xf2\xc6\xd6\xf1\xc7\xd6\xf0\xc8\xd7\xef\xc9\xd7\xee\xca\xd8\xee'
+        b'\xcc\xd8\xed\xcd\xd9\xec\xce\xd9\xeb\xcf\xd9\xea\xd0\xda\xe9\xd1\xda\xe8\xd2\xda\xe7\xd3\xdb\xe6'
+        b'\xd5\xdb\xe5\xd6\xdb\xe4\xd7\xdb\xe2\xd8\xdb\xe1\xd9\xdc\xe0\xda\xdc\xdf\xdb\xdc\xde\xdc\xdc\xdd'
+        b'\xdd\xdc\xdb\xde\xdb\xda\xdf\xdb\xd9\xe0\xda\xd7\xe1\xda\xd6\xe2\xd9\xd4\xe3\xd9\xd3\xe4\xd8\xd1'
+        b'\xe5\xd8\xd0\xe6\xd7\xcf\xe7\xd6\xcd\xe7\xd6\xcc\xe8\xd5\xca\xe9\xd4\xc9\xea\xd3\xc7\xeb\xd3\xc6'
+        b'\xec\xd2\xc4\xec\xd1\xc3\xed\xd0\xc1\xed\xcf\xc0\xee\xcf\xbe\xef\xce\xbc\xef\xcd\xbb\xf0\xcc\xb9'
+        b'\xf1\xcb\xb8\xf1\xca\xb6\xf2\xc9\xb5\xf2\xc8\xb3\xf2\xc7\xb2\xf3\xc6\xb0\xf3\xc5\xaf\xf4\xc4\xad'
+        b'\xf4\xc3\xab\xf4\xc2\xaa\xf5\xc1\xa8\xf5\xc0\xa7\xf5\xbf\xa5\xf6\xbd\xa4\xf6\xbc\xa2\xf6\xbb\xa0'
+        b'\xf6\xba\x9f\xf6\xb9\x9d\xf6\xb7\x9c\xf6\xb6\x9a\xf7\xb5\x98\xf7\xb3\x97\xf7\xb2\x95\xf7\xb1\x94'
+        b'\xf7\xb0\x92\xf7\xae\x91\xf7\xad\x8f\xf6\xab\x8d\xf6\xaa\x8c\xf6\xa9\x8a\xf6\xa7\x89\xf6\xa6\x87'
+        b'\xf6\xa4\x86\xf6\xa3\x84\xf5\xa1\x82\xf5\xa0\x81\xf5\x9e\x7f\xf4\x9d~\xf4\x9b|\xf4\x9a{'
+        b'\xf3\x98y\xf3\x96x\xf3\x95v\xf2\x93u\xf2\x91s\xf1\x90r\xf1\x8ep\xf0\x8do'
+        b'\xf0\x8bm\xef\x89l\xee\x87j\xee\x86i\xed\x84g\xec\x82f\xec\x80d\xeb\x7fc'
+        b'\xea}a\xea{`\xe9y^\xe8w]\xe7u\\\xe6tZ\xe6rY\xe5pW'
+        b'\xe4nV\xe3lT\xe2jS\xe1hR\xe0fP\xdfdO\xdebN\xdd`L'
+        b'\xdc^K\xdb\\J\xdaZH\xd9XG\xd8VF\xd7TD\xd6RC\xd4OB'
+        b'\xd3M@\xd2K?\xd1I>\xcfF=\xceD<\xcdB:\xcc?9\xca=8'
+        b'\xc9;7\xc885\xc654\xc523\xc402\xc2-1\xc1*0\xbf(.'
+        b"\xbe#-\xbc\x1f,\xbb\x1a+\xb9\x16*\xb8\x11)\xb6\r(\xb5\x08'\xb3\x03&"
+    ),
+    "bwr": (
+        b'\x00\x00\xff\x02\x02\xff\x04\x04\xff\x06\x06\xff\x08\x08\xff\n\n\xff\x0c\x0c\xff\x0e\x0e\xff'
+        b'\x10\x10\xff\x12\x12\xff\x14\x14\xff\x16\x16\xff\x18\x18\xff\x1a\x1a\xff\x1c\x1c\xff\x1e\x1e\xff'
+        b'  \xff""\xff$$\xff&&\xff((\xff**\xff,,\xff..\xff'
+        b'00\xff22\xff44\xff66\xff88\xff::\xff<<\xff>>\xff'
+        b'@@\xffAA\xffDD\xffFF\xffHH\xffII\xffLL\xffNN\xff'
+        b'PP\xffQQ\xffTT\xffVV\xffXX\xffYY\xff\\\\\xff^^\xff'
+        b'``\xffaa\xffdd\xffff\xffhh\xffii\xffll\xffnn\xff'
+        b'pp\xffqq\xfftt\xffvv\xffxx\xffyy\xff||\xff~~\xff'
+        b'\x80\x80\xff\x82\x82\xff\x83\x83\xff\x86\x86\xff\x88\x88\xff\x8a\x8a\xff\x8c\x8c\xff\x8e\x8e\xff'
+        b'\x90\x90\xff\x92\x92\xff\x93\x93\xff\x96\x96\xff\x98\x98\xff\x9a\x9a\xff\x9c\x9c\xff\x9e\x9e\xff'
+        b'\xa0\xa0\xff\xa2\xa2\xff\xa3\xa3\xff\xa6\xa6\xff\xa8\xa8\xff\xaa\xaa\xff\xac\xac\xff\xae\xae\xff'
+        b'\xb0\xb0\xff\xb2\xb2\xff\xb3\xb3\xff\xb6\xb6\xff\xb8\xb8\xff\xba\xba\xff\xbc\xbc\xff\xbe\xbe\xff'
+        b'\xc0\xc0\xff\xc2\xc2\xff\xc3\xc3\xff\xc6\xc6\xff\xc8\xc8\xff\xca\xca\xff\xcc\xcc\xff\xce\xce\xff'
+        b'\xd0\xd0\xff\xd2\xd2\xff\xd3\xd3\xff\xd6\xd6\xff\xd8\xd8\xff\xda\xda\xff\xdc\xdc\xff\xde\xde\xff'
+        b'\xe0\xe0\xff\xe2\xe2\xff\xe3\xe3\xff\xe6\xe6\xff\xe8\xe8\xff\xea\xea\xff\xec\xec\xff\xee\xee\xff'
+        b'\xf0\xf0\xff\xf2\xf2\xff\xf3\xf3\xff\xf6\xf6\xff\xf8\xf8\xff\xfa\xfa\xff\xfc\xfc\xff\xfe\xfe\xff'
+        b'\xff\xfe\xfe\xff\xfc\xfc\xff\xfa\xfa\xff\xf8\xf8\xff\xf6\xf6\xff\xf4\xf4\xff\xf2\xf2\xff\xf0\xf0'
+        b'\xff\xee\xee\xff\xec\xec\xff\xea\xea\xff\xe8\xe8\xff\xe6\xe6\xff\xe4\xe4\xff\xe2\xe2\xff\xe0\xe0'
+        b'\xff\xde\xde\xff\xdc\xdc\xff\xda\xda\xff\xd8\xd8\xff\xd6\xd6\xff\xd3\xd3\xff\xd2\xd2\xff\xd0\xd0'
+        b'\xff\xce\xce\xff\xcc\xcc\xff\xca\xca\xff\xc8\xc8\xff\xc6\xc6\xff\xc3\xc3\xff\xc2\xc2\xff\xc0\xc0'
+        b'\xff\xbe\xbe\xff\xbc\xbc\xff\xba\xba\xff\xb8\xb8\xff\xb6\xb6\xff\xb3\xb3\xff\xb2\xb2\xff\xb0\xb0'
+        b'\xff\xae\xae\xff\xac\xac\xff\xaa\xaa\xff\xa8\xa8\xff\xa6\xa6\xff\xa3\xa3\xff\xa2\xa2\xff\xa0\xa0'
+        b'\xff\x9e\x9e\xff\x9c\x9c\xff\x9a\x9a\xff\x98\x98\xff\x96\x96\xff\x93\x93\xff\x92\x92\xff\x90\x90'
+        b'\xff\x8e\x8e\xff\x8c\x8c\xff\x8a\x8a\xff\x88\x88\xff\x86\x86\xff\x83\x83\xff\x82\x82\xff\x80\x80'
+        b'\xff~~\xff||\xffyy\xffxx\xffvv\xfftt\xffqq\xffpp'
+        b'\xffnn\xffll\xffii\xffhh\xffff\xffdd\xffaa\xff``'
+        b'\xff^^\xff\\\\\xffYY\xffXX\xffVV\xffTT\xffQQ\xffPP'
+        b'\xffNN\xffLL\xffII\xffHH\xffFF\xffDD\xffAA\xff@@'
+        b'\xff>>\xff<<\xff99\xff88\xff66\xff44\xff11\xff00'
+        b'\xff..\xff,,\xff))\xff((\xff&&\xff$$\xff!!\xff  '
+        b'\xff\x1e\x1e\xff\x1c\x1c\xff\x19\x19\xff\x18\x18\xff\x16\x16\xff\x14\x14\xff\x11\x11\xff\x10\x10'
+        b'\xff\x0e\x0e\xff\x0c\x0c\xff\t\t\xff\x08\x08\xff\x06\x06\xff\x04\x04\xff\x01\x01\xff\x00\x00'
+    ),
+    "RdBu": (
+        b'g\x00\x1fi\x00\x1fl\x01\x1fo\x02 r\x03 u\x04!x\x05!{\x06"'
+        b'~\x07"\x81\x08#\x84\t#\x87\n$\x8a\x0b$\x8d\x0c%\x90\r%\x93\x0e&'
+        b"\x96\x0f&\x99\x10'\x9b\x10'\x9e\x11'\xa1\x12(\xa4\x13(\xa7\x14)\xaa\x15)"
+        b"\xad\x16*\xb0\x17*\xb2\x19+\xb4\x1c-\xb5\x1f.\xb6!/\xb8$1\xb9'2"
+        b'\xbb*3\xbc-4\xbe06\xbf27\xc058\xc28:\xc3;;\xc5><'
+        b'\xc6@>\xc7C?\xc9FA\xcaIB\xccLC\xcdOD\xceQF\xd0TG'
+        b'\xd1WI\xd3ZJ\xd4]K\xd6`M\xd7bO\xd8eQ\xd9hS\xdajU'
+        b'\xdbmW\xddpY\xder[\xdfu]\xe0x_\xe1{a\xe2}c\xe4\x80e'
+        b'\xe5\x83h\xe6\x85j\xe7\x88l\xe8\x8bn\xea\x8dp\xeb\x90r\xec\x93t\xed\x96v'
+        b'\xee\x98x\xef\x9bz\xf1\x9e|\xf2\xa0~\xf3\xa3\x80\xf4\xa6\x83\xf4\xa8\x86\xf4\xaa\x88'
+        b'\xf5\xac\x8b\xf5\xae\x8e\xf5\xb0\x90\xf6\xb2\x93\xf6\xb4\x96\xf7\xb6\x98\xf7\xb9\x9b\xf7\xbb\x9e'
+        b'\xf8\xbd\xa1\xf8\xbf\xa3\xf8\xc1\xa6\xf9\xc3\xa9\xf9\xc5\xab\xf9\xc7\xae\xfa\xca\xb1\xfa\xcc\xb4'
+        b'\xfa\xce\xb6\xfb\xd0\xb9\xfb\xd2\xbc\xfb\xd4\xbe\xfc\xd6\xc1\xfc\xd8\xc4\xfd\xdb\xc7\xfc\xdc\xc8'
+        b'\xfc\xdd\xca\xfc\xde\xcc\xfc\xdf\xce\xfb\xe0\xd0\xfb\xe1\xd2\xfb\xe2\xd4\xfb\xe3\xd6\xfa\xe4\xd7'
+        b'\xfa\xe5\xd9\xfa\xe7\xdb\xfa\xe8\xdd\xf9\xe9\xdf\xf9\xea\xe1\xf9\xeb\xe3\xf9\xec\xe5\xf9\xed\xe7'
+        b'\xf8\xee\xe8\xf8\xef\xea\xf8\xf0\xec\xf8\xf2\xee\xf7\xf3\xf0\xf7\xf4\xf2\xf7\xf5\xf4\xf7\xf6\xf6'
+        b'\xf6\xf6\xf6\xf4\xf5\xf6\xf3\xf5\xf6\xf1\xf4\xf6\xf0\xf3\xf5\xee\xf3\xf5\xed\xf2\xf5\xeb\xf1\xf4'
+        b'\xea\xf1\xf4\xe8\xf0\xf4\xe7\xef\xf4\xe5\xee\xf3\xe4\xee\xf3\xe2\xed\xf3\xe1\xec\xf3\xdf\xec\xf2'
+        b'\xde\xeb\xf2\xdc\xea\xf2\xdb\xe9\xf1\xd9\xe9\xf1\xd8\xe8\xf1\xd6\xe7\xf1\xd5\xe7\xf0\xd3\xe6\xf0'
+        b'\xd2\xe5\xf0\xd1\xe5\xf0\xce\xe3\xef\xcc\xe2\xee\xc9\xe1\xed\xc7\xdf\xed\xc4\xde\xec\xc2\xdd\xeb'
+        b'\xbf\xdc\xeb\xbd\xda\xea\xba\xd9\xe9\xb8\xd8\xe8\xb5\xd7\xe8\xb3\xd5\xe7\xb0\xd4\xe6\xae\xd3\xe6'
+        b'\xab\xd2\xe5\xa9\xd0\xe4\xa7\xcf\xe4\xa4\xce\xe3\xa2\xcd\xe2\x9f\xcb\xe1\x9d\xca\xe1\x9a\xc9\xe0'
+        b'\x98\xc8\xdf\x95\xc6\xdf\x93\xc5\xde\x90\xc4\xdd\x8d\xc2\xdc\x8a\xc0\xdb\x87\xbe\xda\x84\xbc\xd9'
+        b'\x80\xba\xd8}\xb8\xd7z\xb6\xd6w\xb4\xd5t\xb2\xd3q\xb0\xd2n\xae\xd1k\xac\xd0'
+        b'h\xaa\xcfe\xa8\xcea\xa6\xcd^\xa4\xcc[\xa2\xcbX\xa0\xcaU\x9e\xc9R\x9c\xc8'
+        b'O\x9a\xc7L\x98\xc6I\x96\xc5F\x94\xc4C\x93\xc3A\x91\xc2@\x8f\xc1?\x8d\xc0'
+        b'=\x8b\xbf<\x8a\xbe;\x88\xbd9\x86\xbc8\x84\xbb7\x83\xba5\x81\xb94\x7f\xb9'
+        b'3}\xb81|\xb70z\xb6/x\xb5-v\xb4,u\xb3+s\xb2)q\xb1'
+        b"(o\xb0'm\xb0%l\xaf$j\xae#h\xad!f\xac d\xaa\x1fb\xa7"
+        b'\x1e`\xa4\x1d^\xa1\x1c\\\x9e\x1aZ\x9b\x19X\x98\x18V\x95\x17T\x93\x16Q\x90'
+        b'\x15O\x8d\x14M\x8a\x13K\x87\x12I\x84\x11G\x81\x0fE~\x0eC{\r@x'
+        b'\x0c>u\x0b<r\n:o\t8l\x086i\x074f\x062c\x050a'
+    ),
+    "ocean": (
+        b'\x00\x7f\x00\x00~\x01\x00|\x02\x00{\x03\x00y\x04\x00x\x05\x00v\x06\x00u\x07'
+        b'\x00s\x08\x00r\t\x00p\n\x00o\x0b\x00m\x0c\x00l\r\x00j\x0e\x00i\x0f'
+        b'\x00g\x10\x00f\x11\x00d\x12\x00c\x13\x00a\x14\x00`\x15\x00^\x16\x00]\x17'
+        b'\x00[\x18\x00Y\x19\x00X\x1a\x00W\x1b\x00U\x1c\x00T\x1d\x00R\x1e\x00Q\x1f'
+        b'\x00O \x00N \x00L"\x00J#\x00I$\x00H$\x00F&\x00E\''
+        b'\x00C(\x00B(\x00@*\x00?+\x00=,\x00<,\x00:.\x008/'
+        b'\x0070\x0060\x0042\x0023\x0014\x0004\x00.6\x00,7'
+        b'\x00+8\x00*8\x00(:\x00\';\x00%<\x00$<\x00">\x00 ?'
+        b'\x00\x1f@\x00\x1eA\x00\x1cA\x00\x1aC\x00\x19D\x00\x18E\x00\x16F\x00\x14G'
+        b'\x00\x13H\x00\x12I\x00\x10I\x00\x0fK\x00\rL\x00\x0cM\x00\nN\x00\x08O'
+        b'\x00\x07P\x00\x06Q\x00\x04Q\x00\x02S\x00\x01T\x00\x00U\x00\x01V\x00\x02W'
+        b'\x00\x04X\x00\x05Y\x00\x07Y\x00\x08[\x00\n\\\x00\x0b]\x00\r^\x00\x0f_'
+        b'\x00\x10`\x00\x11a\x00\x13a\x00\x15c\x00\x16d\x00\x18e\x00\x19f\x00\x1bg'
+        b'\x00\x1ch\x00\x1ei\x00\x1fi\x00 k\x00"l\x00#m\x00%n\x00\'o'
+        b'\x00(p\x00)q\x00+q\x00-s\x00.t\x000u\x001v\x002w'
+        b'\x004x\x005y\x007y\x008{\x00:|\x00;}\x00=~\x00?\x7f'
+        b'\x00@\x80\x00A\x81\x00C\x82\x00D\x83\x00F\x83\x00H\x85\x00I\x86\x00K\x87'
+        b'\x00L\x88\x00N\x89\x00O\x8a\x00Q\x8b\x00R\x8c\x00T\x8d\x00U\x8e\x00W\x8f'
+        b'\x00X\x90\x00Y\x91\x00[\x92\x00\\\x93\x00^\x93\x00`\x95\x00a\x96\x00b\x97'
+        b'\x00d\x98\x00e\x99\x00g\x9a\x00h\x9b\x00j\x9c\x00l\x9d\x00m\x9e\x00o\x9f'
+        b'\x00p\xa0\x00q\xa1\x00s\xa2\x00t\xa3\x00v\xa3\x00x\xa5\x00y\xa6\x00{\xa7'
+        b'\x00|\xa8\x00~\xa9\x00\x7f\xaa\x02\x81\xab\x05\x82\xac\x08\x83\xad\x0b\x85\xae\x0e\x86\xaf'
+        b'\x11\x88\xb0\x14\x89\xb1\x17\x8b\xb2\x1a\x8c\xb3\x1d\x8e\xb3 \x90\xb5#\x91\xb6&\x93\xb7'
+        b')\x94\xb8,\x95\xb9/\x97\xba2\x98\xbb6\x9a\xbc9\x9c\xbd<\x9d\xbe?\x9f\xbf'
+        b'A\xa0\xc0D\xa2\xc1G\xa3\xc2J\xa4\xc3M\xa6\xc3Q\xa8\xc5T\xa9\xc6W\xab\xc7'
+        b'Z\xac\xc8]\xae\xc9`\xaf\xcab\xb1\xcbf\xb2\xcci\xb4\xcdl\xb5\xceo\xb7\xcf'
+        b'r\xb8\xd0u\xba\xd1x\xbb\xd2{\xbd\xd3~\xbe\xd3\x81\xc0\xd5\x83\xc1\xd6\x86\xc3\xd7'
+        b'\x89\xc4\xd8\x8c\xc5\xd9\x8f\xc7\xda\x92\xc8\xdb\x96\xca\xdc\x99\xcc\xdd\x9c\xcd\xde\x9f\xcf\xdf'
+        b'\xa2\xd0\xe0\xa4\xd2\xe1\xa7\xd3\xe2\xaa\xd4\xe3\xad\xd6\xe3\xb1\xd8\xe5\xb4\xd9\xe6\xb7\xdb\xe7'
+        b'\xba\xdc\xe8\xbd\xde\xe9\xc0\xdf\xea\xc3\xe1\xeb\xc5\xe2\xec\xc8\xe3\xed\xcb\xe5\xee\xce\xe6\xef'
+        b'\xd1\xe8\xf0\xd4\xe9\xf1\xd7\xeb\xf2\xda\xec\xf3\xdd\xee\xf3\xe1\xf0\xf5\xe3\xf1\xf6\xe6\xf3\xf7'
+        b'\xe9\xf4\xf8\xec\xf5\xf9\xef\xf7\xfa\xf2\xf8\xfb\xf6\xfa\xfc\xf9\xfc\xfd\xfc\xfd\xfe\xff\xff\xff'
+    ),
+    "gist_earth": (
+        b'\x00\x00\x00\x00\x00+\x01\x008\x01\x00C\x02\x00N\x03\x00X\x03\x00c\x04\x00n'
+        b'\x05\x02s\x05\x04t\x06\x06t\x07\tt\x07\x0bt\x08\rt\t\x10u\t\x12u'
+        b'\n\x14u\x0b\x16u\x0b\x19u\x0c\x1bu\r\x1dv\r v\x0e"v\x0f$v'
+        b"\x0f'v\x10)w\x11+w\x11-w\x120w\x132w\x134w\x146x"
+        b'\x158x\x15:x\x16<x\x17>x\x17@y\x18By\x19Ey\x19Gy'
+        b'\x1aIy\x1bKy\x1bMz\x1cOz\x1dQz\x1dSz\x1eTz\x1fV{'
+        b'\x1fX{ Z{!\\{!^{"`{#a|#c|$e|'
+        b"%f|%h|&i}'k}'m}(n})p})q}"
+        b'*s~+t~+v~,x~-y~-{\x7f.|\x7f/~\x7f'
+        b'/\x7f\x7f0\x80~0\x81}1\x81{1\x82z2\x82y2\x83x3\x84w'
+        b'3\x84u4\x85t4\x85s5\x86r5\x86p6\x87o6\x88n7\x88m'
+        b'7\x89l8\x89j8\x8ai8\x8ah9\x8bg9\x8ce:\x8cd:\x8dc'
+        b';\x8db;\x8ea<\x8e_<\x8f^=\x90]=\x90\\>\x91Z>\x91Y'
+        b'?\x92X?\x93W@\x93U@\x94T@\x94SA\x95RA\x95QB\x96O'
+        b'B\x97NC\x97MC\x98LD\x98JD\x99IE\x99HG\x9aGI\x9bF'
+        b'K\x9bFN\x9cGP\x9cGR\x9dHT\x9dHW\x9eIY\x9fJ[\x9fJ'
+        b']\xa0K_\xa0Kb\xa1Ld\xa1Mf\xa2Mh\xa3Nk\xa3Nm\xa3O'
+        b'o\xa4Oq\xa4Ps\xa5Qv\xa5Qx\xa6Ry\xa6R{\xa7R}\xa7R'
+        b'~\xa7S\x80\xa8S\x82\xa8S\x83\xa9T\x85\xa9T\x87\xaaT\x88\xaaU\x8a\xabU'
+        b'\x8c\xabU\x8d\xabV\x8f\xacV\x91\xacV\x92\xadW\x94\xadW\x96\xaeW\x97\xaeX'
+        b'\x99\xaeX\x9a\xafX\x9c\xafX\x9e\xb0Y\x9f\xb0Y\xa1\xb1Y\xa3\xb1Z\xa4\xb2Z'
+        b'\xa6\xb2Z\xa8\xb2[\xa9\xb3[\xab\xb3[\xad\xb4\\\xae\xb4\\\xb0\xb5\\\xb2\xb5]'
+        b'\xb3\xb5]\xb5\xb6]\xb6\xb6^\xb7\xb5^\xb7\xb5^\xb8\xb4_\xb8\xb3_\xb9\xb2_'
+        b'\xb9\xb1_\xb9\xb0`\xba\xaf`\xba\xaf`\xbb\xaea\xbb\xada\xbc\xaca\xbc\xabb'
+        b'\xbc\xaab\xbd\xa9b\xbd\xa9c\xbe\xa8c\xbe\xa7c\xbe\xa6d\xbf\xa5d\xbf\xa4d'
+        b'\xc0\xa3e\xc0\xa3g\xc1\xa3i\xc2\xa3l\xc3\xa4n\xc5\xa4q\xc6\xa5s\xc7\xa6v'
+        b'\xc8\xa6x\xc9\xa7{\xca\xa8}\xcb\xa9\x7f\xcc\xaa\x82\xce\xab\x84\xcf\xac\x87\xd0\xad\x89'
+        b'\xd1\xad\x8c\xd2\xae\x8e\xd3\xaf\x91\xd4\xb0\x93\xd5\xb1\x96\xd6\xb2\x98\xd8\xb3\x9a\xd9\xb5\x9d'
+        b'\xda\xb6\x9f\xdb\xb7\xa2\xdc\xb9\xa4\xdd\xba\xa7\xde\xbc\xa9\xdf\xbd\xac\xe1\xbf\xaf\xe2\xc1\xb2'
+        b'\xe3\xc3\xb5\xe4\xc5\xb8\xe5\xc7\xbb\xe6\xc9\xbe\xe7\xcb\xc1\xe8\xcd\xc4\xe9\xcf\xc7\xeb\xd1\xca'
+        b'\xec\xd3\xcd\xed\xd5\xd0\xee\xd7\xd3\xef\xd9\xd6\xf0\xdc\xd9\xf1\xde\xdc\xf2\xe0\xdf\xf4\xe3\xe2'
+        b'\xf5\xe6\xe5\xf6\xe9\xe8\xf7\xec\xeb\xf8\xef\xee\xf9\xf2\xf1\xfa\xf5\xf4\xfb\xf8\xf7\xfd\xfa\xfa'
+    ),
+    "terrain": (
+        b'33\x9915\x9b08\x9e/;\xa1-=\xa3,@\xa6+C\xa9)E\xab'
+        b"(H\xae'K\xb1%M\xb3$P\xb6#S\xb9!U\xbb X\xbe\x1f[\xc1"
+        b'\x1d]\xc3\x1c`\xc6\x1bb\xc9\x19e\xcb\x18h\xce\x17k\xd1\x15m\xd3\x14p\xd6'
+        b'\x13s\xd9\x11u\xdb\x10x\xde\x0e{\xe1\r}\xe3\x0c\x80\xe6\x0b\x83\xe9\t\x85\xeb'
+        b'\x08\x88\xee\x07\x8a\xf1\x05\x8d\xf3\x04\x90\xf6\x03\x93\xf9\x01\x95\xfb\x00\x98\xfe\x00\x9a\xfa'
+        b'\x00\x9c\xf4\x00\x9e\xee\x00\xa0\xe8\x00\xa2\xe2\x00\xa4\xdc\x00\xa6\xd6\x00\xa8\xd0\x00\xaa\xca'
+        b'\x00\xac\xc4\x00\xae\xbe\x00\xb0\xb8\x00\xb2\xb2\x00\xb4\xac\x00\xb6\xa6\x00\xb8\xa0\x00\xba\x9a'
+        b'\x00\xbc\x94\x00\xbe\x8e\x00\xc0\x88\x00\xc2\x82\x00\xc4|\x00\xc6v\x00\xc8p\x00\xcaj'
+        b'\x01\xccf\x05\xcdg\x08\xcdg\r\xceh\x11\xcfi\x15\xd0j\x19\xd1k\x1d\xd1k'
+        b'!\xd2l%\xd3m(\xd4n-\xd5o1\xd5o5\xd6p9\xd7q=\xd8r'
+        b'A\xd9sE\xd9sH\xdatM\xdbuQ\xdcvU\xddwY\xddw]\xdex'
+        b'a\xdfye\xe0zh\xe1zm\xe1{q\xe2|u\xe3}y\xe4~}\xe5\x7f'
+        b'\x81\xe5\x7f\x85\xe6\x80\x88\xe7\x81\x8d\xe8\x82\x91\xe9\x83\x95\xe9\x83\x99\xea\x84\x9d\xeb\x85'
+        b'\xa1\xec\x86\xa5\xed\x87\xa8\xed\x87\xad\xee\x88\xb1\xef\x89\xb5\xf0\x8a\xb9\xf1\x8b\xbd\xf1\x8b'
+        b'\xc1\xf2\x8c\xc5\xf3\x8d\xc8\xf4\x8e\xcd\xf5\x8f\xd1\xf5\x8f\xd5\xf6\x90\xd9\xf7\x91\xdd\xf8\x92'
+        b'\xe1\xf9\x93\xe5\xf9\x93\xe8\xfa\x94\xed\xfb\x95\xf1\xfc\x96\xf5\xfd\x97\xf9\xfd\x97\xfd\xfe\x98'
+        b'\xfe\xfd\x98\xfc\xfb\x97\xfa\xf8\x96\xf8\xf6\x95\xf6\xf3\x94\xf4\xf0\x93\xf2\xee\x91\xf0\xeb\x90'
+        b'\xee\xe9\x8f\xec\xe6\x8e\xea\xe4\x8d\xe8\xe1\x8c\xe6\xdf\x8b\xe4\xdc\x8a\xe2\xd9\x89\xe0\xd7\x88'
+        b'\xde\xd4\x87\xdc\xd2\x86\xda\xcf\x85\xd8\xcd\x83\xd6\xca\x82\xd3\xc7\x81\xd2\xc5\x80\xd0\xc2\x7f'
+        b'\xce\xc0~\xcc\xbd}\xca\xbb|\xc8\xb8{\xc6\xb6z\xc3\xb3y\xc2\xb0x\xc0\xaev'
+        b'\xbe\xabu\xbc\xa9t\xba\xa6s\xb8\xa4r\xb6\xa1q\xb3\x9fp\xb2\x9co\xb0\x99n'
+        b'\xae\x97m\xac\x94l\xaa\x92k\xa8\x8fj\xa6\x8dh\xa3\x8ag\xa2\x87f\xa0\x85e'
+        b'\x9e\x82d\x9c\x80c\x9a}b\x98{a\x96x`\x93v_\x92s^\x90p]'
+        b'\x8en[\x8ckZ\x8aiY\x88fX\x86dW\x83aV\x82_U\x80\\T'
+        b'\x81]V\x83`X\x85b[\x87e^\x88g`\x8bjc\x8dmf\x8foh'
+        b'\x91rk\x93tn\x95wp\x97ys\x99|v\x9b\x7fy\x9d\x81{\x9f\x84~'
+        b'\xa1\x86\x81\xa3\x89\x83\xa5\x8b\x86\xa7\x8e\x89\xa8\x90\x8b\xab\x93\x8e\xad\x96\x91\xaf\x98\x93'
+        b'\xb1\x9b\x96\xb3\x9d\x99\xb5\xa0\x9b\xb7\xa2\x9e\xb9\xa5\xa1\xbb\xa7\xa3\xbd\xaa\xa6\xbf\xad\xa9'
+        b'\xc1\xaf\xab\xc3\xb2\xae\xc4\xb4\xb1\xc7\xb7\xb3\xc8\xb9\xb6\xcb\xbc\xb9\xcd\xbf\xbb\xcf\xc1\xbe'
+        b'\xd1\xc4\xc1\xd3\xc6\xc4\xd4\xc9\xc6\xd7\xcb\xc9\xd9\xce\xcc\xdb\xd0\xce\xdd\xd3\xd1\xdf\xd6\xd4'
+        b'\xe1\xd8\xd6\xe3\xdb\xd9\xe4\xdd\xdc\xe7\xe0\xde\xe8\xe2\xe1\xeb\xe5\xe4\xed\xe7\xe6\xef\xea\xe9'
+        b'\xf1\xed\xec\xf3\xef\xee\xf4\xf2\xf1\xf7\xf4\xf4\xf9\xf7\xf6\xfb\xf9\xf9\xfd\xfc\xfc\xff\xff\xff'
+    ),
+}
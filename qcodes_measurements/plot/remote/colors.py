@@ -12,15 +12,17 @@
 # You should have received a copy of the CC0 legalcode along with this
 # work.  If not, see <http://creativecommons.org/publicdomain/zero/1.0/>.
 
+import os
 from math import ceil
 from typing import Dict, List, Tuple, Union
 
-# In addition, try and load extra matplotlib colormaps
-import matplotlib as mpl
+import numpy as np
 from numpy import linspace, ndarray
 from pyqtgraph import ColorMap
 from pyqtgraph.graphicsItems import GradientEditorItem
 
+from . import colormap_tables
+
 __all__ = ["COLORMAPS", "DEFAULT_CMAP"]
 
 _MAGMA_DATA = (
@@ -1059,49 +1061,141 @@ _VIRIDIS_DATA = (
     (0.993248, 0.906157, 0.143936),
 )
 _GREY_DATA = ((0, 0, 0), (1, 1, 1))
-__data__: Dict[str, Union[List, Tuple, ndarray]] = {
-    "magma": _MAGMA_DATA,
-    "inferno": _INFERNO_DATA,
-    "plasma": _PLASMA_DATA,
-    "viridis": _VIRIDIS_DATA,
-    "grey": _GREY_DATA,
-}
 
-# Add some extra matplotlib colors
-gradient = linspace(0, 1, 256)
-# More perceptually uniform color schemes
-__data__["cividis"] = mpl.colormaps["cividis"](gradient)[:, 0:3]
-# Diverging color schemes
-__data__["twilight"] = mpl.colormaps["twilight"](gradient)[:, 0:3]
-__data__["twilight_shifted"] = mpl.colormaps["twilight_shifted"](gradient)[:, 0:3]
-__data__["Spectral"] = mpl.colormaps["Spectral"](gradient)[:, 0:3]
-__data__["SpectralBack"] = mpl.colormaps["Spectral"](gradient)[:, 0:3][::-1]
-__data__["coolwarm"] = mpl.colormaps["coolwarm"](gradient)[:, 0:3]
-__data__["bwr"] = mpl.colormaps["bwr"](gradient)[:, 0:3]
-__data__["RdBu"] = mpl.colormaps["RdBu"](gradient)[:, 0:3]
-# Others
-__data__["ocean"] = mpl.colormaps["ocean"](gradient)[:, 0:3]
-__data__["gist_earth"] = mpl.colormaps["gist_earth"](gradient)[:, 0:3]
-__data__["terrain"] = mpl.colormaps["terrain"](gradient)[:, 0:3]
+# Extra matplotlib colormaps, as (name, matplotlib name, reversed)
+_MPL_COLORMAPS = (
+    # More perceptually uniform color schemes
+    ("cividis", "cividis", False),
+    # Diverging color schemes
+    ("twilight", "twilight", False),
+    ("twilight_shifted", "twilight_shifted", False),
+    ("Spectral", "Spectral", False),
+    ("SpectralBack", "Spectral", True),
+    ("coolwarm", "coolwarm", False),
+    ("bwr", "bwr", False),
+    ("RdBu", "RdBu", False),
+    # Others
+    ("ocean", "ocean", False),
+    ("gist_earth", "gist_earth", False),
+    ("terrain", "terrain", False),
+)
+
+
+def _colormap_data() -> Dict[str, Union[List, Tuple, ndarray]]:
+    """
+    Return the colors of each colormap, with components between 0 and 1. Sampling
+    the matplotlib colormaps requires matplotlib.
+    """
+    import matplotlib as mpl
+
+    data: Dict[str, Union[List, Tuple, ndarray]] = {
+        "magma": _MAGMA_DATA,
+        "inferno": _INFERNO_DATA,
+        "plasma": _PLASMA_DATA,
+        "viridis": _VIRIDIS_DATA,
+        "grey": _GREY_DATA,
+    }
+    gradient = linspace(0, 1, 256)
+    for name, mpl_name, reverse in _MPL_COLORMAPS:
+        colors = mpl.colormaps[mpl_name](gradient)[:, 0:3]
+        data[name] = colors[::-1] if reverse else colors
+    return data
+
+
+def write_tables(path=None):
+    """
+    Regenerate the precomputed colormap tables in colormap_tables.py, which are loaded
+    in place of sampling the colormaps each time the plot process starts.
+    """
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), "colormap_tables.py")
+    lines = [
+        "# Generated by `python -m qcodes_measurements.plot.remote.colors`. Do not edit.",
+        "# The colors of each colormap, as packed 8-bit RGB triples.",
+        "",
+        "TABLES = {",
+    ]
+    for name, data in _colormap_data().items():
+        table = (np.asarray(data, dtype=np.float64) * 255).astype(np.uint8).tobytes()
+        lines.append(f'    "{name}": (')
+        for i in range(0, len(table), 24):
+            lines.append(f"        {table[i:i + 24]!r}")
+        lines.append("    ),")
+    lines.append("}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+class _ColorMaps(dict):
+    """
+    Colormaps by name. Each colormap is built from its gradient the first time it is
+    used.
+    """
+
+    def __init__(self, gradients):
+        super().__init__()
+        self._gradients = gradients
+
+    def __missing__(self, name):
+        if name not in self._gradients:
+            raise KeyError(name)
+        pos, colors = zip(*self._gradients[name]["ticks"])
+        cmap = ColorMap(pos=list(pos), color=list(colors))
+        self[name] = cmap
+        return cmap
+
+    def __contains__(self, name):
+        return super().__contains__(name) or name in self._gradients
+
+    def _build_all(self):
+        for name in self._gradients:
+            if not super().__contains__(name):
+                self.__missing__(name)
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+    def __iter__(self):
+        self._build_all()
+        return super().__iter__()
+
+    def __len__(self):
+        self._build_all()
+        return super().__len__()
+
+    def keys(self):
+        self._build_all()
+        return super().keys()
+
+    def values(self):
+        self._build_all()
+        return super().values()
+
+    def items(self):
+        self._build_all()
+        return super().items()
 
 
-COLORMAPS = {}
 GRADIENTS = GradientEditorItem.Gradients
 GRADIENTS.clear()
-for name, data in __data__.items():
+for name, table in colormap_tables.TABLES.items():
+    data = np.frombuffer(table, dtype=np.uint8).reshape(-1, 3).tolist()
     step = ceil(len(data) / 16)
     pos = linspace(0.0, 1.0, len(data[::step]))
-    data = list((int(r * 255), int(g * 255), int(b * 255)) for r, g, b in data)
-    rcmap = ColorMap(pos=pos, color=data[::step])
-    GRADIENTS[name] = {"ticks": list(zip(pos, data[::step])), "mode": "rgb"}
-    COLORMAPS[name] = rcmap
+    GRADIENTS[name] = {
+        "ticks": list(zip(pos, map(tuple, data[::step]))),
+        "mode": "rgb",
+    }
     if name == "viridis":
         pos = [0.0] + list(1 / (x**1.5) for x in range(15, 0, -1))
-        rcmap = ColorMap(pos=pos, color=data[::step])
         GRADIENTS[name + "_nlin"] = {
-            "ticks": list(zip(pos, data[::step])),
+            "ticks": list(zip(pos, map(tuple, data[::step]))),
             "mode": "rgb",
         }
-        COLORMAPS[name + "_nlin"] = rcmap
-    del name, data, step, pos, rcmap
+    del name, table, data, step, pos
+COLORMAPS = _ColorMaps(dict(GRADIENTS))
 DEFAULT_CMAP = "viridis"
+
+
+if __name__ == "__main__":
+    write_tables()
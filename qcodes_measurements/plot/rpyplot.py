@@ -25,4 +25,15 @@ __all__ = ['remote', 'ExtendedPlotWindow', 'DraggableTextItem', 'ExtendedPlotDat
            'ColorMap', 'LegendItem', 'PlotDataItem', 'ImageItem', 'VoronoiPlot',
            'TableWidget', 'LabelItem', 'setConfigOption', 'setConfigOptions',
            'ColorMesh', 'getConfigOption', 'pyqtgraph', 'COLORMAPS', 'DEFAULT_CMAP',
-           'get_logger', 'set_log_level', 'mkPen', 'mkBrush']
+           'get_logger', 'set_log_level', 'mkPen', 'mkBrush', 'describe_attribute']
+
+
+def describe_attribute(obj, name):
+    """
+    Return whether the attribute of obj with the given name is callable, and whether it
+    is defined on the type of obj, so is the same for every object of that type, rather
+    than on obj itself.
+    """
+    on_type = any(name in cls.__dict__ for cls in type(obj).__mro__)
+    on_instance = name in getattr(obj, "__dict__", ())
+    return callable(getattr(obj, name)), on_type and not on_instance
@@ -0,0 +1,345 @@
+"""
+A plot server that can be shared between python processes.
+
+By default, each python process starts its own plot process. Instead, a single plot
+server can be run, which listens on a local socket (a unix domain socket, or a TCP port
+on localhost on windows) and accepts connections from any number of processes using the
+same protocol. The server is detached from the process that starts it, so windows
+survive kernel restarts and a restarted kernel connects to the existing server.
+
+The server can be started by hand with::
+
+    QCM_REMOTE=plot_server python -m qcodes_measurements.plot.server
+
+or is started on demand by connect().
+"""
+
+import argparse
+import getpass
+import itertools
+import json
+import multiprocessing.connection
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from .multiprocess import LocalObjectProxy, RemoteQtEventHandler, ServerConnection
+from ..logging import LoggingStream, get_logger
+
+__all__ = ["connect", "serve", "server_dir"]
+
+# Name of the remote process, used in logging
+SERVER_NAME = "plot_server"
+
+# Time to wait for a newly launched server to start accepting connections
+START_TIMEOUT = 20
+
+# Identifies the clients of the server, starting from 1 (see
+# ExtendedPlotWindow.currentClient)
+_client_ids = itertools.count(1)
+
+
+def server_dir() -> str:
+    """
+    Return the directory in which the server's socket and credentials are stored,
+    creating it if it doesn't exist. It is only accessible by the current user.
+    """
+    path = os.path.join(
+        tempfile.gettempdir(), f"qcm-plot-server-{getpass.getuser()}"
+    )
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+def _address_file():
+    return os.path.join(server_dir(), "server.json")
+
+
+def _authkey(create=False):
+    """
+    Read the key used to authenticate clients, creating it if necessary.
+    """
+    path = os.path.join(server_dir(), "authkey")
+    if create:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, "wb") as f:
+                f.write(os.urandom(32))
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _read_address():
+    """
+    Read the address of the running server, or return None if there isn't one.
+    """
+    try:
+        with open(_address_file(), encoding="utf-8") as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    address = info["address"]
+    if info["family"] == "AF_INET":
+        address = tuple(address)
+    return info["family"], address
+
+
+def _try_connect():
+    """
+    Open a connection to the running server, or return None if no server is running.
+    """
+    address = _read_address()
+    if address is None:
+        return None
+    family, address = address
+    try:
+        return multiprocessing.connection.Client(
+            address, family=family, authkey=_authkey()
+        )
+    except (OSError, EOFError, multiprocessing.AuthenticationError):
+        return None
+
+
+def _launch():
+    """
+    Start a detached server process.
+    """
+    env = dict(os.environ, QCM_REMOTE=SERVER_NAME)
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = (
+            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    else:
+        kwargs["start_new_session"] = True
+    subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, "-m", "qcodes_measurements.plot.server"],
+        env=env,
+        cwd=server_dir(),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs,
+    )
+
+
+def connect(start=True, timeout=START_TIMEOUT, debug=False) -> ServerConnection:
+    """
+    Connect to the plot server, starting it if it isn't running and start is True.
+    The returned connection is used in place of a QtProcess.
+    """
+    conn = _try_connect()
+    if conn is None:
+        if not start:
+            raise ConnectionError("No plot server is running.")
+        get_logger("PlotServer").info("Starting plot server.")
+        _launch()
+        deadline = time.monotonic() + timeout
+        while conn is None:
+            if time.monotonic() > deadline:
+                raise TimeoutError("Timed out waiting for the plot server to start.")
+            time.sleep(0.1)
+            conn = _try_connect()
+    return ServerConnection(conn, debug=debug)
+
+
+def _lock(path):
+    """
+    Take a lock on the given file that is held as long as this process is running,
+    ensuring only one server runs at a time. Returns the open file, or None if another
+    process holds the lock.
+    """
+    f = open(path, "a+b")  # pylint: disable=consider-using-with
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+
+class ClientHandler(RemoteQtEventHandler):
+    """
+    Handles requests from a single client of the plot server. The objects proxied for
+    the client are released once it disconnects, and the windows it created are left
+    open without an owner.
+    """
+
+    def __init__(self, server, conn, logger):
+        self.server = server
+        self.clientId = next(_client_ids)
+        # Ids of the objects proxied for the client, that it hasn't released yet
+        self.proxyIds = set()
+        super().__init__(conn, SERVER_NAME, None, logger=logger)
+        self.logger.info("Client %d connected.", self.remotePid)
+
+    def handleRequest(self):
+        from .remote.PlotWindow import ExtendedPlotWindow
+
+        # Windows created while handling the request belong to this client
+        previous = ExtendedPlotWindow.currentClient
+        ExtendedPlotWindow.currentClient = self.clientId
+        try:
+            return super().handleRequest()
+        finally:
+            ExtendedPlotWindow.currentClient = previous
+
+    def _sendMessage(self, *args, **kwargs):
+        # Objects are registered with LocalObjectProxy as the message is pickled
+        first = LocalObjectProxy.nextProxyId
+        try:
+            return super()._sendMessage(*args, **kwargs)
+        finally:
+            self.proxyIds.update(range(first, LocalObjectProxy.nextProxyId))
+
+    def releaseProxy(self, proxyId):
+        self.proxyIds.discard(proxyId)
+        super().releaseProxy(proxyId)
+
+    def connectionClosed(self):
+        from .remote.PlotWindow import ExtendedPlotWindow
+
+        self.logger.info("Client %d disconnected.", self.remotePid)
+        self.conn.close()
+        if RemoteQtEventHandler.handlers.get(self.remotePid) is self:
+            del RemoteQtEventHandler.handlers[self.remotePid]
+
+        for proxyId in self.proxyIds:
+            LocalObjectProxy.proxiedObjects.pop(proxyId, None)
+        self.logger.info(
+            "Released %d objects proxied for client %d.",
+            len(self.proxyIds),
+            self.remotePid,
+        )
+        self.proxyIds.clear()
+        ExtendedPlotWindow.orphanWindows(self.clientId)
+        self.server.clientClosed(self)
+
+
+def serve(quit_on_close=False, debug=False):
+    """
+    Run the plot server until the application quits. If quit_on_close is True, the
+    server quits once the last client disconnects.
+    """
+    os.environ.setdefault("QCM_REMOTE", SERVER_NAME)
+    logger = get_logger(debug=debug)
+
+    lock = _lock(os.path.join(server_dir(), "server.lock"))
+    if lock is None:
+        logger.info("A plot server is already running.")
+        return 0
+
+    from Qt import QtCore, QtWidgets
+
+    # Import plotting up front, so clients don't wait for it
+    from . import rpyplot  # pylint: disable=unused-import
+
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        app = QtWidgets.QApplication([])
+    app.setQuitOnLastWindowClosed(False)
+
+    if sys.platform == "win32":
+        family, address = "AF_INET", ("127.0.0.1", 0)
+    else:
+        family, address = "AF_UNIX", os.path.join(server_dir(), "plot.sock")
+        # Any existing socket was left behind by a server that didn't exit cleanly
+        if os.path.exists(address):
+            os.unlink(address)
+    listener = multiprocessing.connection.Listener(
+        address, family=family, authkey=_authkey(create=True)
+    )
+    address = listener.address
+
+    class Server(QtCore.QObject):
+        connected = QtCore.Signal(object)
+
+        def __init__(self):
+            super().__init__()
+            self.clients = []
+            self.connected.connect(self.clientConnected)
+
+        def accept(self):
+            # Connections are authenticated in this thread, and handed to the main
+            # thread, which owns the proxied objects
+            while True:
+                try:
+                    conn = listener.accept()
+                except multiprocessing.AuthenticationError:
+                    logger.warning("Rejected a client that failed to authenticate.")
+                    continue
+                except OSError:
+                    return
+                self.connected.emit(conn)
+
+        def clientConnected(self, conn):
+            try:
+                client = ClientHandler(self, conn, logger)
+            except (OSError, EOFError):
+                logger.exception("Failed to set up connection to client.")
+                conn.close()
+                return
+            self.clients.append(client)
+            client.startEventNotifier()
+
+        def clientClosed(self, client):
+            if client in self.clients:
+                self.clients.remove(client)
+            if quit_on_close and not self.clients:
+                logger.info("Last client disconnected. Quitting.")
+                app.quit()
+
+    server = Server()
+    threading.Thread(target=server.accept, name="PlotServerAccept", daemon=True).start()
+
+    with open(_address_file(), "w", encoding="utf-8") as f:
+        json.dump({"family": family, "address": address, "pid": os.getpid()}, f)
+    logger.info("Plot server listening on %r.", address)
+
+    try:
+        return app.exec_()
+    finally:
+        try:
+            os.unlink(_address_file())
+        except OSError:
+            pass
+        listener.close()
+        lock.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a plot server that is shared between python processes."
+    )
+    parser.add_argument(
+        "--quit-on-close",
+        action="store_true",
+        help="Quit once the last client disconnects",
+    )
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    args = parser.parse_args()
+    os.environ.setdefault("QCM_REMOTE", SERVER_NAME)
+
+    # Redirect stdout and stderr to the logger
+    logger = get_logger(debug=args.debug)
+    sys.stdout = LoggingStream(logger, "info")
+    sys.stderr = LoggingStream(logger, "error")
+
+    sys.exit(serve(quit_on_close=args.quit_on_close, debug=args.debug))
+
+
+if __name__ == "__main__":
+    main()
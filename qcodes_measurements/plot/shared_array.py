@@ -0,0 +1,248 @@
+"""
+Numpy arrays backed by shared memory, used to pass large arrays to the plot process
+without pickling them through the pipe.
+
+The local side owns each block through a SharedArray, which unlinks the block when it
+is garbage collected. SharedBuffers tracks the blocks that data is sent to one remote
+object through, so that a block isn't rewritten or released while the remote may still
+be reading it. The remote side attaches to blocks by name, and keeps them open until
+they are detached or replaced. A SharedAttachment tracks the blocks used by one remote
+object, detaching them when the object goes away.
+"""
+
+import collections
+import sys
+import weakref
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from ..logging import get_logger
+
+logger = get_logger("SharedArray")
+
+__all__ = [
+    "SHARED_MEMORY_THRESHOLD",
+    "SHARED_BUFFERS",
+    "SharedArray",
+    "SharedBuffers",
+    "SharedAttachment",
+    "attach",
+    "detach",
+]
+
+# Arrays smaller than this (in bytes) are cheaper to send through the pipe
+SHARED_MEMORY_THRESHOLD = 64 * 1024
+
+# Number of blocks that data is sent to one object through, so that a block can be
+# written while the remote is still reading the previous one
+SHARED_BUFFERS = 2
+
+# Longest time, in seconds, to wait for the remote to finish reading a block before it
+# is reused anyway
+BUFFER_TIMEOUT = 10
+
+# Blocks that have been attached to in this process
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+def _release(shm: shared_memory.SharedMemory):
+    """
+    Close and unlink a shared memory block. If arrays still reference the block, the
+    memory is freed once they are released.
+    """
+    try:
+        shm.close()
+    except BufferError:
+        pass
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class SharedArray:
+    """
+    A numpy array stored in a block of shared memory owned by this process.
+    """
+
+    def __init__(self, shape, dtype=np.float64):
+        self.shape = tuple(int(s) for s in shape)
+        self.dtype = np.dtype(dtype)
+        if self.dtype.hasobject:
+            raise TypeError("Can't store object arrays in shared memory")
+        size = max(1, int(np.prod(self.shape)) * self.dtype.itemsize)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)
+        self._finalizer = weakref.finalize(self, _release, self._shm)
+        logger.debug("Created shared array %s with shape %r.", self.name, self.shape)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def descriptor(self) -> tuple[str, tuple[int, ...], str]:
+        """
+        Return the (name, shape, dtype) triple that the remote uses to attach to
+        this array.
+        """
+        return (self.name, self.shape, self.dtype.str)
+
+    def matches(self, shape, dtype) -> bool:
+        """
+        Check whether this array can hold data with the given shape and dtype
+        """
+        return self.shape == tuple(shape) and self.dtype == np.dtype(dtype)
+
+    def close(self):
+        """
+        Release the shared memory block.
+        """
+        self._finalizer()
+
+
+def _answered(request) -> bool:
+    """
+    Check whether the remote has handled a call, reading its reply if it has arrived.
+    A call that failed, or whose connection closed, no longer holds its block.
+    """
+    try:
+        return request.hasResult()
+    except Exception:  # pylint: disable=broad-except
+        logger.warning("Call reading a shared array failed.", exc_info=True)
+        return True
+
+
+class SharedBuffers:
+    """
+    The shared memory blocks that data is sent to one remote object through, on the
+    local side. A block is busy from when a call that reads it is sent until the remote
+    has handled that call. Busy blocks are never rewritten, and are kept alive even
+    once data of a different shape is sent, so that calls that haven't been handled yet
+    never find their block missing or half overwritten.
+    """
+
+    def __init__(self, count=SHARED_BUFFERS, timeout=BUFFER_TIMEOUT):
+        self.count = count
+        self.timeout = timeout
+        self._free: list[SharedArray] = []
+        # Busy blocks, along with the request answered once the remote has read them,
+        # oldest first
+        self._busy: collections.deque = collections.deque()
+
+    def _reclaim(self):
+        """
+        Free the blocks that the remote has finished reading.
+        """
+        busy = self._busy
+        while busy and _answered(busy[0][1]):
+            self._free.append(busy.popleft()[0])
+
+    def acquire(self, shape, dtype) -> SharedArray:
+        """
+        Return a block that can hold data with the given shape and dtype, and that the
+        remote isn't reading. If count blocks are busy, wait for the remote to finish
+        reading the oldest.
+        """
+        self._reclaim()
+        if not self._free and len(self._busy) >= self.count:
+            shared, request = self._busy.popleft()
+            try:
+                request.result(timeout=self.timeout)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning(
+                    "Gave up waiting for the remote to read shared array %s.",
+                    shared.name,
+                    exc_info=True,
+                )
+            self._free.append(shared)
+
+        for i, shared in enumerate(self._free):
+            if shared.matches(shape, dtype):
+                return self._free.pop(i)
+        # Free blocks of another shape are no longer needed
+        while self._free and len(self._free) + len(self._busy) >= self.count:
+            self._free.pop().close()
+        return SharedArray(shape, dtype)
+
+    def sent(self, shared: SharedArray, request):
+        """
+        Mark a block returned by acquire as busy until request is answered, which
+        happens once the remote has handled the call that reads it.
+        """
+        self._busy.append((shared, request))
+
+
+def attach(name: str, shape, dtype) -> np.ndarray:
+    """
+    Return an array backed by the shared memory block with the given name, without
+    copying. The block stays attached until detach is called.
+    """
+    shm = _attached.get(name)
+    if shm is None:
+        if sys.version_info >= (3, 13):
+            # The block is owned by the process that created it
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            # Otherwise the resource tracker of this process unlinks the block, which
+            # is owned by the process that created it, when this process exits
+            # pylint: disable-next=protected-access
+            resource_tracker.unregister(shm._name, "shared_memory")
+        _attached[name] = shm
+        logger.debug("Attached to shared array %s.", name)
+    return np.ndarray(tuple(shape), dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def detach(name: str):
+    """
+    Detach from a shared memory block. Arrays returned by attach must no longer be used.
+    """
+    shm = _attached.pop(name, None)
+    if shm is not None:
+        try:
+            shm.close()
+        except BufferError:
+            logger.warning("Shared array %s still in use when detached.", name)
+
+
+def _detach_all(current: list[str]):
+    """
+    Detach from each of the blocks named in current.
+    """
+    while current:
+        detach(current.pop())
+
+
+class SharedAttachment:
+    """
+    The shared memory blocks that data is sent to one object through, on the remote
+    side. The most recently used blocks (see SHARED_BUFFERS) are kept attached: older
+    blocks are detached as data arrives in new ones, and the rest are detached when the
+    attachment is closed or garbage collected.
+    """
+
+    def __init__(self, count=SHARED_BUFFERS):
+        self.count = count
+        # Names of the attached blocks, least recently used first
+        self._current: list[str] = []
+        self._finalizer = weakref.finalize(self, _detach_all, self._current)
+
+    def array(self, name: str, shape, dtype) -> np.ndarray:
+        """
+        Return an array backed by the block with the given name (see attach).
+        """
+        current = self._current
+        if name in current:
+            current.remove(name)
+        else:
+            while len(current) >= self.count:
+                detach(current.pop(0))
+        current.append(name)
+        return attach(name, shape, dtype)
+
+    def close(self):
+        """
+        Detach from the attached blocks.
+        """
+        _detach_all(self._current)
@@ -7,8 +7,11 @@ import functools
 import inspect
 import itertools
 import re
+import threading
+import time
+import uuid
 from dataclasses import dataclass, field
-from typing import Any, Iterable, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import qcodes.dataset
@@ -17,11 +20,25 @@ from qcodes.dataset.data_set import DataSet
 from qcodes.parameters import ParameterBase, ParamSpecBase
 
 from ..logging import get_logger
-from ..plot import ImageItem, PlotDataItem, PlotItem, PlotWindow, TableWidget
+from ..plot import (
+    ExtendedImageItem,
+    ExtendedPlotDataItem,
+    ImageItem,
+    PlotDataItem,
+    PlotItem,
+    PlotWindow,
+    TableWidget,
+)
+from ..plot.local.RemoteProcessWrapper import batch, flush_remote, remote_busy
+from ..plot.multiprocess import ClosedError
 from ..plot.plot_tools import save_figure
 
 
-class _GlobalState:
+class _GlobalState(threading.local):
+    """
+    The live plot being set up by the do*d call running in each thread.
+    """
+
     def __init__(self):
         self.current: LivePlotWindow | None = None
 
@@ -29,8 +46,16 @@ class _GlobalState:
 # Get access to module level variables
 this = _GlobalState()
 this.current = None
+
+# Live plots of running measurements, by dataset guid, so that measurements can run
+# concurrently in different threads
+_live_plots: dict[str, "LivePlotWindow"] = {}
+_live_plots_lock = threading.Lock()
 logger = get_logger("tools.doNd")
 
+# Maximum rate at which live plots are redrawn
+DEFAULT_MAX_FPS = 20.0
+
 
 # Utility functions for parsing parameter names from plot titles
 _param = r"(\w+)\s+\([^)]+\)"
@@ -129,20 +154,21 @@ def _parse_title(title) -> Tuple[str, Tuple[str, ...], Tuple[int, ...]]:
 
 
 def _compatible_plot_item(
-    win: PlotWindow, p_bot: ParamSpecBase, p_left: Optional[ParamSpecBase] = None
+    plots: Sequence[tuple[tuple[str, ...], PlotItem]],
+    p_bot: ParamSpecBase,
+    p_left: Optional[ParamSpecBase] = None,
 ) -> Optional[PlotItem]:
     """
-    Returns a compatible plot item if found
+    Returns a compatible plot item if found, given the plot items of a window along
+    with the names of the parameters on their axes (see _parse_title)
     """
     if p_left is not None:
         axes = (p_bot.name, p_left.name)
     else:
         axes = (p_bot.name,)
-    for item in win.items:
-        if isinstance(item, PlotItem):
-            _, params, _ = _parse_title(item.plot_title)
-            if params == axes:
-                return item
+    for params, item in plots:
+        if params == axes:
+            return item
     return None
 
 
@@ -154,7 +180,7 @@ def _register_subscriber():
         logger.info("Registering qcm as a default subscriber")
         config.subscription.subscribers["qcm"] = {
             "factory": "qcodes_measurements.tools.doNd.subscriber",
-            "factory_kwargs": {},
+            "factory_kwargs": {"max_fps": DEFAULT_MAX_FPS, "in_process": True},
             "subscription_kwargs": {
                 "min_wait": 10,
                 "min_count": 0,
@@ -164,6 +190,166 @@ def _register_subscriber():
         config.subscription.default_subscribers.append("qcm")
 
 
+class _FrameScheduler:
+    """
+    Decide when live plots should be redrawn. Frames are limited to max_fps, and are
+    skipped while the plot process is still busy with the updates sent so far, as
+    tracked by the outbox of the connection (see remote_busy). Since only data added
+    since the last frame is sent, skipped frames are coalesced into the next one, which
+    is sent once it is allowed even if no more data arrives (see defer).
+    """
+
+    # Give up waiting for the plot process after this long (s)
+    busy_timeout = 1.0
+    # Check again whether the plot process is still busy after this long (s)
+    retry_interval = 0.05
+
+    def __init__(self, max_fps: Optional[float] = DEFAULT_MAX_FPS):
+        self.min_interval = 1 / max_fps if max_fps else 0.0
+        self.last_frame = -float("inf")
+        self._deferred: threading.Timer | None = None
+
+    def ready(self) -> bool:
+        """
+        Check whether a new frame should be sent
+        """
+        since_last = time.monotonic() - self.last_frame
+        if since_last < self.min_interval:
+            return False
+        if since_last < self.busy_timeout:
+            try:
+                return not remote_busy()
+            except ClosedError:
+                pass
+        return True
+
+    def frame_sent(self):
+        """
+        Record that a frame was sent
+        """
+        self.last_frame = time.monotonic()
+
+    def defer(self, callback: Callable[[], None]):
+        """
+        Call callback once a skipped frame may be sent, unless a call is already
+        pending, so that the last data is drawn even if acquisition pauses.
+        """
+        if self._deferred is not None:
+            return
+        wait = self.min_interval - (time.monotonic() - self.last_frame)
+        self._deferred = threading.Timer(
+            max(wait, self.retry_interval), self._run_deferred, (callback,)
+        )
+        self._deferred.daemon = True
+        self._deferred.start()
+
+    def _run_deferred(self, callback):
+        self._deferred = None
+        try:
+            callback()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Error in deferred live plot update.")
+
+    def cancel(self):
+        """
+        Cancel any pending deferred frame
+        """
+        deferred, self._deferred = self._deferred, None
+        if deferred is not None:
+            deferred.cancel()
+
+
+class _CacheWatcher(threading.Thread):
+    """
+    Thread that calls a subscriber callback when new data is added to the cache of a
+    dataset. This replaces the qcodes subscriber, which uses sqlite triggers, and is
+    stopped in the same way by DataSet.unsubscribe_all.
+    """
+
+    def __init__(self, dataset: DataSet, callback, state=None, min_wait: int = 0):
+        super().__init__(daemon=True, name=f"qcm-watcher-{dataset.run_id}")
+        # No trigger is installed, but DataSet.unsubscribe drops it by name
+        self.trigger_id = f"qcm_{uuid.uuid4().hex}"
+        self.dataset = dataset
+        self.callback = callback
+        self.state = state
+        self.min_wait = min_wait / 1000
+        self._new_data = threading.Event()
+        self._stop_signal = False
+
+        # Hook the cache of the dataset, to be notified of new data
+        cache = dataset.cache
+        add_data = cache.add_data
+
+        def notify_add_data(*args, **kwargs):
+            add_data(*args, **kwargs)
+            self._new_data.set()
+
+        cache.add_data = notify_add_data
+
+    def run(self):
+        while not self._stop_signal:
+            self._new_data.wait()
+            self._new_data.clear()
+            if self._stop_signal:
+                break
+            self._call_callback()
+            time.sleep(self.min_wait)
+        # Make sure that the final state of the dataset is seen
+        self._call_callback()
+
+    def _call_callback(self):
+        try:
+            self.callback([], 0, self.state)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Error in live plot update for %d.", self.dataset.run_id)
+
+    def done_callback(self):
+        """
+        Called by the dataset when it is marked completed, so that the final state of
+        the dataset is seen before the measurement returns.
+        """
+        self._call_callback()
+
+    def schedule_stop(self):
+        if not self._stop_signal:
+            self._stop_signal = True
+            # Unhook the cache
+            self.dataset.cache.__dict__.pop("add_data", None)
+            self._new_data.set()
+
+
+def _subscribe_in_process(
+    dataset: DataSet,
+    callback,
+    min_wait: int = 0,
+    min_count: int = 1,  # pylint: disable=unused-argument
+    state=None,
+    callback_kwargs=None,
+) -> str:
+    """
+    Replacement for DataSet.subscribe that watches the dataset cache instead of
+    installing sqlite triggers.
+    """
+    # This replaces a single subscription, restore the original method
+    dataset.__dict__.pop("subscribe", None)
+
+    subscriber_id = uuid.uuid4().hex
+    if callback is do_nothing:
+        return subscriber_id
+    if callback_kwargs:
+        callback = functools.partial(callback, **callback_kwargs)
+    watcher = _CacheWatcher(dataset, callback, state, min_wait)
+    dataset.subscribers[subscriber_id] = watcher
+    watcher.start()
+    return subscriber_id
+
+
+# An update plan is called with the cached data for a parameter, and the number of
+# points written at the previous and current update
+_UpdatePlan = Callable[[dict[str, np.ndarray], int, int], None]
+
+
 # Tuple for live plotting
 @dataclass(frozen=False)
 class LivePlotWindow:
@@ -171,12 +357,23 @@ class LivePlotWindow:
     stack: bool = False
     append: bool = False
     dataset: Optional[DataSet] = None
+    # Guid of the dataset. Reading DataSet.guid queries the database, which can only be
+    # done from the thread that opened it
+    guid: Optional[str] = None
     datacount: dict[str, int] = field(default_factory=dict)
     table_items: Optional[dict[str, list[str]]] = None
     plot_items: dict[str, Union[PlotDataItem, ImageItem]] = field(default_factory=dict)
     plot_params: Optional[list[ParameterBase]] = None
     plot_param_names: Optional[set[str]] = None
     annotation: Optional[str] = None
+    # How points of 2D plots that haven't been measured yet are drawn (see
+    # ExtendedImageItem.setFillMode)
+    fill_mode: str = "mean"
+    fill_level: Optional[float] = None
+    scheduler: _FrameScheduler = field(default_factory=_FrameScheduler)
+    update_plans: dict[str, _UpdatePlan] = field(default_factory=dict)
+    # Held while the plots are updated
+    lock: threading.Lock = field(default_factory=threading.Lock)
 
 
 def do_nothing(new_data, data_len, state):
@@ -186,132 +383,170 @@ def do_nothing(new_data, data_len, state):
     return
 
 
-def update_plots(new_data, data_len, state):
+def _table_plan(table_items: dict[str, list[str]], name: str) -> _UpdatePlan:
+    """
+    Plan for a 0D parameter, which is added as a row in the table
+    """
+
+    def update(param_data, prev_count, count):
+        val = param_data[name][0]
+        if isinstance(val, (float, np.floating)):
+            val = np.format_float_scientific(val)
+        else:
+            val = str(val)
+        table_items[name].append(val)
+
+    return update
+
+
+def _trace_plan(
+    plotitem: ExtendedPlotDataItem, name: str, setpoint_name: str
+) -> _UpdatePlan:
+    """
+    Plan for a 1D parameter, sending only the points added since the last update
+    """
+
+    def update(param_data, prev_count, count):
+        plotitem.extendData(
+            param_data[setpoint_name][prev_count:count],
+            param_data[name][prev_count:count],
+        )
+
+    return update
+
+
+def _image_plan(
+    plotitem: ExtendedImageItem,
+    name: str,
+    bot_name: str,
+    left_name: str,
+    shape: tuple[int, int],
+) -> _UpdatePlan:
+    """
+    Plan for a 2D parameter. Initially the axes are set to some random range,
+    which are inferred from the setpoints as data comes in.
+    """
+    n_rows, n_cols = shape
+    no_xscale = True
+    no_yscale = True
+
+    def update(param_data, prev_count, count):
+        nonlocal no_xscale, no_yscale
+
+        # Update axis scales as data comes in
+        if no_xscale:
+            # Set Y-scale until we have the entire first column
+            if no_yscale and count >= n_cols:
+                ldata = param_data[left_name]
+                ymin, ymax = ldata[0, 0], ldata[0, -1]
+                plotitem.setpoint_y = np.linspace(ymin, ymax, n_cols)
+                no_yscale = False
+                plotitem.rescale()
+            elif no_yscale and count >= 2:
+                ldata = param_data[left_name]
+                ymin, step = ldata[0, 0], ldata[0, 1] - ldata[0, 0]
+                plotitem.setpoint_y = np.linspace(
+                    ymin, ymin + step * n_cols, n_cols, endpoint=False
+                )
+                plotitem.rescale()
+
+            # Set X-scale
+            if count / n_cols > 1:
+                bdata = param_data[bot_name]
+                xmin, step = bdata[0, 0], bdata[1, 0] - bdata[0, 0]
+                plotitem.setpoint_x = np.linspace(
+                    xmin, xmin + step * n_rows, n_rows, endpoint=False
+                )
+                no_xscale = False
+                plotitem.rescale()
+        # Rescale x-axis when we have all values in case of F.P. error
+        if count == n_rows * n_cols:
+            bdata = param_data[bot_name]
+            xmin, xmax = bdata[0, 0], bdata[-1, 0]
+            plotitem.setpoint_x = np.linspace(xmin, xmax, n_rows)
+            no_xscale = False
+            plotitem.rescale()
+
+        # Update the plot, sending only the rows that have changed since the
+        # last update. The last row sent may only be partially filled.
+        plotitem.updateRows(
+            param_data[name], prev_count // n_cols, -(-count // n_cols), count
+        )
+
+    return update
+
+
+def get_live_plot(dataset) -> Optional[LivePlotWindow]:
+    """
+    Return the live plot of a running measurement, given its dataset or guid, or None
+    if the dataset isn't being live plotted.
     """
-    Function that updates plots when live plotting
+    guid = dataset if isinstance(dataset, str) else dataset.guid
+    with _live_plots_lock:
+        return _live_plots.get(guid)
+
+
+def update_plots(new_data, data_len, state, force=False, guid=None):
+    """
+    Function that updates plots when live plotting. Updates are rate limited by the
+    scheduler of the current plot, unless force is True.
+
+    The live plot of the dataset with the given guid is updated, or if guid is None,
+    the live plot being set up in this thread.
     """
     # Assert that we are currenty plotting
-    if this.current is None or this.current.dataset is None:
+    current = this.current if guid is None else get_live_plot(guid)
+    if current is None or current.dataset is None or not current.update_plans:
         return
+    with current.lock:
+        _update_plots(current, force)
+
 
-    # Check that we know the shapes of data
-    shapes = this.current.dataset.description.shapes
-    if shapes is None:
+def _update_plots(current, force):
+    if not force and not current.scheduler.ready():
+        # Draw the skipped frame later, in case no more data arrives
+        current.scheduler.defer(
+            functools.partial(update_plots, [], 0, {}, guid=current.guid)
+        )
         return
 
-    write_count = this.current.dataset.cache._write_status
+    write_count = current.dataset.cache._write_status
     # Don't update if we haven't started measuring yet
     if not write_count or any(wc == 0 for wc in write_count.values()):
         return
-    run_desc = this.current.dataset.description
-    data_cache = this.current.dataset.cache.data()
-    params = run_desc.interdeps
-    plot_items: Iterable[tuple[str, PlotDataItem | ImageItem | list[str]]] = (
-        this.current.plot_items.items()
-    )
-    table_items: Iterable[tuple[str, PlotDataItem | ImageItem | list[str]]] = (
-        this.current.table_items.items() if this.current.table_items is not None else {}
-    )
-    for param, plotitem in itertools.chain(plot_items, table_items):  # type: ignore
+    data_cache = current.dataset.cache.data()
+    datacount = current.datacount
+    updated = False
+    for param, plan in current.update_plans.items():
         # Keep track of how much of the plot we've written, and only update
         # parameters that are being measured.
-        if param not in write_count:
-            continue
-        param_write_count = write_count[param]
+        param_write_count = write_count.get(param)
         if param_write_count is None:
             continue
-
-        if param not in this.current.datacount:
-            this.current.datacount[param] = param_write_count
-        elif param_write_count == this.current.datacount[param]:
+        prev_write_count = datacount.get(param, 0)
+        if param_write_count == prev_write_count:
             continue
-        else:
-            this.current.datacount[param] = param_write_count
+        datacount[param] = param_write_count
+        updated = True
+        plan(data_cache[param], prev_write_count, param_write_count)
 
-        # Update plots
-        if shapes[param] == (1,) and this.current.table_items:
-            val = data_cache[param][param][0]
-            if isinstance(val, (float, np.floating)):
-                val = np.format_float_scientific(val)
-            else:
-                val = str(val)
-            this.current.table_items[param].append(val)
-        elif len(shapes[param]) == 1 and isinstance(plotitem, PlotDataItem):
-            paramspec = params[param]
-            setpoint_param = params.dependencies[paramspec][0]
-            plotitem.setData(
-                data_cache[param][setpoint_param.name][: write_count[param]],
-                data_cache[param][param][: write_count[param]],
-            )
-        elif isinstance(plotitem, ImageItem):
-            paramspec = params[param]
-            bot_axis = params.dependencies[paramspec][0]
-            left_axis = params.dependencies[paramspec][1]
-            data = data_cache[param][param]
-
-            # Check if we are in the first column or if we need to clear nans
-            if np.isnan(data[-1, -1]) or param_write_count < shapes[param][1]:
-                meanval = data.flat[: write_count[param]].mean()
-                data.flat[write_count[param] :] = meanval
-
-            # Update axis scales as data comes in
-            if plotitem.no_xscale:
-                # Set Y-scale until we have the entire first column
-                if plotitem.no_yscale and param_write_count >= shapes[param][1]:
-                    ldata = data_cache[param][left_axis.name]
-                    ymin, ymax = ldata[0, 0], ldata[0, -1]
-                    plotitem.setpoint_y = np.linspace(ymin, ymax, shapes[param][1])
-                    plotitem.no_yscale = False
-                    plotitem.rescale()
-                elif plotitem.no_yscale and param_write_count >= 2:
-                    ldata = data_cache[param][left_axis.name]
-                    ymin, step = ldata[0, 0], ldata[0, 1] - ldata[0, 0]
-                    plotitem.setpoint_y = np.linspace(
-                        ymin,
-                        ymin + step * shapes[param][1],
-                        shapes[param][1],
-                        endpoint=False,
-                    )
-                    plotitem.rescale()
-
-                # Set X-scale
-                if param_write_count / shapes[param][1] > 1:
-                    bdata = data_cache[param][bot_axis.name]
-                    xmin, step = bdata[0, 0], bdata[1, 0] - bdata[0, 0]
-                    plotitem.setpoint_x = np.linspace(
-                        xmin,
-                        xmin + step * shapes[param][0],
-                        shapes[param][0],
-                        endpoint=False,
-                    )
-                    plotitem.no_xscale = False
-                    plotitem.rescale()
-            # Rescale x-axis when we have all values in case of F.P. error
-            if write_count[param] == shapes[param][0] * shapes[param][1]:
-                bdata = data_cache[param][bot_axis.name]
-                xmin, xmax = bdata[0, 0], bdata[-1, 0]
-                plotitem.setpoint_x = np.linspace(xmin, xmax, shapes[param][0])
-                plotitem.no_xscale = False
-                plotitem.rescale()
-
-            # Update the plot
-            plotitem.update(data)
-        else:
-            continue
+    if not updated:
+        return
+    current.scheduler.frame_sent()
 
     # Update table items if requested, expanding parameters that weren't measured
     # if necessary.
-    if this.current.table_items:
-        nItems = max(len(x) for x in this.current.table_items.values())
-        for item in this.current.table_items:
-            if len(this.current.table_items[item]) < nItems:
-                this.current.table_items[item].append("")
-        plot_window = this.current.plot_window
+    if current.table_items:
+        nItems = max(len(x) for x in current.table_items.values())
+        for item in current.table_items:
+            if len(current.table_items[item]) < nItems:
+                current.table_items[item].append("")
+        plot_window = current.plot_window
         if plot_window is not None and plot_window.table is not None:
             col_titles = plot_window.table.getHorizontalHeaders()
             if len(col_titles) < nItems:
-                col_titles.append(str(this.current.dataset.run_id))
-            plot_window.table.setData(this.current.table_items)
+                col_titles.append(str(current.dataset.run_id))
+            plot_window.table.setData(current.table_items)
             plot_window.table.setHorizontalHeaderLabels(col_titles)
         else:
             logger.error("Trying to fill in table that doesn't exist!")
@@ -320,168 +555,204 @@ def update_plots(new_data, data_len, state):
     return
 
 
-def subscriber(dataset, **kwargs):
+def subscriber(dataset, in_process=True, **kwargs):
     """
     Attach a plot window to the dataset and supply an update
     method that will update the live plots.
+
+    If in_process is True, the plots are updated when data is added to the dataset
+    cache, rather than through sqlite triggers on the database.
     """
+    if in_process:
+        # The callback returned from here is passed straight to dataset.subscribe
+        dataset.subscribe = functools.partial(_subscribe_in_process, dataset)
+
     # First, check if we actually want to do anything. If not, we return
-    # a blank function
-    if this.current is None or this.current.plot_window is None:
+    # a blank function. The live plot is set up by the do*d call running in this thread.
+    current = this.current
+    if current is None or current.plot_window is None:
         logger.info(f"Live plotting disabled for {dataset.run_id}.")
         return do_nothing
 
     # Update the plot title
-    window_run_ids = _explode_ids(f"({this.current.plot_window.win_title})")
+    window_run_ids = _explode_ids(f"({current.plot_window.win_title})")
     if not window_run_ids or window_run_ids is None:
         window_run_ids = (dataset.run_id,)
     else:
         window_run_ids = window_run_ids + (dataset.run_id,)
     run_id_str = ", ".join(_reduce_ids(window_run_ids))
-    this.current.plot_window.win_title = f"ID: {run_id_str}"
+    current.plot_window.win_title = f"ID: {run_id_str}"
 
     # Otherwise, register parameters into the window
-    this.current.dataset = dataset
-    win = this.current.plot_window
+    current.dataset = dataset
+    current.guid = dataset.guid
+    current.scheduler = _FrameScheduler(kwargs.get("max_fps", DEFAULT_MAX_FPS))
+    win = current.plot_window
     win.run_id = dataset.run_id
     run_desc = dataset.description
     params = run_desc.interdeps
     shapes = run_desc.shapes
-    if this.current.plot_params is None:
-        this.current.plot_param_names = set(params.names)
+    if current.plot_params is None:
+        current.plot_param_names = set(params.names)
     else:
-        this.current.plot_param_names = set(
-            p.full_name for p in this.current.plot_params
+        current.plot_param_names = set(
+            p.full_name for p in current.plot_params
         )
 
-    for param in itertools.chain(params.dependencies, params.standalones):
-        name = param.name
-        if name not in this.current.plot_param_names:
-            logger.info(
-                "Parameter %s not in list of plot parameters %r",
-                name,
-                this.current.plot_param_names,
-            )
-            continue
-
-        # Figure out the shape of the parameter
-        if shapes[name] == (1,):
-            logger.info("Adding 0D parameter %s", name)
-            if win.table is None:
-                table = TableWidget(sortable=False)
-                scene = win.scene()
-                assert scene is not None
-                t_widget = scene.addWidget(table)
-                t_widget.setMinimumSize(300, 0)
-                win.addItem(t_widget)
-                this.current.table_items = {}
-            elif this.current.table_items is None:
-                this.current.table_items = win.table.getData()
-            assert win.table is not None
-            if name not in this.current.table_items:
-                if this.current.table_items:
-                    nVals = len(next(iter(this.current.table_items.values())))
+    # Look up the existing table and plots first, since reading them from the plot
+    # process inside the batch would send it
+    items = win.items
+    table = next((item for item in items if isinstance(item, TableWidget)), None)
+    if table is not None and any(
+        shapes.get(name) == (1,) for name in current.plot_param_names
+    ):
+        current.table_items = table.getData()
+    # Plots that parameters can be stacked on or appended to, along with the names of
+    # the parameters on their axes. Plots created below are added as they are created.
+    plots: list[tuple[tuple[str, ...], PlotItem]] = []
+    if current.stack or current.append:
+        for item in items:
+            if isinstance(item, PlotItem):
+                axes = _parse_title(item.plot_title)[1] if current.append else ()
+                plots.append((axes, item))
+
+    # Queue up plot creation, so that the window is set up in as few round trips to
+    # the plot process as possible
+    with batch():
+        for param in itertools.chain(params.dependencies, params.standalones):
+            name = param.name
+            if name not in current.plot_param_names:
+                logger.info(
+                    "Parameter %s not in list of plot parameters %r",
+                    name,
+                    current.plot_param_names,
+                )
+                continue
+
+            # Figure out the shape of the parameter
+            if shapes[name] == (1,):
+                logger.info("Adding 0D parameter %s", name)
+                if table is None:
+                    table = TableWidget(sortable=False)
+                    scene = win.scene()
+                    assert scene is not None
+                    t_widget = scene.addWidget(table)
+                    t_widget.setMinimumSize(300, 0)
+                    win.addItem(t_widget)
+                    current.table_items = {}
+                assert current.table_items is not None
+                if name not in current.table_items:
+                    if current.table_items:
+                        nVals = len(next(iter(current.table_items.values())))
+                    else:
+                        nVals = 0
+                    current.table_items[name] = [""] * nVals
+                current.update_plans[name] = _table_plan(
+                    current.table_items, name
+                )
+                table.setHorizontalHeaderLabels(list(str(s) for s in window_run_ids))
+            elif len(shapes[name]) == 1:
+                logger.info("Adding 1D parameter %s with shape %r", name, shapes[name])
+                bot_axis = params.dependencies[param][0]
+
+                # If we need to stack or append, find the right plot
+                plotitem = None
+                if current.stack:
+                    if plots:
+                        plotitem = plots[0][1]
+                elif current.append:
+                    plotitem = _compatible_plot_item(plots, bot_axis, param)
+                    if plotitem is None:
+                        logger.warning(
+                            "Append requested but appropriate plotitem not found."
+                            " Making a new one."
+                        )
+
+                # Couldn't find an appropriate plotitem - make a new one
+                if plotitem is None:
+                    plotitem = win.addPlot(
+                        name=name,
+                        title=(
+                            f"{bot_axis.name} ({bot_axis.label}) v.<br>"
+                            f"{param.name} ({param.label}) "
+                            f"(id: {run_id_str})"
+                        ),
+                    )
+                    plotitem.bot_axis.paramspec = bot_axis
+                    plotitem.left_axis.paramspec = param
+                    plots.append(((bot_axis.name, param.name), plotitem))
                 else:
-                    nVals = 0
-                this.current.table_items[name] = [""] * nVals
-            win.table.setHorizontalHeaderLabels(list(str(s) for s in window_run_ids))
-        elif len(shapes[name]) == 1:
-            logger.info("Adding 1D parameter %s with shape %r", name, shapes[name])
-            bot_axis = params.dependencies[param][0]
-
-            # If we need to stack or append, find the right plot
-            plotitem = None
-            if this.current.stack:
-                try:
-                    plotitem = next(
-                        iter(i for i in win.items if isinstance(i, PlotItem))
+                    # Update ID string
+                    paramstr, _, _ = _parse_title(plotitem.plot_title)
+                    plotitem.plot_title = f"{paramstr} (id: {run_id_str})"
+                # Add new trace to the plot
+                plotdata = plotitem.plot(setpoint_x=[], pen=(255, 0, 0), name=param.name)
+                current.plot_items[param.name] = plotdata
+                current.update_plans[name] = _trace_plan(
+                    plotdata, name, bot_axis.name
+                )
+            elif len(shapes[name]) == 2:
+                logger.info("Adding 2D parameter %s with shape %r", name, shapes[name])
+                bot_axis = params.dependencies[param][0]
+                left_axis = params.dependencies[param][1]
+
+                plotitem = None
+                if current.stack:
+                    logger.warning(
+                        "Can't stack 2D param %r. Will create a new plot instead.", name
                     )
-                except StopIteration:
-                    pass
-            elif this.current.append:
-                plotitem = _compatible_plot_item(win, bot_axis, param)
+                if current.append:
+                    plotitem = _compatible_plot_item(plots, bot_axis, left_axis)
+                    if plotitem is None:
+                        logger.warning(
+                            "Append requested but appropriate plotitem not found."
+                            " Making a new one."
+                        )
+
+                # Couldn't find an appropriate plotitem - make a new one
                 if plotitem is None:
-                    logger.warning(
-                        "Append requested but appropriate plotitem not found."
-                        " Making a new one."
+                    plotitem = win.addPlot(
+                        name=name,
+                        title=(
+                            f"{bot_axis.name} ({bot_axis.label}) v.<br>"
+                            f"{left_axis.name} ({left_axis.label}) "
+                            f"(id: {run_id_str})"
+                        ),
                     )
-
-            # Couldn't find an appropriate plotitem - make a new one
-            if plotitem is None:
-                plotitem = win.addPlot(
+                    plotitem.bot_axis.paramspec = bot_axis
+                    plotitem.left_axis.paramspec = left_axis
+                    plots.append(((bot_axis.name, left_axis.name), plotitem))
+                else:
+                    # Update ID string
+                    paramstr, _, _ = _parse_title(plotitem.plot_title)
+                    plotitem.plot_title = f"{paramstr} (id: {run_id_str})"
+
+                # Add new trace to the plot
+                # Initially the axes are set to some random range, this will be filled
+                # in once the first column is taken.
+                plotdata = plotitem.plot(
+                    setpoint_x=np.linspace(0, 1, shapes[name][0]),
+                    setpoint_y=np.linspace(0, 1, shapes[name][1]),
                     name=name,
-                    title=(
-                        f"{bot_axis.name} ({bot_axis.label}) v.<br>"
-                        f"{param.name} ({param.label}) "
-                        f"(id: {run_id_str})"
-                    ),
                 )
-                plotitem.bot_axis.paramspec = bot_axis
-                plotitem.left_axis.paramspec = param
+                plotdata.setFillMode(current.fill_mode, current.fill_level)
+                current.plot_items[name] = plotdata
+                current.update_plans[name] = _image_plan(
+                    plotdata, name, bot_axis.name, left_axis.name, shapes[name]
+                )
             else:
-                # Update ID string
-                paramstr, _, _ = _parse_title(plotitem.plot_title)
-                plotitem.plot_title = f"{paramstr} (id: {run_id_str})"
-            # Add new trace to the plot
-            plotdata = plotitem.plot(setpoint_x=[], pen=(255, 0, 0), name=param.name)
-            this.current.plot_items[param.name] = plotdata
-        elif len(shapes[name]) == 2:
-            logger.info("Adding 2D parameter %s with shape %r", name, shapes[name])
-            bot_axis = params.dependencies[param][0]
-            left_axis = params.dependencies[param][1]
-
-            plotitem = None
-            if this.current.stack:
                 logger.warning(
-                    "Can't stack 2D param %r. Will create a new plot instead.", name
+                    "Trying to plot a dataset with more than 2 dimensions. "
+                    "Will not create plot for this item"
                 )
-            if this.current.append:
-                plotitem = _compatible_plot_item(win, bot_axis, left_axis)
-                if plotitem is None:
-                    logger.warning(
-                        "Append requested but appropriate plotitem not found."
-                        " Making a new one."
-                    )
-
-            # Couldn't find an appropriate plotitem - make a new one
-            if plotitem is None:
-                plotitem = win.addPlot(
-                    name=name,
-                    title=(
-                        f"{bot_axis.name} ({bot_axis.label}) v.<br>"
-                        f"{left_axis.name} ({left_axis.label}) "
-                        f"(id: {run_id_str})"
-                    ),
-                )
-                plotitem.bot_axis.paramspec = bot_axis
-                plotitem.left_axis.paramspec = left_axis
-            else:
-                # Update ID string
-                paramstr, _, _ = _parse_title(plotitem.plot_title)
-                plotitem.plot_title = f"{paramstr} (id: {run_id_str})"
-
-            # Add new trace to the plot
-            # Initially the axes are set to some random range, this will be filled
-            # in once the first column is taken.
-            plotdata = plotitem.plot(
-                setpoint_x=np.linspace(0, 1, shapes[name][0]),
-                setpoint_y=np.linspace(0, 1, shapes[name][1]),
-                name=name,
-            )
-            plotdata.no_xscale = True
-            plotdata.no_yscale = True
-            this.current.plot_items[name] = plotdata
-        else:
-            logger.warning(
-                "Trying to plot a dataset with more than 2 dimensions. "
-                "Will not create plot for this item"
-            )
 
-    # Add annotation to the plot if requested
-    if this.current.annotation is not None and win.items:
-        win.items[0].textbox(this.current.annotation)
+        # Add annotation to the plot if requested
+        if current.annotation is not None and win.items:
+            win.items[0].textbox(current.annotation)
 
-    return update_plots
+    with _live_plots_lock:
+        _live_plots[current.guid] = current
+    return functools.partial(update_plots, guid=current.guid)
 
 
 def _live_plot(wrapped):
@@ -506,6 +777,8 @@ def _live_plot(wrapped):
         annotation: Optional[str] = None,
         save: bool = True,
         stack: bool = False,
+        fill_mode: str = "mean",
+        fill_level: Optional[float] = None,
         **kwargs: Any,
     ):
         kwargs["do_plot"] = False
@@ -518,18 +791,32 @@ def _live_plot(wrapped):
         else:
             win = None
 
-        this.current = LivePlotWindow(
+        current = LivePlotWindow(
             plot_window=win,
             append=(append is not False),
             stack=stack,
             plot_params=plot_params,
             annotation=annotation,
+            fill_mode=fill_mode,
+            fill_level=fill_level,
         )
+        this.current = current
 
         ret_val = None
         try:
             ret_val = wrapped(*args, **kwargs)
         finally:
+            # Make sure the last frame is drawn, since updates may have been skipped
+            if win is not None and current.dataset is not None:
+                try:
+                    update_plots([], 0, {}, force=True, guid=current.guid)
+                    flush_remote()
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Failed to draw final live plot update.")
+                current.scheduler.cancel()
+                with _live_plots_lock:
+                    _live_plots.pop(current.guid, None)
+
             # Try and save the plot if save was requested. If the run failed, we still try
             # to pull a run ID out of the window in order to save.
             if win is not None and save:
@@ -578,6 +865,13 @@ def _live_plot(wrapped):
 
         save (Optional[bool]): Whether or not the figure should be saved.
 
+        fill_mode (Optional[str]): How points of 2D plots that haven't been measured
+        yet are drawn: "mean" fills them with the mean of the measured points, "level"
+        with fill_level, and "transparent" leaves them empty.
+
+        fill_level (Optional[float]): The level that unmeasured points are filled with
+        when fill_mode is "level".
+
     Original Docstring
     ------------------
     {wrapped.__doc__}
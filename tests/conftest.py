@@ -0,0 +1,4 @@
+import os
+
+# Plots are drawn without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
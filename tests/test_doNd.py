@@ -0,0 +1,63 @@
+"""
+Tests for live plotting of measurements
+"""
+
+import numpy as np
+import pytest
+from qcodes.dataset import (
+    initialise_or_create_database_at,
+    load_or_create_experiment,
+)
+from qcodes.parameters import ManualParameter, Parameter
+
+from qcodes_measurements.plot import PlotWindow
+from qcodes_measurements.tools import doNd
+
+
+@pytest.fixture(name="experiment")
+def fixture_experiment(tmp_path):
+    initialise_or_create_database_at(str(tmp_path / "experiments.db"))
+    return load_or_create_experiment("live_plot", sample_name="test")
+
+
+def test_do1d_live_plot(experiment):  # pylint: disable=unused-argument
+    x = ManualParameter("x", initial_value=0.0)
+    y = Parameter("y", get_cmd=lambda: 2 * x())
+    win = PlotWindow()
+
+    dataset, _, _ = doNd.do1d(x, 0, 1, 50, 0, y, save=False, append=win)
+
+    assert dataset.completed
+    trace = win.items[0].items[0]
+    np.testing.assert_allclose(trace.xData, np.linspace(0, 1, 50))
+    np.testing.assert_allclose(trace.yData, np.linspace(0, 2, 50))
+
+
+@pytest.mark.parametrize(
+    "kwargs, mode", [({}, "mean"), ({"fill_mode": "level", "fill_level": -1}, "level")]
+)
+def test_do2d_fill_mode(experiment, kwargs, mode):  # pylint: disable=unused-argument
+    x = ManualParameter("x", initial_value=0.0)
+    y = ManualParameter("y", initial_value=0.0)
+    z = Parameter("z", get_cmd=lambda: x() + y())
+    win = PlotWindow()
+
+    doNd.do2d(x, 0, 1, 5, 0, y, 0, 1, 4, 0, z, save=False, append=win, **kwargs)
+
+    image = win.items[0].items[0]
+    assert image._base_inst._fillMode == mode
+    np.testing.assert_allclose(
+        image.image, np.add.outer(np.linspace(0, 1, 5), np.linspace(0, 1, 4))
+    )
+
+
+def test_do1d_appends_to_compatible_plot(experiment):  # pylint: disable=unused-argument
+    x = ManualParameter("x", initial_value=0.0)
+    y = Parameter("y", get_cmd=lambda: 2 * x())
+    win = PlotWindow()
+
+    for _ in range(2):
+        doNd.do1d(x, 0, 1, 10, 0, y, save=False, append=win)
+
+    assert len(win.items) == 1
+    assert len(win.items[0].items) == 2
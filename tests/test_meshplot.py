@@ -0,0 +1,57 @@
+"""
+Tests for painting mesh plots
+"""
+
+import numpy as np
+import pytest
+from pyqtgraph import imageToArray
+from Qt import QtWidgets
+
+from qcodes_measurements.plot.remote.ColorMesh import ColorMesh
+from qcodes_measurements.plot.remote.PlotItem import ExtendedPlotItem
+from qcodes_measurements.plot.remote.PlotWindow import ExtendedPlotWindow
+from qcodes_measurements.plot.remote.VoronoiPlot import VoronoiPlot
+
+
+@pytest.fixture(name="plot")
+def fixture_plot():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    win = ExtendedPlotWindow()
+    win.resize(600, 400)
+    plot = ExtendedPlotItem()
+    win.addItem(plot)
+    win.show()
+    app.processEvents()
+    yield plot
+    win.close()
+
+
+def render(plot):
+    return imageToArray(plot.getViewWidget().grab().toImage(), copy=True)
+
+
+def changed_fraction(before, after):
+    return np.any(before != after, axis=-1).mean()
+
+
+def test_color_mesh_paints(plot):
+    rng = np.random.default_rng(0)
+    x, y = np.meshgrid(np.linspace(0, 1, 21), np.linspace(0, 1, 11), indexing="ij")
+    mesh = ColorMesh()
+    plot.addItem(mesh)
+    before = render(plot)
+
+    mesh.setNumpyData(rng.random((20, 10)), x, y)
+    after = render(plot)
+
+    assert changed_fraction(before, after) > 0.3
+
+
+def test_voronoi_plot_paints(plot):
+    rng = np.random.default_rng(0)
+    before = render(plot)
+
+    plot.addItem(VoronoiPlot(positions=rng.random((200, 2)), data=rng.random(200)))
+    after = render(plot)
+
+    assert changed_fraction(before, after) > 0.3
@@ -0,0 +1,89 @@
+"""
+Tests for the calls held back by RemoteEventHandler until the remote catches up
+"""
+
+import time
+
+import pytest
+
+from qcodes_measurements.plot.multiprocess import Process
+
+
+class Recorder:
+    """
+    Object created in the remote process, that records the calls made to it
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def setData(self, value):
+        time.sleep(0.02)
+        self.calls.append(("setData", value))
+
+    def extendData(self, value):
+        self.calls.append(("extendData", value))
+
+
+@pytest.fixture(name="proc")
+def fixture_proc():
+    proc = Process()
+    yield proc
+    proc.join()
+
+
+def remote_method(proc, recorder, name):
+    method = getattr(recorder, name)
+    method._setProxyOptions(callSync="off")
+    return method
+
+
+def wait_for_remote(proc, timeout=5):
+    deadline = time.monotonic() + timeout
+    while proc.hasPendingCalls():
+        assert time.monotonic() < deadline, "Held calls were never sent"
+        time.sleep(0.01)
+
+
+def test_outbox_coalesces_while_waiting_for_remote(proc):
+    proc.maxInFlight = 1
+    proc.maxHoldTime = 10
+    recorder = proc._import(__name__).Recorder()
+    setData = remote_method(proc, recorder, "setData")
+
+    for i in range(50):
+        setData(i)
+        # Live plots check whether the remote has caught up between frames, which
+        # must not force out the held calls
+        assert proc.hasPendingCalls()
+    wait_for_remote(proc)
+
+    values = [value for _, value in recorder.calls]
+    dropped = proc.stats.snapshot()["methods"]["setData"]["dropped"]
+    assert values[-1] == 49
+    assert values == sorted(values)
+    assert dropped > 0
+    assert len(values) + dropped == 50
+
+
+def test_held_appends_are_bounded(proc):
+    proc.maxInFlight = 1
+    proc.maxHoldTime = 10
+    proc.maxHeldAppends = 5
+    recorder = proc._import(__name__).Recorder()
+    setData = remote_method(proc, recorder, "setData")
+    extendData = remote_method(proc, recorder, "extendData")
+
+    # Keep the remote busy, so that the first group of calls stays in flight
+    proc._import("time").sleep(0.5, _callSync="off")
+    setData(0)
+    for i in range(4):
+        extendData(i)
+    assert "extendData" not in proc.stats.snapshot()["methods"]
+    extendData(4)
+    assert proc.stats.snapshot()["methods"]["extendData"]["calls"] == 5
+    wait_for_remote(proc)
+
+    assert recorder.calls == [("setData", 0)] + [
+        ("extendData", i) for i in range(5)
+    ]
@@ -0,0 +1,47 @@
+"""
+Tests for traces plotted in the plot process
+"""
+
+import numpy as np
+import pytest
+from Qt import QtWidgets
+
+from qcodes_measurements.plot import PlotWindow
+from qcodes_measurements.plot.remote import PlotDataItem as remote_plot_data_item
+
+
+def test_set_data_updates_setpoints():
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    win = PlotWindow()
+    trace = win.addPlot().plot(setpoint_x=np.arange(5))
+    x = np.linspace(0, 1, 10)
+
+    trace.setData(x, np.zeros(10))
+    np.testing.assert_array_equal(trace._setpoint_x, x)
+    np.testing.assert_array_equal(
+        trace._base_inst.__getattr__("setpoint_x", _returnType="value"), x
+    )
+
+    # Later updates are plotted against the new setpoints
+    trace.update(np.ones(10))
+    np.testing.assert_array_equal(trace.xData, x)
+    np.testing.assert_array_equal(trace.yData, np.ones(10))
+    win.close()
+
+
+@pytest.mark.parametrize(
+    "version, supported",
+    [("0.14.0", True), ("0.14.1.dev0", True), ("0.13.7", False), ("0.15.0", False)],
+)
+def test_decimation_versions(version, supported):
+    assert remote_plot_data_item._decimation_supported(version) is supported
+
+
+def test_unsupported_pyqtgraph_is_not_decimated(monkeypatch):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(remote_plot_data_item, "DECIMATION_SUPPORTED", False)
+    trace = remote_plot_data_item.ExtendedPlotDataItem()
+    trace.setDecimation(True)
+    trace.setData(np.arange(10000.0), np.zeros(10000))
+
+    assert trace._decimationPyramid() is None
@@ -0,0 +1,81 @@
+"""
+Tests for wrapping objects in the plot process
+"""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from Qt import QtWidgets
+
+from qcodes_measurements.plot import PlotDataItem
+from qcodes_measurements.plot.local import RemoteProcessWrapper
+from qcodes_measurements.plot.local.RemoteProcessWrapper import RPGWrappedBase
+
+
+@pytest.fixture(name="rpg")
+def fixture_rpg():
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    if getattr(RemoteProcessWrapper.this, "rpg", None) is None:
+        RemoteProcessWrapper.start_remote()
+    return RemoteProcessWrapper.get_remote()
+
+
+def test_metadata_is_keyed_by_remote_type(rpg):
+    # Wrapped as its base class, the remote item is still an ExtendedPlotDataItem
+    item = PlotDataItem.wrap(rpg.ExtendedPlotDataItem(_returnType="proxy"))
+    assert item._remote_type == "ExtendedPlotDataItem"
+
+    item.setData([0, 1], [1, 0])
+    assert RPGWrappedBase._remote_attr_callable[("ExtendedPlotDataItem", "setData")]
+
+
+def test_instance_attributes_are_not_cached(rpg):
+    items = [PlotDataItem.wrap(rpg.PlotDataItem(_returnType="proxy")) for _ in range(2)]
+    items[0]._base_inst.extra = rpg.mkPen
+    items[1]._base_inst.extra = rpg.ColorMap(
+        [0, 1], [(0, 0, 0), (255, 255, 255)], _returnType="proxy"
+    )
+
+    assert callable(items[0].extra)
+    assert ("PlotDataItem", "extra") not in RPGWrappedBase._remote_attr_callable
+    # The attribute of the second item isn't mistaken for a method
+    assert items[1].extra.getStops(_returnType="value")
+
+
+# Restarts the remote twice, checking that a standby process is only kept once the
+# remote has been restarted, and is swapped in on the next restart
+RESTART = textwrap.dedent(
+    """
+    from Qt import QtWidgets
+    from qcodes_measurements.plot import PlotWindow
+    from qcodes_measurements.plot.local import RemoteProcessWrapper
+
+    app = QtWidgets.QApplication([])
+    RemoteProcessWrapper.start_remote()
+    assert RemoteProcessWrapper.this.standby is None
+
+    RemoteProcessWrapper.restart_remote()
+    standby = RemoteProcessWrapper.this.standby[0]
+    RemoteProcessWrapper.restart_remote()
+    assert RemoteProcessWrapper.this.proc is standby
+    assert RemoteProcessWrapper.this.standby is not None
+    win = PlotWindow()
+    win.addPlot()
+    win.close()
+    """
+)
+
+
+def test_standby_is_started_on_restart():
+    # Run in a new process, as plot processes forked from this one after other tests
+    # have painted widgets in it may not be usable
+    result = subprocess.run(
+        [sys.executable, "-c", RESTART],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,87 @@
+"""
+Tests for the plot server shared between processes
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+import pytest
+from Qt import QtWidgets
+
+from qcodes_measurements.plot import server
+
+# Connects to the server, opens a window and disconnects
+CLIENT = textwrap.dedent(
+    """
+    from Qt import QtWidgets
+    from qcodes_measurements.plot import server
+
+    app = QtWidgets.QApplication([])
+    conn = server.connect(start=False)
+    rpg = conn._import("qcodes_measurements.plot.rpyplot")
+    rbuiltins = conn._import("builtins")
+    win = rpg.ExtendedPlotWindow()
+    windows = rpg.ExtendedPlotWindow.getWindows(_returnType="proxy")
+    print(rbuiltins.len(windows, _returnType="value"))
+    conn.join()
+    """
+)
+
+
+@pytest.fixture(name="conn")
+def fixture_conn(tmp_path, monkeypatch):
+    # Run the server out of a private directory
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    conn = server.connect()
+    with open(os.path.join(server.server_dir(), "server.json"), encoding="utf-8") as f:
+        pid = json.load(f)["pid"]
+    yield conn
+    conn.join()
+    os.kill(pid, signal.SIGTERM)
+
+
+def eval_remote(conn, rbuiltins, expr):
+    conn.processRequests()
+    return rbuiltins.eval(expr, _returnType="value")
+
+
+def test_client_disconnect_releases_proxies_and_windows(conn):
+    rbuiltins = conn._import("builtins")
+    window_class = (
+        "__import__('qcodes_measurements.plot.rpyplot', "
+        "fromlist=['rpyplot']).ExtendedPlotWindow"
+    )
+    proxied = (
+        "len(__import__('pyqtgraph.multiprocess.remoteproxy', "
+        "fromlist=['remoteproxy']).LocalObjectProxy.proxiedObjects)"
+    )
+    baseline = eval_remote(conn, rbuiltins, proxied)
+
+    client = subprocess.run(
+        [sys.executable, "-c", CLIENT],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+    )
+    assert client.returncode == 0, client.stderr
+    # The window is visible to the client that opened it...
+    assert client.stdout.split()[-1] == "1"
+    # ...but not to other clients
+    assert eval_remote(conn, rbuiltins, f"len({window_class}.getWindows())") == 0
+    assert eval_remote(conn, rbuiltins, f"len({window_class}._windows)") == 1
+
+    # Once the client disconnects, the objects proxied for it are released
+    deadline = time.monotonic() + 10
+    while eval_remote(conn, rbuiltins, proxied) != baseline:
+        assert time.monotonic() < deadline
+        time.sleep(0.1)
+    assert eval_remote(conn, rbuiltins, f"len({window_class}._windows)") == 1
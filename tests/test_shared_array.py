@@ -0,0 +1,93 @@
+"""
+Tests for sending data to the plot process through shared memory
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+from Qt import QtWidgets
+
+from qcodes_measurements.plot import PlotWindow
+from qcodes_measurements.plot.shared_array import SharedBuffers
+
+
+class FakeRequest:
+    """
+    Stands in for the request answered once the remote has read a block
+    """
+
+    def __init__(self):
+        self.done = False
+        self.waited = False
+
+    def hasResult(self):
+        return self.done
+
+    def result(self, timeout=None):  # pylint: disable=unused-argument
+        self.waited = True
+        self.done = True
+
+
+def exists(shared):
+    try:
+        shared_memory.SharedMemory(name=shared.name).close()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def test_busy_blocks_are_not_reused():
+    buffers = SharedBuffers(count=2)
+    first = buffers.acquire((100, 100), np.float64)
+    first_sent = FakeRequest()
+    buffers.sent(first, first_sent)
+
+    second = buffers.acquire((100, 100), np.float64)
+    assert second is not first
+    buffers.sent(second, FakeRequest())
+
+    # Once the remote has read the first block, it is written again
+    first_sent.done = True
+    assert buffers.acquire((100, 100), np.float64) is first
+
+
+def test_waits_for_the_remote_once_all_blocks_are_busy():
+    buffers = SharedBuffers(count=2)
+    requests = [FakeRequest(), FakeRequest()]
+    blocks = []
+    for request in requests:
+        blocks.append(buffers.acquire((100, 100), np.float64))
+        buffers.sent(blocks[-1], request)
+
+    assert buffers.acquire((100, 100), np.float64) is blocks[0]
+    assert requests[0].waited
+    assert not requests[1].waited
+
+
+def test_busy_blocks_outlive_shape_changes():
+    buffers = SharedBuffers(count=2)
+    old = buffers.acquire((100, 100), np.float64)
+    old_sent = FakeRequest()
+    buffers.sent(old, old_sent)
+
+    new = buffers.acquire((200, 100), np.float64)
+    buffers.sent(new, FakeRequest())
+    assert exists(old)
+
+    # Released once the remote has read it, and the block is no longer needed
+    old_sent.done = True
+    buffers.acquire((200, 100), np.float64)
+    assert not exists(old)
+
+
+def test_shared_image_updates():
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    win = PlotWindow()
+    plot = win.addPlot()
+    image = plot.plot(setpoint_x=np.arange(100), setpoint_y=np.arange(100))
+    rng = np.random.default_rng(0)
+    for rows in (100, 150, 100, 150, 150, 100):
+        data = rng.random((rows, 100))
+        image.update(data)
+    np.testing.assert_array_equal(image.image, data)
+    win.close()